@@ -5,7 +5,7 @@ from alembic import context
 
 # Import Base and all models
 from app.core.database import Base
-from app.models import user, expense, couple, budget  # noqa
+from app.models import user, expense, couple, budget, sync, report  # noqa
 
 config = context.config
 
@@ -0,0 +1,294 @@
+"""initial schema: the tables that predate user_categories
+
+Revision ID: 000_initial_schema
+Revises:
+Create Date: 2024-12-31 00:00:00.000000
+
+Databases created before migrations existed already have these tables;
+stamp them with ``alembic stamp 000_initial_schema`` before upgrading.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "000_initial_schema"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("password_hash", sa.String(length=255), nullable=False),
+        sa.Column("monthly_income", sa.Float(), nullable=True),
+        sa.Column("salary_date", sa.Integer(), nullable=True),
+        sa.Column("monthly_budget", sa.Float(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
+
+    op.create_table(
+        "budgets",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("monthly_limit", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_budgets_id"), "budgets", ["id"], unique=False)
+    op.create_index(op.f("ix_budgets_user_id"), "budgets", ["user_id"], unique=False)
+
+    op.create_table(
+        "couples",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_1_id", sa.Integer(), nullable=False),
+        sa.Column("user_2_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_1_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["user_2_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_couples_id"), "couples", ["id"], unique=False)
+
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("message", sa.String(length=500), nullable=False),
+        sa.Column("notification_type", sa.String(length=50), nullable=False),
+        sa.Column("is_read", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_notifications_id"), "notifications", ["id"], unique=False)
+    op.create_index(op.f("ix_notifications_user_id"), "notifications", ["user_id"], unique=False)
+
+    op.create_table(
+        "recurring_expenses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("frequency", sa.String(length=20), nullable=False),
+        sa.Column("day_of_month", sa.Integer(), nullable=True),
+        sa.Column("day_of_week", sa.Integer(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("next_date", sa.Date(), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=True),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_recurring_expenses_id"), "recurring_expenses", ["id"], unique=False)
+    op.create_index(op.f("ix_recurring_expenses_user_id"), "recurring_expenses", ["user_id"], unique=False)
+
+    op.create_table(
+        "salary_credits",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("credited_date", sa.Date(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "month", "year", name="uq_salary_user_month_year"),
+    )
+    op.create_index(op.f("ix_salary_credits_id"), "salary_credits", ["id"], unique=False)
+    op.create_index(op.f("ix_salary_credits_user_id"), "salary_credits", ["user_id"], unique=False)
+
+    op.create_table(
+        "expenses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("expense_type", sa.String(length=20), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("is_recurring", sa.Boolean(), nullable=True),
+        sa.Column("recurring_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["recurring_id"], ["recurring_expenses.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_expenses_id"), "expenses", ["id"], unique=False)
+    op.create_index(op.f("ix_expenses_user_id"), "expenses", ["user_id"], unique=False)
+
+    op.create_table(
+        "joint_accounts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("couple_id", sa.Integer(), nullable=False),
+        sa.Column("account_name", sa.String(length=100), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["couple_id"], ["couples.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_joint_accounts_couple_id"), "joint_accounts", ["couple_id"], unique=True)
+    op.create_index(op.f("ix_joint_accounts_id"), "joint_accounts", ["id"], unique=False)
+
+    op.create_table(
+        "savings_goals",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("couple_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("target_amount", sa.Float(), nullable=False),
+        sa.Column("current_amount", sa.Float(), nullable=True),
+        sa.Column("deadline", sa.Date(), nullable=True),
+        sa.Column("is_completed", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["couple_id"], ["couples.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_savings_goals_couple_id"), "savings_goals", ["couple_id"], unique=False)
+    op.create_index(op.f("ix_savings_goals_id"), "savings_goals", ["id"], unique=False)
+
+    op.create_table(
+        "settlements",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("couple_id", sa.Integer(), nullable=False),
+        sa.Column("paid_by_user_id", sa.Integer(), nullable=False),
+        sa.Column("paid_to_user_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("note", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["couple_id"], ["couples.id"]),
+        sa.ForeignKeyConstraint(["paid_by_user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["paid_to_user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_settlements_couple_id"), "settlements", ["couple_id"], unique=False)
+    op.create_index(op.f("ix_settlements_id"), "settlements", ["id"], unique=False)
+
+    op.create_table(
+        "shared_expenses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("couple_id", sa.Integer(), nullable=False),
+        sa.Column("paid_by_user_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("split_type", sa.String(length=20), nullable=False),
+        sa.Column("split_ratio", sa.String(length=20), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("paid_from_joint", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["couple_id"], ["couples.id"]),
+        sa.ForeignKeyConstraint(["paid_by_user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_shared_expenses_couple_id"), "shared_expenses", ["couple_id"], unique=False)
+    op.create_index(op.f("ix_shared_expenses_id"), "shared_expenses", ["id"], unique=False)
+
+    op.create_table(
+        "joint_account_contributions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("joint_account_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("contribution_type", sa.String(length=30), nullable=False),
+        sa.Column("note", sa.Text(), nullable=True),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["joint_account_id"], ["joint_accounts.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_joint_account_contributions_id"), "joint_account_contributions", ["id"], unique=False)
+    op.create_index(op.f("ix_joint_account_contributions_joint_account_id"), "joint_account_contributions", ["joint_account_id"], unique=False)
+
+    op.create_table(
+        "joint_account_transactions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("joint_account_id", sa.Integer(), nullable=False),
+        sa.Column("shared_expense_id", sa.Integer(), nullable=True),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["joint_account_id"], ["joint_accounts.id"]),
+        sa.ForeignKeyConstraint(["shared_expense_id"], ["shared_expenses.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_joint_account_transactions_id"), "joint_account_transactions", ["id"], unique=False)
+    op.create_index(op.f("ix_joint_account_transactions_joint_account_id"), "joint_account_transactions", ["joint_account_id"], unique=False)
+    op.create_index(op.f("ix_joint_account_transactions_shared_expense_id"), "joint_account_transactions", ["shared_expense_id"], unique=False)
+
+    op.create_table(
+        "savings_contributions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("goal_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["goal_id"], ["savings_goals.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_savings_contributions_goal_id"), "savings_contributions", ["goal_id"], unique=False)
+    op.create_index(op.f("ix_savings_contributions_id"), "savings_contributions", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_savings_contributions_id"), table_name="savings_contributions")
+    op.drop_index(op.f("ix_savings_contributions_goal_id"), table_name="savings_contributions")
+    op.drop_table("savings_contributions")
+    op.drop_index(op.f("ix_joint_account_transactions_shared_expense_id"), table_name="joint_account_transactions")
+    op.drop_index(op.f("ix_joint_account_transactions_joint_account_id"), table_name="joint_account_transactions")
+    op.drop_index(op.f("ix_joint_account_transactions_id"), table_name="joint_account_transactions")
+    op.drop_table("joint_account_transactions")
+    op.drop_index(op.f("ix_joint_account_contributions_joint_account_id"), table_name="joint_account_contributions")
+    op.drop_index(op.f("ix_joint_account_contributions_id"), table_name="joint_account_contributions")
+    op.drop_table("joint_account_contributions")
+    op.drop_index(op.f("ix_shared_expenses_id"), table_name="shared_expenses")
+    op.drop_index(op.f("ix_shared_expenses_couple_id"), table_name="shared_expenses")
+    op.drop_table("shared_expenses")
+    op.drop_index(op.f("ix_settlements_id"), table_name="settlements")
+    op.drop_index(op.f("ix_settlements_couple_id"), table_name="settlements")
+    op.drop_table("settlements")
+    op.drop_index(op.f("ix_savings_goals_id"), table_name="savings_goals")
+    op.drop_index(op.f("ix_savings_goals_couple_id"), table_name="savings_goals")
+    op.drop_table("savings_goals")
+    op.drop_index(op.f("ix_joint_accounts_id"), table_name="joint_accounts")
+    op.drop_index(op.f("ix_joint_accounts_couple_id"), table_name="joint_accounts")
+    op.drop_table("joint_accounts")
+    op.drop_index(op.f("ix_expenses_user_id"), table_name="expenses")
+    op.drop_index(op.f("ix_expenses_id"), table_name="expenses")
+    op.drop_table("expenses")
+    op.drop_index(op.f("ix_salary_credits_user_id"), table_name="salary_credits")
+    op.drop_index(op.f("ix_salary_credits_id"), table_name="salary_credits")
+    op.drop_table("salary_credits")
+    op.drop_index(op.f("ix_recurring_expenses_user_id"), table_name="recurring_expenses")
+    op.drop_index(op.f("ix_recurring_expenses_id"), table_name="recurring_expenses")
+    op.drop_table("recurring_expenses")
+    op.drop_index(op.f("ix_notifications_user_id"), table_name="notifications")
+    op.drop_index(op.f("ix_notifications_id"), table_name="notifications")
+    op.drop_table("notifications")
+    op.drop_index(op.f("ix_couples_id"), table_name="couples")
+    op.drop_table("couples")
+    op.drop_index(op.f("ix_budgets_user_id"), table_name="budgets")
+    op.drop_index(op.f("ix_budgets_id"), table_name="budgets")
+    op.drop_table("budgets")
+    op.drop_index(op.f("ix_users_id"), table_name="users")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_table("users")
@@ -1,7 +1,7 @@
 """add user_categories table
 
 Revision ID: 001_add_user_categories
-Revises:
+Revises: 000_initial_schema
 Create Date: 2025-01-01 00:00:00.000000
 """
 from typing import Sequence, Union
@@ -10,7 +10,7 @@ import sqlalchemy as sa
 
 # revision identifiers
 revision: str = "001_add_user_categories"
-down_revision: Union[str, None] = None
+down_revision: Union[str, None] = "000_initial_schema"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
@@ -0,0 +1,38 @@
+"""Add category_spend, the running monthly spend per user and category
+
+Revision ID: 003_category_spend
+Revises: 002_bool_columns
+Create Date: 2026-10-19 00:00:00.000000
+
+Budget thresholds are evaluated against these rows, which every spend
+change adjusts by its delta, instead of summing the month's expenses on
+each write. Rows are seeded lazily, so the table starts empty.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "003_category_spend"
+down_revision: Union[str, None] = "002_bool_columns"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_spend",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("category", sa.String(50), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False, server_default="0"),
+        sa.UniqueConstraint("user_id", "year", "month", "category", name="uq_category_spend_user_month_category"),
+    )
+    op.create_index("ix_category_spend_id", "category_spend", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_category_spend_id", table_name="category_spend")
+    op.drop_table("category_spend")
@@ -0,0 +1,70 @@
+"""Add change counters, updated_at columns and sync tombstones for delta sync
+
+Revision ID: 004_delta_sync
+Revises: 003_category_spend
+Create Date: 2026-10-19 00:00:00.000000
+
+users.sync_seq and couples.sync_seq are bumped in the transaction of every
+write to a synced row, which is stamped with the new value in change_seq
+(tombstones too). Delta sync filters on (owner, change_seq). Existing rows
+start at 0, so the first sync after the upgrade is a full one.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "004_delta_sync"
+down_revision: Union[str, None] = "003_category_spend"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, owner column used by the sync query, index name)
+SYNCED_TABLES = [
+    ("expenses", "user_id", "ix_expenses_user_change"),
+    ("recurring_expenses", "user_id", "ix_recurring_expenses_user_change"),
+    ("user_categories", "user_id", "ix_user_categories_user_change"),
+    ("budgets", "user_id", "ix_budgets_user_change"),
+    ("shared_expenses", "couple_id", "ix_shared_expenses_couple_change"),
+    ("settlements", "couple_id", "ix_settlements_couple_change"),
+]
+
+
+def _counter(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+
+
+def upgrade() -> None:
+    op.add_column("users", _counter("sync_seq"))
+    op.add_column("couples", _counter("sync_seq"))
+    for table, owner, index in SYNCED_TABLES:
+        if table != "budgets":  # budgets already has updated_at
+            op.add_column(table, sa.Column("updated_at", sa.DateTime(), nullable=True))
+            op.execute(f"UPDATE {table} SET updated_at = COALESCE(created_at, now())")
+        op.add_column(table, _counter("change_seq"))
+        op.create_index(index, table, [owner, "change_seq"])
+
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("entity", sa.String(30), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("couple_id", sa.Integer(), nullable=True),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        _counter("change_seq"),
+    )
+    op.create_index("ix_sync_tombstones_id", "sync_tombstones", ["id"])
+    op.create_index("ix_sync_tombstones_user_change", "sync_tombstones", ["user_id", "change_seq"])
+    op.create_index("ix_sync_tombstones_couple_change", "sync_tombstones", ["couple_id", "change_seq"])
+
+
+def downgrade() -> None:
+    op.drop_table("sync_tombstones")
+    for table, _, index in SYNCED_TABLES:
+        op.drop_index(index, table_name=table)
+        op.drop_column(table, "change_seq")
+        if table != "budgets":
+            op.drop_column(table, "updated_at")
+    op.drop_column("couples", "sync_seq")
+    op.drop_column("users", "sync_seq")
@@ -0,0 +1,26 @@
+"""Add users.data_version for ETag validation
+
+Revision ID: 005_user_data_version
+Revises: 004_delta_sync
+Create Date: 2026-10-19 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "005_user_data_version"
+down_revision: Union[str, None] = "004_delta_sync"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("data_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "data_version")
@@ -0,0 +1,86 @@
+"""Store parsed split shares on shared_expenses
+
+Revision ID: 006_shared_expense_shares
+Revises: 005_user_data_version
+Create Date: 2026-10-19 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "006_shared_expense_shares"
+down_revision: Union[str, None] = "005_user_data_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NUMBER = r"^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$"
+
+# Mirrors app.services.splits.calculate_split: malformed ratios, unknown
+# split types and percentages that do not sum to 100 fall back to halves.
+BACKFILL = f"""
+UPDATE shared_expenses AS se
+SET user_1_share = CASE parsed.mode
+        WHEN 'percentage' THEN parsed.amount * parsed.p1 / 100
+        WHEN 'custom' THEN parsed.p1
+        ELSE parsed.amount / 2
+    END,
+    user_2_share = CASE parsed.mode
+        WHEN 'percentage' THEN parsed.amount * parsed.p2 / 100
+        WHEN 'custom' THEN parsed.p2
+        ELSE parsed.amount / 2
+    END
+FROM (
+    SELECT id, amount, p1, p2,
+        CASE
+            WHEN p1 IS NULL OR p2 IS NULL THEN 'half'
+            WHEN split_type = 'percentage' AND abs(p1 + p2 - 100) <= 0.01 THEN 'percentage'
+            WHEN split_type = 'custom' THEN 'custom'
+            ELSE 'half'
+        END AS mode
+    FROM (
+        SELECT id, amount, split_type,
+            CASE WHEN valid THEN split_part(split_ratio, ':', 1)::float8 END AS p1,
+            CASE WHEN valid THEN split_part(split_ratio, ':', 2)::float8 END AS p2
+        FROM (
+            SELECT id, amount, split_type, split_ratio,
+                split_ratio ~ '^[^:]*:[^:]*$'
+                    AND split_part(split_ratio, ':', 1) ~ '{NUMBER}'
+                    AND split_part(split_ratio, ':', 2) ~ '{NUMBER}' AS valid
+            FROM shared_expenses
+        ) AS checked
+    ) AS numbers
+) AS parsed
+WHERE se.id = parsed.id
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "shared_expenses",
+        sa.Column("user_1_share", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "shared_expenses",
+        sa.Column("user_2_share", sa.Float(), nullable=False, server_default="0"),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(BACKFILL)
+        return
+
+    from app.services.splits import calculate_split
+
+    rows = bind.execute(sa.text("SELECT id, amount, split_type, split_ratio FROM shared_expenses")).all()
+    for row_id, amount, split_type, split_ratio in rows:
+        u1, u2 = calculate_split(amount, split_type, split_ratio)
+        bind.execute(
+            sa.text("UPDATE shared_expenses SET user_1_share = :u1, user_2_share = :u2 WHERE id = :id"),
+            {"u1": u1, "u2": u2, "id": row_id},
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("shared_expenses", "user_2_share")
+    op.drop_column("shared_expenses", "user_1_share")
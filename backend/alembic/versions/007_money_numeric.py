@@ -0,0 +1,67 @@
+"""Store money as NUMERIC(14, 2) instead of double precision
+
+Revision ID: 007_money_numeric
+Revises: 006_shared_expense_shares
+Create Date: 2026-10-19 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "007_money_numeric"
+down_revision: Union[str, None] = "006_shared_expense_shares"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, nullable)
+MONEY_COLUMNS = (
+    ("users", "monthly_income", True),
+    ("users", "monthly_budget", True),
+    ("expenses", "amount", False),
+    ("recurring_expenses", "amount", False),
+    ("budgets", "monthly_limit", False),
+    ("salary_credits", "amount", False),
+    ("shared_expenses", "amount", False),
+    ("shared_expenses", "user_1_share", False),
+    ("shared_expenses", "user_2_share", False),
+    ("settlements", "amount", False),
+    ("savings_goals", "target_amount", False),
+    ("savings_goals", "current_amount", True),
+    ("savings_contributions", "amount", False),
+    ("joint_account_contributions", "amount", False),
+    ("joint_account_transactions", "amount", False),
+    ("category_spend", "amount", False),
+)
+
+
+def upgrade() -> None:
+    for table, column, nullable in MONEY_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Float(),
+            type_=sa.Numeric(14, 2),
+            existing_nullable=nullable,
+            postgresql_using=f"round({column}::numeric, 2)",
+        )
+
+    # Rounding both shares separately can leave a proportional split a paisa
+    # off its amount; give the remainder to the second partner, as
+    # app.services.splits.split_shares does for new rows.
+    op.execute(
+        "UPDATE shared_expenses SET user_2_share = amount - user_1_share "
+        "WHERE split_type <> 'custom' AND user_1_share + user_2_share <> amount"
+    )
+
+
+def downgrade() -> None:
+    for table, column, nullable in reversed(MONEY_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Numeric(14, 2),
+            type_=sa.Float(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::double precision",
+        )
@@ -0,0 +1,52 @@
+"""Add month-close report snapshots
+
+Revision ID: 008_monthly_snapshots
+Revises: 007_money_numeric
+Create Date: 2026-10-19 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "008_monthly_snapshots"
+down_revision: Union[str, None] = "007_money_numeric"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "monthly_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("personal_total", sa.Numeric(14, 2), nullable=False),
+        sa.Column("shared_total", sa.Numeric(14, 2), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("user_id", "year", "month", name="uq_monthly_snapshot_user_month"),
+    )
+    op.create_index("ix_monthly_snapshots_id", "monthly_snapshots", ["id"])
+
+    op.create_table(
+        "monthly_snapshot_categories",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("category", sa.String(50), nullable=False),
+        sa.Column("personal", sa.Numeric(14, 2), nullable=False),
+        sa.Column("shared", sa.Numeric(14, 2), nullable=False),
+    )
+    op.create_index("ix_monthly_snapshot_categories_id", "monthly_snapshot_categories", ["id"])
+    op.create_index(
+        "ix_monthly_snapshot_categories_user_month",
+        "monthly_snapshot_categories",
+        ["user_id", "year", "month"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_snapshot_categories")
+    op.drop_table("monthly_snapshots")
@@ -0,0 +1,25 @@
+"""Index expenses and shared expenses by owner and date
+
+Revision ID: 009_expense_date_indexes
+Revises: 008_monthly_snapshots
+Create Date: 2026-10-19 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers
+revision: str = "009_expense_date_indexes"
+down_revision: Union[str, None] = "008_monthly_snapshots"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Report history sums only the months without a snapshot, as date ranges
+    op.create_index("ix_expenses_user_date", "expenses", ["user_id", "date"])
+    op.create_index("ix_shared_expenses_couple_date", "shared_expenses", ["couple_id", "date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shared_expenses_couple_date", table_name="shared_expenses")
+    op.drop_index("ix_expenses_user_date", table_name="expenses")
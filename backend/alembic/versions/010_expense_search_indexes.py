@@ -0,0 +1,37 @@
+"""Full-text search indexes on expense and shared expense descriptions
+
+Revision ID: 010_expense_search_indexes
+Revises: 009_expense_date_indexes
+Create Date: 2026-10-19 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers
+revision: str = "010_expense_search_indexes"
+down_revision: Union[str, None] = "009_expense_date_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.services.search.search_document exactly
+DOCUMENT = "to_tsvector('simple', coalesce(description, '') || ' ' || category)"
+
+SEARCH_INDEXES = [
+    ("expenses", "ix_expenses_search"),
+    ("shared_expenses", "ix_shared_expenses_search"),
+]
+
+
+def upgrade() -> None:
+    # Other databases search with ILIKE and need no index
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, index in SEARCH_INDEXES:
+        op.execute(f"CREATE INDEX {index} ON {table} USING gin ({DOCUMENT})")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, index in SEARCH_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
@@ -0,0 +1,33 @@
+"""Unique index on user categories by owner and lower-cased name
+
+Revision ID: 011_user_category_lower_name
+Revises: 010_expense_search_indexes
+Create Date: 2026-10-19 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "011_user_category_lower_name"
+down_revision: Union[str, None] = "010_expense_search_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The old ILIKE check was racy; keep the oldest of any case-insensitive duplicates
+    op.execute(
+        "DELETE FROM user_categories WHERE id NOT IN ("
+        "SELECT MIN(id) FROM user_categories GROUP BY user_id, lower(name))"
+    )
+    op.create_index(
+        "uq_user_categories_user_lower_name",
+        "user_categories",
+        ["user_id", sa.text("lower(name)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_user_categories_user_lower_name", table_name="user_categories")
@@ -0,0 +1,78 @@
+"""Cascade deletes along foreign keys and track background account deletions
+
+Revision ID: 012_cascading_account_deletion
+Revises: 011_user_category_lower_name
+Create Date: 2026-10-19 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "012_cascading_account_deletion"
+down_revision: Union[str, None] = "011_user_category_lower_name"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table, ON DELETE action)
+FOREIGN_KEYS = [
+    ("user_categories", "user_id", "users", "CASCADE"),
+    ("expenses", "user_id", "users", "CASCADE"),
+    ("expenses", "recurring_id", "recurring_expenses", "SET NULL"),
+    ("recurring_expenses", "user_id", "users", "CASCADE"),
+    ("budgets", "user_id", "users", "CASCADE"),
+    ("category_spend", "user_id", "users", "CASCADE"),
+    ("notifications", "user_id", "users", "CASCADE"),
+    ("salary_credits", "user_id", "users", "CASCADE"),
+    ("monthly_snapshots", "user_id", "users", "CASCADE"),
+    ("monthly_snapshot_categories", "user_id", "users", "CASCADE"),
+    ("couples", "user_1_id", "users", "CASCADE"),
+    ("couples", "user_2_id", "users", "CASCADE"),
+    ("shared_expenses", "couple_id", "couples", "CASCADE"),
+    ("shared_expenses", "paid_by_user_id", "users", "CASCADE"),
+    ("settlements", "couple_id", "couples", "CASCADE"),
+    ("settlements", "paid_by_user_id", "users", "CASCADE"),
+    ("settlements", "paid_to_user_id", "users", "CASCADE"),
+    ("savings_goals", "couple_id", "couples", "CASCADE"),
+    ("savings_contributions", "goal_id", "savings_goals", "CASCADE"),
+    ("savings_contributions", "user_id", "users", "CASCADE"),
+    ("joint_accounts", "couple_id", "couples", "CASCADE"),
+    ("joint_account_contributions", "joint_account_id", "joint_accounts", "CASCADE"),
+    ("joint_account_contributions", "user_id", "users", "CASCADE"),
+    ("joint_account_transactions", "joint_account_id", "joint_accounts", "CASCADE"),
+    ("joint_account_transactions", "shared_expense_id", "shared_expenses", "CASCADE"),
+]
+
+
+def _recreate_foreign_keys(with_actions: bool) -> None:
+    # SQLite cannot alter constraints in place and does not enforce foreign
+    # keys by default; the deletion job removes rows explicitly there.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, referenced, action in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"  # PostgreSQL's default constraint name
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(
+            name, table, referenced, [column], ["id"], ondelete=action if with_actions else None
+        )
+
+
+def upgrade() -> None:
+    _recreate_foreign_keys(with_actions=True)
+    op.create_table(
+        "account_deletions",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("rows_deleted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_account_deletions_user_id", "account_deletions", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_account_deletions_user_id", table_name="account_deletions")
+    op.drop_table("account_deletions")
+    _recreate_foreign_keys(with_actions=False)
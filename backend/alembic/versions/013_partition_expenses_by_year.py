@@ -0,0 +1,111 @@
+"""Partition expenses and shared_expenses by year on date
+
+Revision ID: 013_partition_expenses_by_year
+Revises: 012_cascading_account_deletion
+Create Date: 2026-10-19 00:00:00.000000
+
+PostgreSQL only. Each table is rebuilt as a declaratively range-partitioned
+table with one partition per year from its oldest row to next year, plus a
+DEFAULT partition, and BRIN indexes on date and created_at. Rows are copied
+inside the migration, so run it during a maintenance window.
+
+Partitioned tables need the partition key in their primary key, so the
+primary keys become (id, date); ids still come from the original
+sequences. PostgreSQL cannot reference shared_expenses by id alone any
+more, so the joint_account_transactions.shared_expense_id foreign key is
+dropped; the API and the account deletion job remove linked transactions
+explicitly.
+"""
+from datetime import date
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "013_partition_expenses_by_year"
+down_revision: Union[str, None] = "012_cascading_account_deletion"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.services.search.search_document exactly (migration 010)
+DOCUMENT = "to_tsvector('simple', coalesce(description, '') || ' ' || category)"
+
+# table -> (foreign keys as (column, referenced table, ON DELETE), indexes as (name, definition))
+TABLES = {
+    "expenses": (
+        [("user_id", "users", "CASCADE"), ("recurring_id", "recurring_expenses", "SET NULL")],
+        [
+            ("ix_expenses_id", "(id)"),
+            ("ix_expenses_user_id", "(user_id)"),
+            ("ix_expenses_user_change", "(user_id, change_seq)"),
+            ("ix_expenses_user_date", "(user_id, date)"),
+            ("ix_expenses_search", f"USING gin ({DOCUMENT})"),
+        ],
+    ),
+    "shared_expenses": (
+        [("couple_id", "couples", "CASCADE"), ("paid_by_user_id", "users", "CASCADE")],
+        [
+            ("ix_shared_expenses_id", "(id)"),
+            ("ix_shared_expenses_couple_id", "(couple_id)"),
+            ("ix_shared_expenses_couple_change", "(couple_id, change_seq)"),
+            ("ix_shared_expenses_couple_date", "(couple_id, date)"),
+            ("ix_shared_expenses_search", f"USING gin ({DOCUMENT})"),
+        ],
+    ),
+}
+
+# Block-range indexes: tiny, and rows arrive roughly in date order
+BRIN_INDEXES = [("date_brin", "date"), ("created_brin", "created_at")]
+
+JOINT_FK = ("joint_account_transactions_shared_expense_id_fkey", "joint_account_transactions", "shared_expense_id")
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    bind = op.get_bind()
+    foreign_keys, indexes = TABLES[table]
+    old = f"{table}_old"
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    sequence = bind.execute(sa.text(f"SELECT pg_get_serial_sequence('{old}', 'id')")).scalar()
+    if partitioned:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) PARTITION BY RANGE (date)")
+        first = bind.execute(sa.text(f"SELECT EXTRACT(YEAR FROM MIN(date)) FROM {old}")).scalar()
+        this_year = date.today().year
+        for year in range(int(first or this_year), this_year + 2):
+            op.execute(
+                f"CREATE TABLE {table}_y{year} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    else:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    if sequence:
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {old} CASCADE")
+
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY {'(id, date)' if partitioned else '(id)'}")
+    for column, referenced, action in foreign_keys:
+        op.create_foreign_key(f"{table}_{column}_fkey", table, referenced, [column], ["id"], ondelete=action)
+    for name, definition in indexes:
+        op.execute(f"CREATE INDEX {name} ON {table} {definition}")
+    if partitioned:
+        for suffix, column in BRIN_INDEXES:
+            op.execute(f"CREATE INDEX ix_{table}_{suffix} ON {table} USING brin ({column})")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        _rebuild(table, partitioned=False)
+    name, table, column = JOINT_FK
+    op.create_foreign_key(name, table, "shared_expenses", [column], ["id"], ondelete="CASCADE")
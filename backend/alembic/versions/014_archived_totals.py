@@ -0,0 +1,42 @@
+"""Add archived_totals for rows moved to cold storage
+
+Revision ID: 014_archived_totals
+Revises: 013_partition_expenses_by_year
+Create Date: 2026-10-19 00:00:00.000000
+
+The archive job (``python -m app.jobs.archive_history``) adds the sums of
+the shared expenses and joint account transactions it moves out of the
+database here, so all-time balances still count them.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "014_archived_totals"
+down_revision: Union[str, None] = "013_partition_expenses_by_year"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archived_totals",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("source", sa.String(30), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("paid_by_user_id", sa.Integer(), nullable=True),
+        sa.Column("paid_from_joint", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("amount", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("user_1_share", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("user_2_share", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("row_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_archived_totals_id", "archived_totals", ["id"])
+    op.create_index("ix_archived_totals_source_owner", "archived_totals", ["source", "owner_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_archived_totals_source_owner", table_name="archived_totals")
+    op.drop_index("ix_archived_totals_id", table_name="archived_totals")
+    op.drop_table("archived_totals")
@@ -0,0 +1,27 @@
+"""Add users.data_changed_at for read-replica stickiness
+
+Revision ID: 015_user_data_changed_at
+Revises: 014_archived_totals
+Create Date: 2026-10-19 00:00:00.000000
+
+Set whenever users.data_version is bumped. Read-only endpoints stay on the
+primary database for REPLICA_STICKY_SECONDS after it, so users read their
+own writes while the replica catches up.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "015_user_data_changed_at"
+down_revision: Union[str, None] = "014_archived_totals"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("data_changed_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("users", "data_changed_at")
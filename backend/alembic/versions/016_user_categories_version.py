@@ -0,0 +1,26 @@
+"""Add users.categories_version for the category catalogue cache
+
+Revision ID: 016_user_categories_version
+Revises: 015_user_data_changed_at
+Create Date: 2026-10-19 00:00:00.000000
+
+Bumped only by writes to the user's custom categories, so the per-process
+catalogue cache survives writes to expenses and budgets.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = "016_user_categories_version"
+down_revision: Union[str, None] = "015_user_data_changed_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("categories_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    op.drop_column("users", "categories_version")
@@ -1,6 +1,7 @@
-from datetime import timedelta
+import uuid
+from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
@@ -8,12 +9,13 @@ from app.core.database import get_db
 from app.core.security import verify_password, get_password_hash, create_access_token
 from app.core.deps import get_current_user
 from app.core.config import get_settings
-from app.models.user import User
-from app.models.expense import Expense, RecurringExpense
-from app.models.budget import Budget, Notification
-from app.models.couple import Couple, SharedExpense, Settlement, SavingsGoal, SavingsContribution, JointAccount, JointAccountContribution, JointAccountTransaction
-from app.models.salary import SalaryCredit
-from app.schemas.user import UserCreate, UserLogin, UserUpdate, UserResponse, Token
+from app.models.user import AccountDeletion, User
+from app.models.couple import Couple
+from app.services.account_deletion import run_deletion
+from app.services.budget_alerts import invalidate_budget_limits, reset_month_spend
+from app.services.categories import invalidate_catalogue
+from app.services.snapshots import invalidate_snapshots
+from app.schemas.user import UserCreate, UserLogin, UserUpdate, UserResponse, Token, AccountDeletionResponse
 
 settings = get_settings()
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -48,7 +50,7 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """Authenticate and get JWT token."""
     user = db.query(User).filter(User.email == credentials.email).first()
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user or not user.is_active or not verify_password(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -89,61 +91,50 @@ def update_me(
     return current_user
 
 
-@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/me", response_model=AccountDeletionResponse, status_code=status.HTTP_202_ACCEPTED)
 def delete_account(
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Permanently delete user account and all associated data (GDPR)."""
-    user_id = current_user.id
-
-    # Delete notifications
-    db.query(Notification).filter(Notification.user_id == user_id).delete()
-
-    # Delete budgets
-    db.query(Budget).filter(Budget.user_id == user_id).delete()
+    """Permanently delete user account and all associated data (GDPR).
 
-    # Delete salary credits
-    db.query(SalaryCredit).filter(SalaryCredit.user_id == user_id).delete()
-
-    # Delete expenses & recurring expenses
-    db.query(Expense).filter(Expense.user_id == user_id).delete()
-    db.query(RecurringExpense).filter(RecurringExpense.user_id == user_id).delete()
+    The account is deactivated and its couples dissolved straight away; the
+    data itself is deleted in the background (app.services.account_deletion).
+    Poll ``GET /api/auth/deletions/{id}`` for the outcome.
+    """
+    user_id = current_user.id
+    current_user.is_active = False
 
-    # Delete couple-related data
     couples = db.query(Couple).filter(
-        or_(Couple.user_1_id == user_id, Couple.user_2_id == user_id)
+        Couple.status.in_(["pending", "active"]),
+        or_(Couple.user_1_id == user_id, Couple.user_2_id == user_id),
     ).all()
-
     for couple in couples:
-        # Delete joint account data
-        joint = db.query(JointAccount).filter(JointAccount.couple_id == couple.id).first()
-        if joint:
-            db.query(JointAccountTransaction).filter(JointAccountTransaction.joint_account_id == joint.id).delete()
-            db.query(JointAccountContribution).filter(JointAccountContribution.joint_account_id == joint.id).delete()
-            db.delete(joint)
-
-        # Delete savings contributions for this couple's goals
-        goals = db.query(SavingsGoal).filter(SavingsGoal.couple_id == couple.id).all()
-        for goal in goals:
-            db.query(SavingsContribution).filter(SavingsContribution.goal_id == goal.id).delete()
-        db.query(SavingsGoal).filter(SavingsGoal.couple_id == couple.id).delete()
-
-        # Delete settlements
-        db.query(Settlement).filter(Settlement.couple_id == couple.id).delete()
-
-        # Delete shared expenses (and related joint transactions first)
-        shared_expenses = db.query(SharedExpense).filter(SharedExpense.couple_id == couple.id).all()
-        for se in shared_expenses:
-            db.query(JointAccountTransaction).filter(JointAccountTransaction.shared_expense_id == se.id).delete()
-        db.query(SharedExpense).filter(SharedExpense.couple_id == couple.id).delete()
-
-        # Flush to satisfy FK constraints before deleting the couple record
-        db.flush()
-
-        # Delete the couple record
-        db.delete(couple)
-
-    # Delete the user
-    db.delete(current_user)
+        # The partner's snapshots and this month's rollup included their share of the shared expenses
+        if couple.status == "active":
+            partner_id = couple.user_2_id if couple.user_1_id == user_id else couple.user_1_id
+            invalidate_snapshots(db, partner_id)
+            reset_month_spend(db, partner_id, date.today())
+        couple.status = "dissolved"
+
+    job = AccountDeletion(id=str(uuid.uuid4()), user_id=user_id)
+    db.add(job)
     db.commit()
+    db.refresh(job)
+    invalidate_budget_limits(user_id)
+    invalidate_catalogue(user_id)
+    background_tasks.add_task(run_deletion, job.id)
+    return job
+
+
+@router.get("/deletions/{job_id}", response_model=AccountDeletionResponse)
+def get_account_deletion(job_id: str, db: Session = Depends(get_db)):
+    """Status of an account deletion; the random job id is the only credential left.
+
+    Unauthenticated, so the response carries no user id or error message.
+    """
+    job = db.get(AccountDeletion, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Deletion job not found")
+    return job
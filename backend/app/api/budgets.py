@@ -1,15 +1,18 @@
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, extract
+from sqlalchemy import and_, func
 from datetime import date, datetime, timezone
 
-from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.deps import get_current_read_user, get_current_user
+from app.core.etag import conditional_get
 from app.models.user import User
 from app.models.expense import Expense
 from app.models.budget import Budget
+from app.services.budget_alerts import invalidate_budget_limits, record_limit_change
+from app.services.partitions import month_bounds
 from app.schemas.dashboard import BudgetCreate, BudgetUpdate, BudgetResponse
 
 router = APIRouter(prefix="/budgets", tags=["Budgets"])
@@ -35,10 +38,13 @@ def create_budget(
         .first()
     )
     if existing:
+        old_limit = existing.monthly_limit
         existing.monthly_limit = budget_data.monthly_limit
+        db.flush()
+        record_limit_change(db, current_user.id, existing.category, old_limit, existing.monthly_limit)
         db.commit()
         db.refresh(existing)
-        return _enrich_budget(existing, current_user.id, db)
+        return _enrich_budget(existing, None, db)
 
     budget = Budget(
         user_id=current_user.id,
@@ -46,19 +52,22 @@ def create_budget(
         monthly_limit=budget_data.monthly_limit,
     )
     db.add(budget)
+    db.flush()
+    record_limit_change(db, current_user.id, budget.category, None, budget.monthly_limit)
     db.commit()
     db.refresh(budget)
-    return _enrich_budget(budget, current_user.id, db)
+    return _enrich_budget(budget, None, db)
 
 
-@router.get("/", response_model=List[BudgetResponse])
+@router.get("/", response_model=List[BudgetResponse], dependencies=[Depends(conditional_get)])
 def list_budgets(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List all budgets with current spend info."""
     budgets = db.query(Budget).filter(Budget.user_id == current_user.id).all()
-    return [_enrich_budget(b, current_user.id, db) for b in budgets]
+    spend = _month_spend_by_category(current_user.id, [b.category for b in budgets], db)
+    return [_enrich_budget(b, spend.get(b.category, 0), db) for b in budgets]
 
 
 @router.put("/{budget_id}", response_model=BudgetResponse)
@@ -80,11 +89,14 @@ def update_budget(
     if budget_data.monthly_limit is not None:
         if budget_data.monthly_limit <= 0:
             raise HTTPException(status_code=400, detail="Monthly limit must be positive")
+        old_limit = budget.monthly_limit
         budget.monthly_limit = budget_data.monthly_limit
+        db.flush()
+        record_limit_change(db, current_user.id, budget.category, old_limit, budget.monthly_limit)
 
     db.commit()
     db.refresh(budget)
-    return _enrich_budget(budget, current_user.id, db)
+    return _enrich_budget(budget, None, db)
 
 
 @router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -103,22 +115,34 @@ def delete_budget(
         raise HTTPException(status_code=404, detail="Budget not found")
     db.delete(budget)
     db.commit()
+    invalidate_budget_limits(current_user.id)
 
 
-def _enrich_budget(budget: Budget, user_id: int, db: Session) -> BudgetResponse:
-    today = date.today()
-    current_spend = (
-        db.query(func.coalesce(func.sum(Expense.amount), 0))
+def _month_spend_by_category(user_id: int, categories: List[str], db: Session) -> dict[str, float]:
+    """Current-month personal spend for the given categories, in one query."""
+    if not categories:
+        return {}
+    month_start, next_month = month_bounds(date.today())
+    rows = (
+        db.query(Expense.category, func.sum(Expense.amount))
         .filter(
             and_(
                 Expense.user_id == user_id,
-                Expense.category == budget.category,
-                extract("month", Expense.date) == today.month,
-                extract("year", Expense.date) == today.year,
+                Expense.category.in_(categories),
+                Expense.date >= month_start,
+                Expense.date < next_month,
             )
         )
-        .scalar()
+        .group_by(Expense.category)
+        .all()
     )
+    return dict(rows)
+
+
+def _enrich_budget(budget: Budget, current_spend: Optional[float], db: Session) -> BudgetResponse:
+    """Build the response; ``current_spend`` is looked up when not already known."""
+    if current_spend is None:
+        current_spend = _month_spend_by_category(budget.user_id, [budget.category], db).get(budget.category, 0)
     remaining = budget.monthly_limit - current_spend
     percent_used = (current_spend / budget.monthly_limit * 100) if budget.monthly_limit > 0 else 0
 
@@ -1,25 +1,32 @@
-from typing import List, Optional
-from datetime import date, datetime, timezone
+from typing import List, Optional, Union
+from datetime import date, datetime, timedelta, timezone
 import io, csv
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func, extract
+from sqlalchemy import or_, and_, func, extract, select, union_all
 
-from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.deps import get_current_read_user, get_current_user
+from app.core.etag import conditional_get
+from app.core.events import publish
 from app.models.user import User
 from app.models.couple import (
     Couple, SharedExpense, SavingsGoal, SavingsContribution, Settlement,
     JointAccount, JointAccountContribution, JointAccountTransaction,
 )
+from app.models.report import ArchivedTotal
+from app.services.archive import archive_cutoff, ensure_writable, read_archived
+from app.services.budget_alerts import record_spend_changes
+from app.services.search import filter_expenses, filtered_totals
 from app.schemas.couple import (
     CoupleInvite,
     CoupleResponse,
     SharedExpenseCreate,
     SharedExpenseUpdate,
     SharedExpenseResponse,
+    SharedExpenseListWithTotals,
     BalanceSummary,
     SavingsGoalCreate,
     SavingsGoalResponse,
@@ -62,38 +69,48 @@ def get_partner_id(couple: Couple, user_id: int) -> int:
     return couple.user_2_id if couple.user_1_id == user_id else couple.user_1_id
 
 
-def calculate_split(amount: float, split_type: str, split_ratio: str, paid_by_is_user1: bool):
-    """Return (user1_share, user2_share)."""
-    parts = split_ratio.split(":")
-    if len(parts) != 2:
-        half = amount / 2
-        return half, half
-    if split_type == "equal":
-        half = amount / 2
-        return half, half
-    elif split_type == "percentage":
-        try:
-            p1 = float(parts[0])
-            p2 = float(parts[1])
-        except ValueError:
-            half = amount / 2
-            return half, half
-        # Validate percentages sum to 100
-        if abs((p1 + p2) - 100) > 0.01:
-            half = amount / 2
-            return half, half
-        return amount * p1 / 100, amount * p2 / 100
-    elif split_type == "custom":
-        try:
-            s1 = float(parts[0])
-            s2 = float(parts[1])
-        except ValueError:
-            half = amount / 2
-            return half, half
-        return s1, s2
-    else:
-        half = amount / 2
-        return half, half
+def get_users_by_id(user_ids, db: Session) -> dict[int, User]:
+    """Load the given users in one query, keyed by id."""
+    ids = set(user_ids)
+    if not ids:
+        return {}
+    return {u.id: u for u in db.query(User).filter(User.id.in_(ids)).all()}
+
+
+def get_user_names(user_ids, db: Session) -> dict[int, str]:
+    """Map user ids to display names in one query."""
+    ids = set(user_ids)
+    if not ids:
+        return {}
+    return dict(db.query(User.id, User.name).filter(User.id.in_(ids)).all())
+
+
+def _shared_spend_snapshot(exp: SharedExpense) -> tuple:
+    # Shares are (re)computed on flush, so take the snapshot after db.flush()
+    return (exp.category, exp.date, exp.user_1_share, exp.user_2_share)
+
+
+def _record_shared_spend(db: Session, couple: Couple, before: tuple | None = None, after: tuple | None = None):
+    """Report the change in each partner's share of a shared expense to the budget evaluator."""
+    u1_changes, u2_changes = [], []
+    for snapshot, sign in ((before, -1), (after, 1)):
+        if snapshot is None:
+            continue
+        category, on_date, u1_share, u2_share = snapshot
+        u1_changes.append((category, on_date, sign * u1_share))
+        u2_changes.append((category, on_date, sign * u2_share))
+    record_spend_changes(db, couple.user_1_id, u1_changes)
+    record_spend_changes(db, couple.user_2_id, u2_changes)
+
+
+def _publish_couple_event(db: Session, couple: Couple, event_type: str, **data):
+    publish(db, (couple.user_1_id, couple.user_2_id), event_type, data)
+
+
+def _publish_shared_change(db: Session, couple: Couple, action: str, expense_id: int):
+    """A shared expense change always moves the balance, so both events are sent."""
+    _publish_couple_event(db, couple, "shared_expense", action=action, id=expense_id)
+    _publish_couple_event(db, couple, "balance", source="shared_expense")
 
 
 # ─── Couple Management ────────────────────────────────────────────────────────
@@ -267,10 +284,10 @@ def couple_status(
     )
 
 
-@router.get("/pending-invites", response_model=List[CoupleResponse])
+@router.get("/pending-invites", response_model=List[CoupleResponse], dependencies=[Depends(conditional_get)])
 def pending_invites(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get pending invites for the current user."""
     invites = (
@@ -283,9 +300,10 @@ def pending_invites(
         )
         .all()
     )
+    inviters = get_users_by_id((inv.user_1_id for inv in invites), db)
     result = []
     for inv in invites:
-        partner = db.query(User).filter(User.id == inv.user_1_id).first()
+        partner = inviters.get(inv.user_1_id)
         result.append(
             CoupleResponse(
                 id=inv.id,
@@ -313,6 +331,7 @@ def create_shared_expense(
 
     if expense_data.amount <= 0:
         raise HTTPException(status_code=400, detail="Amount must be positive")
+    ensure_writable(expense_data.date)
 
     # Validate split ratio format and values
     parts = expense_data.split_ratio.split(":")
@@ -355,6 +374,9 @@ def create_shared_expense(
         )
         db.add(txn)
 
+    db.flush()
+    _record_shared_spend(db, couple, after=_shared_spend_snapshot(shared))
+    _publish_shared_change(db, couple, "created", shared.id)
     db.commit()
     db.refresh(shared)
 
@@ -374,7 +396,11 @@ def create_shared_expense(
     )
 
 
-@router.get("/expenses", response_model=List[SharedExpenseResponse])
+@router.get(
+    "/expenses",
+    response_model=Union[List[SharedExpenseResponse], SharedExpenseListWithTotals],
+    dependencies=[Depends(conditional_get)],
+)
 def list_shared_expenses(
     category: Optional[str] = Query(None),
     start_date: Optional[date] = Query(None),
@@ -382,43 +408,29 @@ def list_shared_expenses(
     search: Optional[str] = Query(None),
     min_amount: Optional[float] = Query(None),
     max_amount: Optional[float] = Query(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    with_totals: bool = Query(False, description="Wrap the list as {items, totals}"),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List all shared expenses for the couple with optional filters."""
     couple = get_active_couple(current_user.id, db)
-    query = db.query(SharedExpense).filter(SharedExpense.couple_id == couple.id)
-
-    if category:
-        query = query.filter(SharedExpense.category == category)
-    if start_date:
-        query = query.filter(SharedExpense.date >= start_date)
-    if end_date:
-        query = query.filter(SharedExpense.date <= end_date)
-    if search:
-        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        query = query.filter(
-            or_(
-                SharedExpense.description.ilike(f"%{escaped}%"),
-                SharedExpense.category.ilike(f"%{escaped}%"),
-            )
-        )
-    if min_amount is not None:
-        query = query.filter(SharedExpense.amount >= min_amount)
-    if max_amount is not None:
-        query = query.filter(SharedExpense.amount <= max_amount)
+    query, ranking = filter_expenses(
+        db, db.query(SharedExpense).filter(SharedExpense.couple_id == couple.id), SharedExpense,
+        category=category, start_date=start_date, end_date=end_date,
+        search=search, min_amount=min_amount, max_amount=max_amount,
+    )
 
-    expenses = query.order_by(SharedExpense.date.desc()).all()
+    expenses = query.order_by(*ranking, SharedExpense.date.desc()).all()
+    names = get_user_names((exp.paid_by_user_id for exp in expenses), db)
 
     result = []
     for exp in expenses:
-        payer = db.query(User).filter(User.id == exp.paid_by_user_id).first()
         result.append(
             SharedExpenseResponse(
                 id=exp.id,
                 couple_id=exp.couple_id,
                 paid_by_user_id=exp.paid_by_user_id,
-                paid_by_name=payer.name if payer else None,
+                paid_by_name=names.get(exp.paid_by_user_id),
                 amount=exp.amount,
                 category=exp.category,
                 description=exp.description,
@@ -429,6 +441,8 @@ def list_shared_expenses(
                 created_at=exp.created_at,
             )
         )
+    if with_totals:
+        return SharedExpenseListWithTotals(items=result, totals=filtered_totals(query, SharedExpense))
     return result
 
 
@@ -436,10 +450,10 @@ def list_shared_expenses(
 def export_shared_expenses(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
-    """Export shared expenses as CSV."""
+    """Export shared expenses as CSV, including archived ones."""
     couple = get_active_couple(current_user.id, db)
     query = db.query(SharedExpense).filter(SharedExpense.couple_id == couple.id)
     if start_date:
@@ -447,17 +461,23 @@ def export_shared_expenses(
     if end_date:
         query = query.filter(SharedExpense.date <= end_date)
     expenses = query.order_by(SharedExpense.date.desc()).all()
+    cutoff = archive_cutoff()
+    if cutoff and (start_date is None or start_date < cutoff):
+        before = end_date + timedelta(days=1) if end_date else None
+        archived = read_archived("shared_expenses", couple.id, start_date, before)
+        expenses += [SharedExpense(**row) for row in reversed(archived)]
+        expenses.sort(key=lambda exp: exp.date, reverse=True)
+    names = get_user_names((exp.paid_by_user_id for exp in expenses), db)
 
     output = io.StringIO()
     writer = csv.writer(output)
     writer.writerow(["Date", "Category", "Amount", "Paid By", "Split Type", "Split Ratio", "Description", "Paid From Joint"])
     for exp in expenses:
-        payer = db.query(User).filter(User.id == exp.paid_by_user_id).first()
         writer.writerow([
             exp.date.isoformat(),
             exp.category,
             exp.amount,
-            payer.name if payer else "",
+            names.get(exp.paid_by_user_id, ""),
             exp.split_type,
             exp.split_ratio,
             exp.description or "",
@@ -493,7 +513,9 @@ def update_shared_expense(
     )
     if not expense:
         raise HTTPException(status_code=404, detail="Shared expense not found")
+    ensure_writable(expense.date, expense_data.date)
 
+    before = _shared_spend_snapshot(expense)
     if expense_data.amount is not None:
         expense.amount = expense_data.amount
     if expense_data.category is not None:
@@ -507,6 +529,9 @@ def update_shared_expense(
     if expense_data.date is not None:
         expense.date = expense_data.date
 
+    db.flush()
+    _record_shared_spend(db, couple, before=before, after=_shared_spend_snapshot(expense))
+    _publish_shared_change(db, couple, "updated", expense.id)
     db.commit()
     db.refresh(expense)
 
@@ -547,6 +572,7 @@ def delete_shared_expense(
     )
     if not expense:
         raise HTTPException(status_code=404, detail="Shared expense not found")
+    ensure_writable(expense.date)
 
     # Remove any related joint account transaction
     db.query(JointAccountTransaction).filter(
@@ -554,17 +580,40 @@ def delete_shared_expense(
     ).delete()
 
     db.delete(expense)
+    db.flush()
+    _record_shared_spend(db, couple, before=_shared_spend_snapshot(expense))
+    _publish_shared_change(db, couple, "deleted", expense_id)
     db.commit()
 
 
-@router.get("/balance", response_model=BalanceSummary)
+@router.get("/balance", response_model=BalanceSummary, dependencies=[Depends(conditional_get)])
 def get_balance(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get balance summary between couple partners."""
     couple = get_active_couple(current_user.id, db)
-    expenses = db.query(SharedExpense).filter(SharedExpense.couple_id == couple.id).all()
+    from_joint = func.coalesce(SharedExpense.paid_from_joint, False)
+    shared_totals = (
+        select(
+            SharedExpense.paid_by_user_id,
+            from_joint,
+            func.sum(SharedExpense.amount),
+            func.sum(SharedExpense.user_1_share),
+            func.sum(SharedExpense.user_2_share),
+        )
+        .where(SharedExpense.couple_id == couple.id)
+        .group_by(SharedExpense.paid_by_user_id, from_joint)
+    )
+    # Shared expenses moved to cold storage still count towards the balance
+    archived = select(
+        ArchivedTotal.paid_by_user_id,
+        ArchivedTotal.paid_from_joint,
+        ArchivedTotal.amount,
+        ArchivedTotal.user_1_share,
+        ArchivedTotal.user_2_share,
+    ).where(and_(ArchivedTotal.source == "shared_expenses", ArchivedTotal.owner_id == couple.id))
+    totals = db.execute(union_all(shared_totals, archived)).all()
 
     user1_paid = 0.0
     user2_paid = 0.0
@@ -572,43 +621,40 @@ def get_balance(
     user2_owes_total = 0.0
     total_joint = 0.0
 
-    for exp in expenses:
+    for paid_by, joint, amount, u1_share, u2_share in totals:
         # Joint-paid expenses come from the shared pool — skip from personal balance
-        if exp.paid_from_joint:
-            total_joint += exp.amount
-            continue
-
-        is_user1_payer = exp.paid_by_user_id == couple.user_1_id
-        u1_share, u2_share = calculate_split(
-            exp.amount, exp.split_type, exp.split_ratio, is_user1_payer
-        )
-
-        if is_user1_payer:
-            user1_paid += exp.amount
+        if joint:
+            total_joint += amount
+        elif paid_by == couple.user_1_id:
+            user1_paid += amount
             # user2 owes their share to user1
             user2_owes_total += u2_share
         else:
-            user2_paid += exp.amount
+            user2_paid += amount
             # user1 owes their share to user2
             user1_owes_total += u1_share
 
     net = user1_owes_total - user2_owes_total  # positive means user1 owes user2
 
     # Calculate settlements
-    settlements = db.query(Settlement).filter(Settlement.couple_id == couple.id).all()
-    settlements_total = sum(s.amount for s in settlements)
+    settlement_totals = (
+        db.query(Settlement.paid_by_user_id, func.sum(Settlement.amount))
+        .filter(Settlement.couple_id == couple.id)
+        .group_by(Settlement.paid_by_user_id)
+        .all()
+    )
+    settlements_total = sum(amount for _, amount in settlement_totals)
     # Settlements reduce the net: if user1 settled (paid user2), net decreases
     settlement_adjustment = 0.0
-    for s in settlements:
-        if s.paid_by_user_id == couple.user_1_id:
-            settlement_adjustment -= s.amount  # user1 paid, so net decreases
+    for paid_by, amount in settlement_totals:
+        if paid_by == couple.user_1_id:
+            settlement_adjustment -= amount  # user1 paid, so net decreases
         else:
-            settlement_adjustment += s.amount  # user2 paid, so net increases
+            settlement_adjustment += amount  # user2 paid, so net increases
 
     net_after = net + settlement_adjustment
 
-    user1 = db.query(User).filter(User.id == couple.user_1_id).first()
-    user2 = db.query(User).filter(User.id == couple.user_2_id).first()
+    names = get_user_names((couple.user_1_id, couple.user_2_id), db)
 
     return BalanceSummary(
         total_shared=user1_paid + user2_paid,
@@ -620,8 +666,8 @@ def get_balance(
         net_balance=net,
         settlements_total=settlements_total,
         net_after_settlements=net_after,
-        user_1_name=user1.name if user1 else None,
-        user_2_name=user2.name if user2 else None,
+        user_1_name=names.get(couple.user_1_id),
+        user_2_name=names.get(couple.user_2_id),
     )
 
 
@@ -648,6 +694,7 @@ def create_settlement(
         note=data.note,
     )
     db.add(settlement)
+    _publish_couple_event(db, couple, "balance", source="settlement")
     db.commit()
     db.refresh(settlement)
 
@@ -665,10 +712,10 @@ def create_settlement(
     )
 
 
-@router.get("/settlements", response_model=List[SettlementResponse])
+@router.get("/settlements", response_model=List[SettlementResponse], dependencies=[Depends(conditional_get)])
 def list_settlements(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List all settlements for the couple."""
     couple = get_active_couple(current_user.id, db)
@@ -679,18 +726,18 @@ def list_settlements(
         .all()
     )
 
+    names = get_user_names((couple.user_1_id, couple.user_2_id), db)
+
     result = []
     for s in settlements:
-        payer = db.query(User).filter(User.id == s.paid_by_user_id).first()
-        payee = db.query(User).filter(User.id == s.paid_to_user_id).first()
         result.append(
             SettlementResponse(
                 id=s.id,
                 couple_id=s.couple_id,
                 paid_by_user_id=s.paid_by_user_id,
                 paid_to_user_id=s.paid_to_user_id,
-                paid_by_name=payer.name if payer else None,
-                paid_to_name=payee.name if payee else None,
+                paid_by_name=names.get(s.paid_by_user_id),
+                paid_to_name=names.get(s.paid_to_user_id),
                 amount=s.amount,
                 note=s.note,
                 created_at=s.created_at,
@@ -721,6 +768,7 @@ def update_settlement(
     if data.note is not None:
         settlement.note = data.note
 
+    _publish_couple_event(db, couple, "balance", source="settlement")
     db.commit()
     db.refresh(settlement)
 
@@ -754,6 +802,7 @@ def delete_settlement(
         raise HTTPException(status_code=404, detail="Settlement not found")
 
     db.delete(settlement)
+    _publish_couple_event(db, couple, "balance", source="settlement")
     db.commit()
 
 
@@ -764,7 +813,10 @@ def _get_joint_balance(joint_id: int, db: Session) -> tuple:
     total_contributions = db.query(func.coalesce(func.sum(JointAccountContribution.amount), 0.0)).filter(
         JointAccountContribution.joint_account_id == joint_id
     ).scalar()
-    total_spent = db.query(func.coalesce(func.sum(JointAccountTransaction.amount), 0.0)).filter(
+    archived_spent = select(func.coalesce(func.sum(ArchivedTotal.amount), 0.0)).where(
+        and_(ArchivedTotal.source == "joint_account_transactions", ArchivedTotal.owner_id == joint_id)
+    ).scalar_subquery()
+    total_spent = db.query(func.coalesce(func.sum(JointAccountTransaction.amount), 0.0) + archived_spent).filter(
         JointAccountTransaction.joint_account_id == joint_id
     ).scalar()
     return float(total_contributions), float(total_spent), float(total_contributions) - float(total_spent)
@@ -801,10 +853,10 @@ def create_joint_account(
     )
 
 
-@router.get("/joint-account", response_model=JointAccountSummary)
+@router.get("/joint-account", response_model=JointAccountSummary, dependencies=[Depends(conditional_get)])
 def get_joint_account(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get joint account details with full summary."""
     couple = get_active_couple(current_user.id, db)
@@ -849,12 +901,12 @@ def get_joint_account(
     contribs = db.query(JointAccountContribution).filter(
         JointAccountContribution.joint_account_id == joint.id
     ).order_by(JointAccountContribution.date.desc()).limit(20).all()
+    names = get_user_names((couple.user_1_id, couple.user_2_id, *(c.user_id for c in contribs)), db)
     contrib_responses = []
     for c in contribs:
-        u = db.query(User).filter(User.id == c.user_id).first()
         contrib_responses.append(JointAccountContributionResponse(
             id=c.id, joint_account_id=c.joint_account_id, user_id=c.user_id,
-            user_name=u.name if u else None, amount=c.amount,
+            user_name=names.get(c.user_id), amount=c.amount,
             contribution_type=c.contribution_type, note=c.note, date=c.date, created_at=c.created_at,
         ))
 
@@ -867,9 +919,6 @@ def get_joint_account(
         amount=t.amount, description=t.description, date=t.date, created_at=t.created_at,
     ) for t in txns]
 
-    user1 = db.query(User).filter(User.id == couple.user_1_id).first()
-    user2 = db.query(User).filter(User.id == couple.user_2_id).first()
-
     return JointAccountSummary(
         account=JointAccountResponse(
             id=joint.id, couple_id=joint.couple_id, account_name=joint.account_name,
@@ -880,8 +929,8 @@ def get_joint_account(
         balance=balance,
         user_1_contributed=user1_contrib,
         user_2_contributed=user2_contrib,
-        user_1_name=user1.name if user1 else None,
-        user_2_name=user2.name if user2 else None,
+        user_1_name=names.get(couple.user_1_id),
+        user_2_name=names.get(couple.user_2_id),
         user_1_percent=round(user1_pct, 1),
         user_2_percent=round(user2_pct, 1),
         month_contributions=float(month_contributions),
@@ -939,6 +988,7 @@ def add_contribution(
         date=data.date,
     )
     db.add(contrib)
+    _publish_couple_event(db, couple, "balance", source="joint_account")
     db.commit()
     db.refresh(contrib)
 
@@ -950,10 +1000,10 @@ def add_contribution(
     )
 
 
-@router.get("/joint-account/contributions", response_model=List[JointAccountContributionResponse])
+@router.get("/joint-account/contributions", response_model=List[JointAccountContributionResponse], dependencies=[Depends(conditional_get)])
 def list_contributions_joint(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List all contributions to joint account."""
     couple = get_active_couple(current_user.id, db)
@@ -965,21 +1015,21 @@ def list_contributions_joint(
         JointAccountContribution.joint_account_id == joint.id
     ).order_by(JointAccountContribution.date.desc()).all()
 
+    names = get_user_names((c.user_id for c in contribs), db)
     result = []
     for c in contribs:
-        u = db.query(User).filter(User.id == c.user_id).first()
         result.append(JointAccountContributionResponse(
             id=c.id, joint_account_id=c.joint_account_id, user_id=c.user_id,
-            user_name=u.name if u else None, amount=c.amount,
+            user_name=names.get(c.user_id), amount=c.amount,
             contribution_type=c.contribution_type, note=c.note, date=c.date, created_at=c.created_at,
         ))
     return result
 
 
-@router.get("/joint-account/transactions", response_model=List[JointAccountTransactionResponse])
+@router.get("/joint-account/transactions", response_model=List[JointAccountTransactionResponse], dependencies=[Depends(conditional_get)])
 def list_transactions_joint(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List all transactions from joint account."""
     couple = get_active_couple(current_user.id, db)
@@ -1035,6 +1085,7 @@ def update_contribution(
     if data.date is not None:
         contrib.date = data.date
 
+    _publish_couple_event(db, couple, "balance", source="joint_account")
     db.commit()
     db.refresh(contrib)
 
@@ -1074,6 +1125,7 @@ def delete_contribution(
         raise HTTPException(status_code=400, detail="Cannot delete contributions older than 30 days")
 
     db.delete(contrib)
+    _publish_couple_event(db, couple, "balance", source="joint_account")
     db.commit()
 
 
@@ -1104,10 +1156,10 @@ def create_savings_goal(
     return _enrich_goal(goal)
 
 
-@router.get("/goals", response_model=List[SavingsGoalResponse])
+@router.get("/goals", response_model=List[SavingsGoalResponse], dependencies=[Depends(conditional_get)])
 def list_savings_goals(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List all savings goals for the couple."""
     couple = get_active_couple(current_user.id, db)
@@ -1159,11 +1211,11 @@ def contribute_to_goal(
     )
 
 
-@router.get("/goals/{goal_id}/contributions", response_model=List[SavingsContributionResponse])
+@router.get("/goals/{goal_id}/contributions", response_model=List[SavingsContributionResponse], dependencies=[Depends(conditional_get)])
 def list_contributions(
     goal_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List contributions for a savings goal."""
     couple = get_active_couple(current_user.id, db)
@@ -1182,15 +1234,15 @@ def list_contributions(
         .all()
     )
 
+    names = get_user_names((c.user_id for c in contribs), db)
     result = []
     for c in contribs:
-        user = db.query(User).filter(User.id == c.user_id).first()
         result.append(
             SavingsContributionResponse(
                 id=c.id,
                 goal_id=c.goal_id,
                 user_id=c.user_id,
-                user_name=user.name if user else None,
+                user_name=names.get(c.user_id),
                 amount=c.amount,
                 created_at=c.created_at,
             )
@@ -5,14 +5,18 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func, extract, and_, or_
 
-from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.deps import get_current_read_user, get_current_user
+from app.core.etag import conditional_get
+from app.core.events import publish
 from app.models.user import User
 from app.models.expense import Expense
 from app.models.couple import Couple, SharedExpense, SavingsGoal, Settlement
 from app.models.budget import Budget, Notification
 from app.models.salary import SalaryCredit
-from app.api.couple import calculate_split
+from app.api.couple import get_user_names
+from app.services.partitions import month_bounds
+from app.services.splits import share_column
 from app.schemas.dashboard import (
     IndividualDashboard,
     CoupleDashboard,
@@ -25,13 +29,15 @@ from app.schemas.dashboard import (
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
-@router.get("/individual", response_model=IndividualDashboard)
+@router.get("/individual", response_model=IndividualDashboard, dependencies=[Depends(conditional_get)])
 def individual_dashboard(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get individual analytics dashboard."""
     today = date.today()
+    # Plain date ranges, so PostgreSQL can prune expense partitions
+    month_start, next_month = month_bounds(today)
 
     # ── Helper: get the user's couple (if any) for shared expense inclusion ──
     couple = (
@@ -44,29 +50,43 @@ def individual_dashboard(
         )
         .first()
     )
-    is_user1 = couple and couple.user_1_id == current_user.id
 
-    def _user_share_of_shared(exp: SharedExpense) -> float:
-        """Return the current user's share of a shared expense."""
-        u1_share, u2_share = calculate_split(
-            exp.amount, exp.split_type, exp.split_ratio,
-            exp.paid_by_user_id == couple.user_1_id if couple else True,
-        )
-        return u1_share if is_user1 else u2_share
-
-    # ── Fetch shared expenses for a given month/year ──
-    def _shared_expenses_for_month(m: int, y: int) -> list:
-        if not couple:
-            return []
-        return (
-            db.query(SharedExpense)
+    # Trend window: the current month and the five before it
+    trend_months = []
+    for i in range(5, -1, -1):
+        m = today.month - i
+        y = today.year
+        while m <= 0:
+            m += 12
+            y -= 1
+        trend_months.append((y, m))
+
+    # ── User's share of shared expenses, per month and per category this month ──
+    shared_by_month: dict[tuple[int, int], float] = {}
+    current_shared_by_category: dict[str, float] = {}
+    if couple:
+        share = share_column(couple, current_user.id)
+        year_col = extract("year", SharedExpense.date)
+        month_col = extract("month", SharedExpense.date)
+        # The trend window also covers the previous month
+        window_start = date(*trend_months[0], 1)
+        shared_by_month = {
+            (int(y), int(m)): total
+            for y, m, total in db.query(year_col, month_col, func.sum(share))
+            .filter(and_(SharedExpense.couple_id == couple.id, SharedExpense.date >= window_start))
+            .group_by(year_col, month_col)
+            .all()
+        }
+        current_shared_by_category = dict(
+            db.query(SharedExpense.category, func.sum(share))
             .filter(
                 and_(
                     SharedExpense.couple_id == couple.id,
-                    extract("month", SharedExpense.date) == m,
-                    extract("year", SharedExpense.date) == y,
+                    SharedExpense.date >= month_start,
+                    SharedExpense.date < next_month,
                 )
             )
+            .group_by(SharedExpense.category)
             .all()
         )
 
@@ -76,16 +96,15 @@ def individual_dashboard(
         .filter(
             and_(
                 Expense.user_id == current_user.id,
-                extract("month", Expense.date) == today.month,
-                extract("year", Expense.date) == today.year,
+                Expense.date >= month_start,
+                Expense.date < next_month,
             )
         )
         .scalar()
     )
 
     # Current month shared expenses (user's share)
-    current_shared = _shared_expenses_for_month(today.month, today.year)
-    shared_month = sum(_user_share_of_shared(e) for e in current_shared)
+    shared_month = shared_by_month.get((today.year, today.month), 0.0)
 
     month_expenses = personal_month + shared_month
 
@@ -95,20 +114,20 @@ def individual_dashboard(
     if prev_month <= 0:
         prev_month = 12
         prev_year -= 1
+    prev_month_start = date(prev_year, prev_month, 1)
 
     prev_personal = (
         db.query(func.coalesce(func.sum(Expense.amount), 0))
         .filter(
             and_(
                 Expense.user_id == current_user.id,
-                extract("month", Expense.date) == prev_month,
-                extract("year", Expense.date) == prev_year,
+                Expense.date >= prev_month_start,
+                Expense.date < month_start,
             )
         )
         .scalar()
     )
-    prev_shared = _shared_expenses_for_month(prev_month, prev_year)
-    prev_shared_total = sum(_user_share_of_shared(e) for e in prev_shared)
+    prev_shared_total = shared_by_month.get((prev_year, prev_month), 0.0)
     prev_month_expenses = prev_personal + prev_shared_total
 
     mom_change = 0.0
@@ -127,22 +146,22 @@ def individual_dashboard(
         .filter(
             and_(
                 Expense.user_id == current_user.id,
-                extract("month", Expense.date) == today.month,
-                extract("year", Expense.date) == today.year,
+                Expense.date >= month_start,
+                Expense.date < next_month,
             )
         )
         .group_by(Expense.category)
         .all()
     )
 
+    personal_by_category = dict(category_data)
     cat_map: dict[str, float] = {}
     for cat, total in category_data:
         cat_map[cat] = cat_map.get(cat, 0) + total
 
     # Add user's share of shared expenses to category breakdown
-    for e in current_shared:
-        share = _user_share_of_shared(e)
-        cat_map[e.category] = cat_map.get(e.category, 0) + share
+    for cat, share in current_shared_by_category.items():
+        cat_map[cat] = cat_map.get(cat, 0) + share
 
     category_breakdown = []
     for cat, total in cat_map.items():
@@ -153,26 +172,20 @@ def individual_dashboard(
 
     # Monthly trend (last 6 months) — personal + shared
     monthly_trend = []
-    for i in range(5, -1, -1):
-        m = today.month - i
-        y = today.year
-        while m <= 0:
-            m += 12
-            y -= 1
-
+    for y, m in trend_months:
+        trend_start, trend_end = month_bounds(date(y, m, 1))
         personal_total = (
             db.query(func.coalesce(func.sum(Expense.amount), 0))
             .filter(
                 and_(
                     Expense.user_id == current_user.id,
-                    extract("month", Expense.date) == m,
-                    extract("year", Expense.date) == y,
+                    Expense.date >= trend_start,
+                    Expense.date < trend_end,
                 )
             )
             .scalar()
         )
-        shared_exps = _shared_expenses_for_month(m, y)
-        shared_total = sum(_user_share_of_shared(e) for e in shared_exps)
+        shared_total = shared_by_month.get((y, m), 0.0)
         total = personal_total + shared_total
         month_label = date(y, m, 1).strftime("%b %Y")
         monthly_trend.append(MonthlyTrend(month=month_label, total=round(total, 2)))
@@ -181,21 +194,8 @@ def individual_dashboard(
     budgets = db.query(Budget).filter(Budget.user_id == current_user.id).all()
     budget_overview = []
     for b in budgets:
-        personal_cat = (
-            db.query(func.coalesce(func.sum(Expense.amount), 0))
-            .filter(
-                and_(
-                    Expense.user_id == current_user.id,
-                    Expense.category == b.category,
-                    extract("month", Expense.date) == today.month,
-                    extract("year", Expense.date) == today.year,
-                )
-            )
-            .scalar()
-        )
-        shared_cat = sum(
-            _user_share_of_shared(e) for e in current_shared if e.category == b.category
-        )
+        personal_cat = personal_by_category.get(b.category, 0)
+        shared_cat = current_shared_by_category.get(b.category, 0)
         cat_spend = personal_cat + shared_cat
         pct = (cat_spend / b.monthly_limit * 100) if b.monthly_limit > 0 else 0
         status_str = "ok"
@@ -211,9 +211,6 @@ def individual_dashboard(
             status=status_str,
         ))
 
-    # Generate nudges
-    _check_and_generate_nudges(current_user, month_expenses, db)
-
     # Salary credit for current month
     salary_record = (
         db.query(SalaryCredit)
@@ -249,10 +246,10 @@ def individual_dashboard(
     )
 
 
-@router.get("/couple", response_model=CoupleDashboard)
+@router.get("/couple", response_model=CoupleDashboard, dependencies=[Depends(conditional_get)])
 def couple_dashboard(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get couple analytics dashboard."""
     couple = (
@@ -269,59 +266,70 @@ def couple_dashboard(
         raise HTTPException(status_code=404, detail="No active couple found")
 
     today = date.today()
-
-    # This month's shared expenses
-    expenses = (
-        db.query(SharedExpense)
+    month_start, next_month = month_bounds(today)
+
+    # This month's shared expenses, grouped so the split shares are summed in SQL
+    from_joint = func.coalesce(SharedExpense.paid_from_joint, False)
+    groups = (
+        db.query(
+            SharedExpense.paid_by_user_id,
+            from_joint,
+            SharedExpense.category,
+            func.sum(SharedExpense.amount),
+            func.sum(SharedExpense.user_1_share),
+            func.sum(SharedExpense.user_2_share),
+        )
         .filter(
             and_(
                 SharedExpense.couple_id == couple.id,
-                extract("month", SharedExpense.date) == today.month,
-                extract("year", SharedExpense.date) == today.year,
+                SharedExpense.date >= month_start,
+                SharedExpense.date < next_month,
             )
         )
+        .group_by(SharedExpense.paid_by_user_id, from_joint, SharedExpense.category)
         .all()
     )
 
-    shared_total = sum(e.amount for e in expenses)
-    joint_total = sum(e.amount for e in expenses if e.paid_from_joint)
-    u1_paid = sum(e.amount for e in expenses if e.paid_by_user_id == couple.user_1_id and not e.paid_from_joint)
-    u2_paid = sum(e.amount for e in expenses if e.paid_by_user_id == couple.user_2_id and not e.paid_from_joint)
-
+    shared_total = 0.0
+    u1_paid = 0.0
+    u2_paid = 0.0
     # Net balance using split-based shares (consistent with /couple/balance)
     user1_owes_total = 0.0
     user2_owes_total = 0.0
-    for exp in expenses:
+    cat_totals = {}
+    for paid_by, joint, category, amount, u1_share, u2_share in groups:
+        shared_total += amount
+        cat_totals[category] = cat_totals.get(category, 0) + amount
         # Joint-paid expenses come from the common account — no individual owes
-        if exp.paid_from_joint:
+        if joint:
             continue
-        is_user1_payer = exp.paid_by_user_id == couple.user_1_id
-        u1_share, u2_share = calculate_split(
-            exp.amount, exp.split_type, exp.split_ratio, is_user1_payer
-        )
-        if is_user1_payer:
+        if paid_by == couple.user_1_id:
+            u1_paid += amount
             user2_owes_total += u2_share
         else:
+            if paid_by == couple.user_2_id:
+                u2_paid += amount
             user1_owes_total += u1_share
 
     net = user1_owes_total - user2_owes_total  # positive = user1 owes user2
 
     # Settlement totals
-    settlements = db.query(Settlement).filter(Settlement.couple_id == couple.id).all()
-    settlements_total = sum(s.amount for s in settlements)
+    settlement_totals = (
+        db.query(Settlement.paid_by_user_id, func.sum(Settlement.amount))
+        .filter(Settlement.couple_id == couple.id)
+        .group_by(Settlement.paid_by_user_id)
+        .all()
+    )
+    settlements_total = sum(amount for _, amount in settlement_totals)
     settlement_adjustment = 0.0
-    for s in settlements:
-        if s.paid_by_user_id == couple.user_1_id:
-            settlement_adjustment -= s.amount
+    for paid_by, amount in settlement_totals:
+        if paid_by == couple.user_1_id:
+            settlement_adjustment -= amount
         else:
-            settlement_adjustment += s.amount
+            settlement_adjustment += amount
     net_after = net + settlement_adjustment
 
     # Category breakdown
-    cat_totals = {}
-    for e in expenses:
-        cat_totals[e.category] = cat_totals.get(e.category, 0) + e.amount
-
     cat_breakdown = []
     for cat, total in cat_totals.items():
         pct = (total / shared_total * 100) if shared_total > 0 else 0
@@ -340,8 +348,7 @@ def couple_dashboard(
             "percent": round(pct, 1),
         })
 
-    user1 = db.query(User).filter(User.id == couple.user_1_id).first()
-    user2 = db.query(User).filter(User.id == couple.user_2_id).first()
+    names = get_user_names((couple.user_1_id, couple.user_2_id), db)
 
     return CoupleDashboard(
         shared_expenses_total=round(shared_total, 2),
@@ -350,8 +357,8 @@ def couple_dashboard(
         net_balance=round(net, 2),
         category_breakdown=cat_breakdown,
         goal_progress=goal_progress,
-        user_1_name=user1.name if user1 else None,
-        user_2_name=user2.name if user2 else None,
+        user_1_name=names.get(couple.user_1_id),
+        user_2_name=names.get(couple.user_2_id),
         settlements_total=round(settlements_total, 2),
         net_after_settlements=round(net_after, 2),
     )
@@ -361,8 +368,8 @@ def couple_dashboard(
 
 @router.get("/notifications", response_model=List[NotificationResponse])
 def get_notifications(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get all notifications for the user."""
     return (
@@ -395,6 +402,7 @@ def mark_notification_read(
         raise HTTPException(status_code=404, detail="Notification not found")
 
     notification.is_read = True
+    publish(db, [current_user.id], "notification", {"action": "read", "id": notification.id})
     db.commit()
     return {"status": "ok"}
 
@@ -411,14 +419,15 @@ def mark_all_notifications_read(
             Notification.is_read == False,
         )
     ).update({Notification.is_read: True})
+    publish(db, [current_user.id], "notification", {"action": "read_all"})
     db.commit()
     return {"status": "ok"}
 
 
 @router.get("/notifications/unread-count")
 def unread_count(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get unread notification count."""
     count = (
@@ -432,88 +441,3 @@ def unread_count(
         .scalar()
     )
     return {"unread_count": count}
-
-
-# ─── Nudge Generator ─────────────────────────────────────────────────────────
-
-def _check_and_generate_nudges(user: User, month_expenses: float, db: Session):
-    """Generate in-app nudges based on spending patterns."""
-    today = date.today()
-
-    # 1. Overall budget warning (80% of monthly budget)
-    if user.monthly_budget > 0 and month_expenses >= user.monthly_budget * 0.8:
-        _create_notification_if_new(
-            db,
-            user.id,
-            "Budget Alert ⚠️",
-            f"You've spent ₹{month_expenses:,.0f} of your ₹{user.monthly_budget:,.0f} monthly budget ({month_expenses/user.monthly_budget*100:.0f}%).",
-            "budget_warning",
-            today,
-        )
-
-    # 2. Savings below target
-    if user.monthly_income > 0:
-        savings_rate = (user.monthly_income - month_expenses) / user.monthly_income * 100
-        if savings_rate < 20 and today.day >= 15:
-            _create_notification_if_new(
-                db,
-                user.id,
-                "Savings Alert 💰",
-                f"Your savings rate is only {savings_rate:.0f}% this month. Consider reducing discretionary spending.",
-                "savings_alert",
-                today,
-            )
-
-    # 3. Per-category budget warnings
-    budgets = db.query(Budget).filter(Budget.user_id == user.id).all()
-    for budget in budgets:
-        cat_spend = (
-            db.query(func.coalesce(func.sum(Expense.amount), 0))
-            .filter(
-                and_(
-                    Expense.user_id == user.id,
-                    Expense.category == budget.category,
-                    extract("month", Expense.date) == today.month,
-                    extract("year", Expense.date) == today.year,
-                )
-            )
-            .scalar()
-        )
-        if cat_spend >= budget.monthly_limit * 0.8:
-            _create_notification_if_new(
-                db,
-                user.id,
-                f"{budget.category} Budget Warning ⚠️",
-                f"You've spent ₹{cat_spend:,.0f} of ₹{budget.monthly_limit:,.0f} for {budget.category}.",
-                "budget_warning",
-                today,
-            )
-
-
-def _create_notification_if_new(
-    db: Session, user_id: int, title: str, message: str, ntype: str, today: date
-):
-    """Create notification only if one doesn't already exist today for same type+title."""
-    from datetime import datetime, timezone
-
-    existing = (
-        db.query(Notification)
-        .filter(
-            and_(
-                Notification.user_id == user_id,
-                Notification.title == title,
-                Notification.notification_type == ntype,
-                func.date(Notification.created_at) == today,
-            )
-        )
-        .first()
-    )
-    if not existing:
-        notif = Notification(
-            user_id=user_id,
-            title=title,
-            message=message,
-            notification_type=ntype,
-        )
-        db.add(notif)
-        db.commit()
@@ -0,0 +1,51 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core import deps
+from app.core.database import SessionLocal
+from app.core.events import broker
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+HEARTBEAT_SECONDS = 15
+
+
+def _authenticate(token: str) -> int:
+    """Resolve the stream's user without holding a DB session open for its lifetime."""
+    db = SessionLocal()
+    try:
+        return deps._authenticate(token, db).id
+    finally:
+        db.close()
+
+
+@router.get("/stream")
+async def event_stream(
+    request: Request,
+    token: str = Query(..., description="JWT access token (EventSource cannot send headers)"),
+):
+    """Server-Sent Events stream of notification, balance and shared-expense changes."""
+    user_id = await asyncio.to_thread(_authenticate, token)
+    queue = broker.subscribe(user_id)
+
+    async def stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {message['type']}\ndata: {json.dumps(message['data'], default=str)}\n\n"
+        finally:
+            broker.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
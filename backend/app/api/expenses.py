@@ -1,55 +1,76 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import date, timedelta
 import csv
 import io
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func
 
-from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.database import get_db, get_read_db
+from app.core.deps import get_current_read_user, get_current_user
+from app.core.etag import conditional_get
 from app.models.user import User
 from app.models.expense import Expense, RecurringExpense, UserCategory
+from app.services.archive import archive_cutoff, ensure_writable, read_archived
+from app.services.budget_alerts import record_spend_change, record_spend_changes
+from app.services.categories import (
+    DEFAULTS_BY_NAME, FALLBACK_CATEGORY, get_catalogue, invalidate_catalogue, move_category,
+)
+from app.services.data_version import bump_categories_version, bump_data_version
+from app.services.search import filter_expenses, filtered_totals
+from app.services.sync import advance_change_seq, write_tombstones
 from app.schemas.expense import (
-    ExpenseCreate, ExpenseUpdate, ExpenseResponse,
+    ExpenseCreate, ExpenseUpdate, ExpenseResponse, ExpenseListWithTotals,
+    ExpenseBulkUpdate, ExpenseBulkDelete, BulkResult,
     RecurringExpenseCreate, RecurringExpenseUpdate, RecurringExpenseResponse,
-    CategoryCreate, CategoryResponse,
+    CategoryCreate, CategoryUpdate, CategoryMerge, CategoryMoveResult, CategoryResponse,
 )
 
 router = APIRouter(prefix="/expenses", tags=["Expenses"])
 
-DEFAULT_CATEGORIES = [
-    {"name": "Food", "icon": "🍔", "color": "#f97316"},
-    {"name": "Rent", "icon": "🏠", "color": "#8b5cf6"},
-    {"name": "Utilities", "icon": "💡", "color": "#06b6d4"},
-    {"name": "Travel", "icon": "✈️", "color": "#ec4899"},
-    {"name": "Shopping", "icon": "🛒", "color": "#f59e0b"},
-    {"name": "Subscriptions", "icon": "📱", "color": "#6366f1"},
-    {"name": "EMI", "icon": "🏦", "color": "#ef4444"},
-    {"name": "Entertainment", "icon": "🎬", "color": "#14b8a6"},
-    {"name": "Health", "icon": "🏥", "color": "#22c55e"},
-    {"name": "Other", "icon": "📦", "color": "#94a3b8"},
-]
-
-
-@router.get("/categories", response_model=List[CategoryResponse])
+# Rows per bulk UPDATE/DELETE; each chunk commits on its own to bound lock time
+BULK_CHUNK_SIZE = 500
+
+@router.get("/categories", response_model=List[CategoryResponse], dependencies=[Depends(conditional_get)])
 def get_categories(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_read_user),
 ):
     """Get default + user custom categories."""
-    defaults = [
-        CategoryResponse(name=c["name"], icon=c["icon"], color=c["color"], is_default=True)
-        for c in DEFAULT_CATEGORIES
-    ]
-    custom = db.query(UserCategory).filter(UserCategory.user_id == current_user.id).all()
-    customs = [
-        CategoryResponse(id=c.id, name=c.name, icon=c.icon, color=c.color, is_default=False)
-        for c in custom
-    ]
-    return defaults + customs
+    return get_catalogue(db, current_user.id, current_user.categories_version)
+
+
+def _category_name(name: str) -> str:
+    """Validate a custom category name against the defaults and return it stripped."""
+    name = name.strip()
+    if not name:
+        raise HTTPException(status_code=400, detail="Category name cannot be empty")
+    if len(name) > 50:
+        raise HTTPException(status_code=400, detail="Category name too long (max 50)")
+    if name.lower() in DEFAULTS_BY_NAME:
+        raise HTTPException(status_code=400, detail="Category already exists as a default")
+    return name
+
+
+def _find_custom_category(db: Session, user_id: int, name: str) -> Optional[UserCategory]:
+    # Matches uq_user_categories_user_lower_name
+    return db.query(UserCategory).filter(
+        UserCategory.user_id == user_id,
+        func.lower(UserCategory.name) == name.lower(),
+    ).first()
+
+
+def _custom_category(db: Session, user_id: int, category_id: int) -> UserCategory:
+    cat = db.query(UserCategory).filter(
+        UserCategory.id == category_id,
+        UserCategory.user_id == user_id,
+    ).first()
+    if not cat:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return cat
 
 
 @router.post("/categories", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
@@ -59,27 +80,23 @@ def create_category(
     current_user: User = Depends(get_current_user),
 ):
     """Add a custom category."""
-    name = data.name.strip()
-    if not name:
-        raise HTTPException(status_code=400, detail="Category name cannot be empty")
-    if len(name) > 50:
-        raise HTTPException(status_code=400, detail="Category name too long (max 50)")
-    # Check duplicate against defaults
-    default_names = [c["name"].lower() for c in DEFAULT_CATEGORIES]
-    if name.lower() in default_names:
-        raise HTTPException(status_code=400, detail="Category already exists as a default")
-    # Check duplicate against user's custom
-    existing = db.query(UserCategory).filter(
-        UserCategory.user_id == current_user.id,
-        UserCategory.name.ilike(name),
+    name = _category_name(data.name)
+    # The unique (user_id, lower(name)) index rejects duplicates, including concurrent ones
+    dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    seq = advance_change_seq(db, "user_id", [current_user.id])[current_user.id]
+    row = db.execute(
+        dialect_insert(UserCategory)
+        .values(user_id=current_user.id, name=name, icon=data.icon, color=data.color, change_seq=seq)
+        .on_conflict_do_nothing()
+        .returning(UserCategory.id, UserCategory.name, UserCategory.icon, UserCategory.color)
     ).first()
-    if existing:
+    if row is None:
         raise HTTPException(status_code=400, detail="You already have this category")
-    cat = UserCategory(user_id=current_user.id, name=name, icon=data.icon, color=data.color)
-    db.add(cat)
+    bump_data_version(db, [current_user.id])
+    bump_categories_version(db, [current_user.id])
     db.commit()
-    db.refresh(cat)
-    return CategoryResponse(id=cat.id, name=cat.name, icon=cat.icon, color=cat.color, is_default=False)
+    invalidate_catalogue(current_user.id)
+    return CategoryResponse(id=row.id, name=row.name, icon=row.icon, color=row.color, is_default=False)
 
 
 @router.delete("/categories/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -88,15 +105,66 @@ def delete_category(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Delete a custom category."""
-    cat = db.query(UserCategory).filter(
-        UserCategory.id == category_id,
-        UserCategory.user_id == current_user.id,
-    ).first()
-    if not cat:
-        raise HTTPException(status_code=404, detail="Category not found")
+    """Delete a custom category; every expense, budget and snapshot using it moves to "Other"."""
+    cat = _custom_category(db, current_user.id, category_id)
+    move_category(db, current_user.id, cat.name, FALLBACK_CATEGORY)
+    db.delete(cat)
+    db.commit()
+    invalidate_catalogue(current_user.id)
+
+
+@router.put("/categories/{category_id}", response_model=CategoryMoveResult)
+def update_category(
+    category_id: int,
+    data: CategoryUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Update a custom category; a new name is applied to every expense, budget and snapshot using it."""
+    cat = _custom_category(db, current_user.id, category_id)
+    counts: dict[str, int] = {}
+    if data.name is not None and data.name.strip() != cat.name:
+        name = _category_name(data.name)
+        if name.lower() != cat.name.lower() and _find_custom_category(db, current_user.id, name):
+            raise HTTPException(status_code=400, detail="You already have this category")
+        counts = move_category(db, current_user.id, cat.name, name)
+        cat.name = name
+    if data.icon is not None:
+        cat.icon = data.icon
+    if data.color is not None:
+        cat.color = data.color
+    db.commit()
+    invalidate_catalogue(current_user.id)
+    return CategoryMoveResult(
+        category=CategoryResponse(id=cat.id, name=cat.name, icon=cat.icon, color=cat.color, is_default=False),
+        **counts,
+    )
+
+
+@router.post("/categories/{category_id}/merge", response_model=CategoryMoveResult)
+def merge_category(
+    category_id: int,
+    data: CategoryMerge,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Fold a custom category into another category and delete it."""
+    cat = _custom_category(db, current_user.id, category_id)
+    into = data.into.strip()
+    target = DEFAULTS_BY_NAME.get(into.lower())
+    if target is None:
+        custom = _find_custom_category(db, current_user.id, into)
+        if not custom:
+            raise HTTPException(status_code=404, detail="Target category not found")
+        if custom.id == cat.id:
+            raise HTTPException(status_code=400, detail="Cannot merge a category into itself")
+        target = CategoryResponse(id=custom.id, name=custom.name, icon=custom.icon, color=custom.color, is_default=False)
+
+    counts = move_category(db, current_user.id, cat.name, target.name)
     db.delete(cat)
     db.commit()
+    invalidate_catalogue(current_user.id)
+    return CategoryMoveResult(category=target, **counts)
 
 
 @router.post("/", response_model=ExpenseResponse, status_code=status.HTTP_201_CREATED)
@@ -108,6 +176,7 @@ def create_expense(
     """Log a new personal expense."""
     if expense_data.amount <= 0:
         raise HTTPException(status_code=400, detail="Amount must be positive")
+    ensure_writable(expense_data.date)
     expense = Expense(
         user_id=current_user.id,
         amount=expense_data.amount,
@@ -117,12 +186,14 @@ def create_expense(
         description=expense_data.description,
     )
     db.add(expense)
+    db.flush()
+    record_spend_change(db, current_user.id, expense.category, expense.date, expense.amount)
     db.commit()
     db.refresh(expense)
     return expense
 
 
-@router.get("/", response_model=List[ExpenseResponse])
+@router.get("/", response_model=Union[List[ExpenseResponse], ExpenseListWithTotals])
 def list_expenses(
     category: Optional[str] = Query(None),
     expense_type: Optional[str] = Query(None),
@@ -133,45 +204,34 @@ def list_expenses(
     max_amount: Optional[float] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    with_totals: bool = Query(False, description="Wrap the page as {items, totals} with totals over all matches"),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List expenses with optional filters."""
     query = db.query(Expense).filter(Expense.user_id == current_user.id)
-
-    if category:
-        query = query.filter(Expense.category == category)
     if expense_type:
         query = query.filter(Expense.expense_type == expense_type)
-    if start_date:
-        query = query.filter(Expense.date >= start_date)
-    if end_date:
-        query = query.filter(Expense.date <= end_date)
-    if search:
-        # Escape LIKE wildcard characters
-        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        query = query.filter(
-            or_(
-                Expense.description.ilike(f"%{escaped}%"),
-                Expense.category.ilike(f"%{escaped}%"),
-            )
-        )
-    if min_amount is not None:
-        query = query.filter(Expense.amount >= min_amount)
-    if max_amount is not None:
-        query = query.filter(Expense.amount <= max_amount)
+    query, ranking = filter_expenses(
+        db, query, Expense,
+        category=category, start_date=start_date, end_date=end_date,
+        search=search, min_amount=min_amount, max_amount=max_amount,
+    )
 
-    return query.order_by(Expense.date.desc()).offset(skip).limit(limit).all()
+    items = query.order_by(*ranking, Expense.date.desc()).offset(skip).limit(limit).all()
+    if with_totals:
+        return ExpenseListWithTotals(items=items, totals=filtered_totals(query, Expense))
+    return items
 
 
 @router.get("/export")
 def export_expenses(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
-    """Export expenses as CSV."""
+    """Export expenses as CSV, including archived ones."""
     query = db.query(Expense).filter(Expense.user_id == current_user.id)
     if start_date:
         query = query.filter(Expense.date >= start_date)
@@ -179,6 +239,12 @@ def export_expenses(
         query = query.filter(Expense.date <= end_date)
 
     expenses = query.order_by(Expense.date.desc()).all()
+    cutoff = archive_cutoff()
+    if cutoff and (start_date is None or start_date < cutoff):
+        before = end_date + timedelta(days=1) if end_date else None
+        archived = read_archived("expenses", current_user.id, start_date, before)
+        expenses += [Expense(**row) for row in reversed(archived)]
+        expenses.sort(key=lambda exp: exp.date, reverse=True)
 
     output = io.StringIO()
     writer = csv.writer(output)
@@ -200,11 +266,102 @@ def export_expenses(
     )
 
 
+# ─── Bulk edits ──────────────────────────────────────────────────────────────
+
+
+def _bulk_chunks(db: Session, user_id: int, data: ExpenseBulkDelete):
+    """Yield the selected expenses as (id, category, date, amount) rows, one chunk at a time."""
+    if (data.ids is None) == (data.filter is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or filter")
+    base = db.query(Expense.id, Expense.category, Expense.date, Expense.amount).filter(Expense.user_id == user_id)
+    cutoff = archive_cutoff()
+    if cutoff:  # archived months are read-only
+        base = base.filter(Expense.date >= cutoff)
+
+    if data.ids is not None:
+        ids = sorted(set(data.ids))
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            rows = base.filter(Expense.id.in_(ids[start:start + BULK_CHUNK_SIZE])).all()
+            if rows:
+                yield rows
+        return
+
+    criteria = data.filter
+    if all(value is None or value == "" for value in criteria.model_dump().values()):
+        raise HTTPException(status_code=400, detail="Filter must set at least one field")
+    query = base
+    if criteria.expense_type:
+        query = query.filter(Expense.expense_type == criteria.expense_type)
+    query, _ = filter_expenses(
+        db, query, Expense,
+        category=criteria.category, start_date=criteria.start_date, end_date=criteria.end_date,
+        search=criteria.search, min_amount=criteria.min_amount, max_amount=criteria.max_amount,
+    )
+    # Keyset over id, so rows an update moves out of (or into) the filter are not revisited
+    last_id = 0
+    while True:
+        rows = query.filter(Expense.id > last_id).order_by(Expense.id).limit(BULK_CHUNK_SIZE).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+@router.post("/bulk-update", response_model=BulkResult)
+def bulk_update_expenses(
+    data: ExpenseBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Apply the same changes to every expense selected by ids or a list filter."""
+    changes = data.changes.model_dump(exclude_none=True)
+    if not changes:
+        raise HTTPException(status_code=400, detail="No changes given")
+    ensure_writable(changes.get("date"))
+
+    affected = 0
+    for rows in _bulk_chunks(db, current_user.id, data):
+        seq = advance_change_seq(db, "user_id", [current_user.id])[current_user.id]
+        db.query(Expense).filter(Expense.id.in_([row.id for row in rows])).update(
+            {**changes, "change_seq": seq}, synchronize_session=False
+        )
+        bump_data_version(db, [current_user.id])
+        spend_changes = []
+        for _, category, on_date, amount in rows:
+            spend_changes.append((category, on_date, -amount))
+            spend_changes.append((changes.get("category", category), changes.get("date", on_date), amount))
+        record_spend_changes(db, current_user.id, spend_changes)
+        db.commit()
+        affected += len(rows)
+    return BulkResult(affected=affected)
+
+
+@router.post("/bulk-delete", response_model=BulkResult)
+def bulk_delete_expenses(
+    data: ExpenseBulkDelete,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Delete every expense selected by ids or a list filter."""
+    affected = 0
+    for rows in _bulk_chunks(db, current_user.id, data):
+        ids = [row.id for row in rows]
+        write_tombstones(db, Expense, ids, current_user.id)
+        db.query(Expense).filter(Expense.id.in_(ids)).delete(synchronize_session=False)
+        bump_data_version(db, [current_user.id])
+        record_spend_changes(
+            db, current_user.id, [(category, on_date, -amount) for _, category, on_date, amount in rows]
+        )
+        db.commit()
+        affected += len(rows)
+    return BulkResult(affected=affected)
+
+
 @router.get("/{expense_id}", response_model=ExpenseResponse)
 def get_expense(
     expense_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get a single expense."""
     expense = (
@@ -232,7 +389,9 @@ def update_expense(
     )
     if not expense:
         raise HTTPException(status_code=404, detail="Expense not found")
+    ensure_writable(expense.date, expense_data.date)
 
+    before = (expense.category, expense.date, -expense.amount)
     if expense_data.amount is not None:
         if expense_data.amount <= 0:
             raise HTTPException(status_code=400, detail="Amount must be positive")
@@ -246,6 +405,10 @@ def update_expense(
     if expense_data.description is not None:
         expense.description = expense_data.description
 
+    db.flush()
+    record_spend_changes(
+        db, current_user.id, [before, (expense.category, expense.date, expense.amount)]
+    )
     db.commit()
     db.refresh(expense)
     return expense
@@ -265,8 +428,11 @@ def delete_expense(
     )
     if not expense:
         raise HTTPException(status_code=404, detail="Expense not found")
+    ensure_writable(expense.date)
 
     db.delete(expense)
+    db.flush()
+    record_spend_change(db, current_user.id, expense.category, expense.date, -expense.amount)
     db.commit()
 
 
@@ -345,8 +511,8 @@ def create_recurring_expense(
 
 @router.get("/recurring/list", response_model=List[RecurringExpenseResponse])
 def list_recurring_expenses(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """List all recurring expense templates."""
     return (
@@ -459,6 +625,7 @@ def process_recurring_expenses(
     )
 
     created = 0
+    spend_changes = []
     for rec in recs:
         # Check end_date
         if rec.end_date and today > rec.end_date:
@@ -477,12 +644,16 @@ def process_recurring_expenses(
             recurring_id=rec.id,
         )
         db.add(expense)
+        spend_changes.append((rec.category, rec.next_date, rec.amount))
 
         # Advance next_date
         rec.next_date = _compute_next_date(rec.frequency, rec.day_of_month, rec.day_of_week, after=rec.next_date,
                                            start_month=rec.start_date.month if rec.start_date else None)
         created += 1
 
+    db.flush()
+    record_spend_changes(db, current_user.id, spend_changes)
+
     # Batch commit all changes at once for atomicity
     db.commit()
 
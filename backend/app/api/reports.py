@@ -1,24 +1,31 @@
-"""Reports API – monthly breakdown, spending trends, budget variance."""
+"""Reports API – monthly breakdown, spending trends, budget variance, long-range history."""
 
 from __future__ import annotations
 
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Iterable, List, Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, extract, func, or_
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, extract, func, or_, select, union_all
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.database import get_read_db
+from app.core.deps import get_current_read_user
+from app.core.etag import conditional_get
 from app.models.budget import Budget
 from app.models.expense import Expense
 from app.models.couple import Couple, SharedExpense
 from app.models.user import User
-from app.api.couple import calculate_split
+from app.services.archive import archive_cutoff, archived_spend
+from app.services.snapshots import load_snapshots, month_key
+from app.services.splits import share_column
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
+GRANULARITIES = ("week", "month", "quarter", "year")
+WEEK_HISTORY_LIMIT = 52  # weeks are summed from daily rows, so their window is capped
+OTHER = "Other"  # also a default category, which the folded remainder joins
+
 
 # ───────────── Response models (inline to keep it simple) ─────────────
 from pydantic import BaseModel
@@ -55,13 +62,191 @@ class ReportsResponse(BaseModel):
     budget_variance: List[BudgetVarianceItem]
 
 
+class HistoryPoint(BaseModel):
+    period: str         # e.g. "2025-W07", "2025-01", "2025-Q1", "2025"
+    start: date
+    total: float
+    categories: List[CategoryAmount]
+
+
+class HistoryResponse(BaseModel):
+    granularity: str
+    categories: List[str]   # the top categories, then "Other" when anything was folded into it
+    points: List[HistoryPoint]
+
+
+# ───────────── Helpers ────────────────────────────────────────────────
+
+def bucket_by_month(rows: Iterable[tuple]) -> dict[str, dict[str, float]]:
+    """Fold ``(year, month, category, amount)`` rows into {"YYYY-MM": {category: amount}}."""
+    month_cat_totals: dict[str, dict[str, float]] = {}
+    for year, month, category, amount in rows:
+        cats = month_cat_totals.setdefault(f"{int(year):04d}-{int(month):02d}", {})
+        cats[category] = cats.get(category, 0) + amount
+    return month_cat_totals
+
+
+def month_keys(start_month: date, end_month: date) -> list[str]:
+    """Every "YYYY-MM" from start_month to end_month inclusive."""
+    first = start_month.year * 12 + start_month.month - 1
+    last = end_month.year * 12 + end_month.month - 1
+    return [f"{i // 12:04d}-{i % 12 + 1:02d}" for i in range(first, last + 1)]
+
+
+def _month_ranges(keys: list[str]) -> list[tuple[date, date]]:
+    """Merge sorted "YYYY-MM" keys into contiguous [start, end) date ranges."""
+    ranges: list[tuple[date, date]] = []
+    for key in keys:
+        start = date.fromisoformat(f"{key}-01")
+        end = date(start.year + 1, 1, 1) if start.month == 12 else date(start.year, start.month + 1, 1)
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def _in_ranges(column, ranges: list[tuple[date, date]]):
+    return or_(*(and_(column >= start, column < end) for start, end in ranges))
+
+
+def monthly_category_totals(
+    db: Session, user_id: int, couple: Optional[Couple], ranges: list[tuple[date, date]]
+) -> dict[str, dict[str, float]]:
+    """Personal spend plus the user's share of shared spend per month and category.
+
+    Summed in one grouped query, so only one row per month and category
+    leaves the database however many expenses fall in the date ranges.
+    """
+    personal_year = extract("year", Expense.date)
+    personal_month = extract("month", Expense.date)
+    query = (
+        select(personal_year, personal_month, Expense.category, func.sum(Expense.amount))
+        .where(and_(Expense.user_id == user_id, _in_ranges(Expense.date, ranges)))
+        .group_by(personal_year, personal_month, Expense.category)
+    )
+    if couple:
+        shared_year = extract("year", SharedExpense.date)
+        shared_month = extract("month", SharedExpense.date)
+        query = union_all(
+            query,
+            select(shared_year, shared_month, SharedExpense.category, func.sum(share_column(couple, user_id)))
+            .where(and_(SharedExpense.couple_id == couple.id, _in_ranges(SharedExpense.date, ranges)))
+            .group_by(shared_year, shared_month, SharedExpense.category),
+        )
+    return bucket_by_month(db.execute(query).all())
+
+
+def month_totals(
+    db: Session, user_id: int, couple: Optional[Couple], months: list[str]
+) -> dict[str, dict[str, float]]:
+    """{"YYYY-MM": {category: amount}} for consecutive months ending with the current one.
+
+    Closed months come from month-close snapshots; the current month, and
+    any closed month whose snapshot is missing, are summed live, reading
+    archived rows for months before the archive cutoff.
+    """
+    totals = load_snapshots(
+        db, user_id, date.fromisoformat(f"{months[0]}-01"), date.fromisoformat(f"{months[-1]}-01")
+    )
+    missing = [key for key in months if key not in totals]
+    live = monthly_category_totals(db, user_id, couple, _month_ranges(missing))
+    cutoff = archive_cutoff()
+    if cutoff and missing and missing[0] < month_key(cutoff.year, cutoff.month):
+        archived = bucket_by_month(
+            (day.year, day.month, category, amount)
+            for day, category, amount in archived_spend(user_id, couple, date.fromisoformat(f"{missing[0]}-01"), cutoff)
+        )
+        for key, cats in archived.items():
+            live_cats = live.setdefault(key, {})
+            for category, amount in cats.items():
+                live_cats[category] = live_cats.get(category, 0) + amount
+    for key in missing:
+        totals[key] = live.get(key, {})
+    return totals
+
+
+def daily_category_totals(
+    db: Session, user_id: int, couple: Optional[Couple], start: date
+) -> list[tuple[date, str, float]]:
+    """(date, category, amount) rows from start onwards, grouped in SQL by day, plus archived days."""
+    query = (
+        select(Expense.date, Expense.category, func.sum(Expense.amount))
+        .where(and_(Expense.user_id == user_id, Expense.date >= start))
+        .group_by(Expense.date, Expense.category)
+    )
+    if couple:
+        query = union_all(
+            query,
+            select(SharedExpense.date, SharedExpense.category, func.sum(share_column(couple, user_id)))
+            .where(and_(SharedExpense.couple_id == couple.id, SharedExpense.date >= start))
+            .group_by(SharedExpense.date, SharedExpense.category),
+        )
+    rows = db.execute(query).all()
+    cutoff = archive_cutoff()
+    if cutoff and start < cutoff:
+        rows += archived_spend(user_id, couple, start, cutoff)
+    return rows
+
+
+def top_categories(periods: dict, top: int) -> tuple[dict[str, dict[str, float]], list[str]]:
+    """Keep the ``top`` categories by total over all periods and fold the rest into "Other"."""
+    overall: dict[str, float] = {}
+    for cats in periods.values():
+        for cat, amt in cats.items():
+            overall[cat] = overall.get(cat, 0) + amt
+    ranked = sorted(overall, key=lambda c: -overall[c])
+    kept = set(ranked[:top])
+
+    folded: dict[str, dict[str, float]] = {}
+    for key, cats in periods.items():
+        bucket = folded.setdefault(key, {})
+        for cat, amt in cats.items():
+            name = cat if cat in kept else OTHER
+            bucket[name] = bucket.get(name, 0) + amt
+
+    names = ranked[:top]
+    if len(ranked) > top and OTHER not in kept:
+        names.append(OTHER)
+    return folded, names
+
+
+def _week_key(monday: date) -> str:
+    year, week, _ = monday.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _period(month_key: str, granularity: str) -> tuple[str, date]:
+    """The (key, start date) of the month/quarter/year period a "YYYY-MM" month falls in."""
+    year, month = int(month_key[:4]), int(month_key[5:])
+    if granularity == "quarter":
+        quarter = (month - 1) // 3 + 1
+        return f"{year}-Q{quarter}", date(year, quarter * 3 - 2, 1)
+    if granularity == "year":
+        return str(year), date(year, 1, 1)
+    return month_key, date(year, month, 1)
+
+
+def _active_couple(user_id: int, db: Session) -> Optional[Couple]:
+    return (
+        db.query(Couple)
+        .filter(
+            and_(
+                Couple.status == "active",
+                or_(Couple.user_1_id == user_id, Couple.user_2_id == user_id),
+            )
+        )
+        .first()
+    )
+
+
 # ───────────── Endpoint ───────────────────────────────────────────────
 
-@router.get("", response_model=ReportsResponse)
+@router.get("", response_model=ReportsResponse, dependencies=[Depends(conditional_get)])
 def get_reports(
     months: int = Query(12, ge=1, le=24, description="Number of months to look back"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
 ):
     """Return monthly breakdown, spending trends, and budget variance."""
 
@@ -74,86 +259,16 @@ def get_reports(
         start_year -= 1
     start_month = date(start_year, start_month_num, 1)
 
-    # ── Helper: get couple & compute user's share ────────────────────
-    couple = (
-        db.query(Couple)
-        .filter(
-            and_(
-                Couple.status == "active",
-                or_(Couple.user_1_id == current_user.id, Couple.user_2_id == current_user.id),
-            )
-        )
-        .first()
-    )
-    is_user1 = couple and couple.user_1_id == current_user.id
-
-    def _user_share(exp: SharedExpense) -> float:
-        u1_share, u2_share = calculate_split(
-            exp.amount, exp.split_type, exp.split_ratio,
-            exp.paid_by_user_id == couple.user_1_id if couple else True,
-        )
-        return u1_share if is_user1 else u2_share
-
-    # Fetch all personal expenses in window
-    expenses = (
-        db.query(Expense)
-        .filter(
-            and_(
-                Expense.user_id == current_user.id,
-                Expense.date >= start_month,
-            )
-        )
-        .order_by(Expense.date)
-        .all()
-    )
-
-    # Fetch all shared expenses in window (user's share)
-    shared_expenses: list[SharedExpense] = []
-    if couple:
-        shared_expenses = (
-            db.query(SharedExpense)
-            .filter(
-                and_(
-                    SharedExpense.couple_id == couple.id,
-                    SharedExpense.date >= start_month,
-                )
-            )
-            .order_by(SharedExpense.date)
-            .all()
-        )
+    couple = _active_couple(current_user.id, db)
 
     # ── Bucket by month ──────────────────────────────────────────────
-    # Use a simple dict of {month_key: {category: amount}}
-    month_cat_totals: dict[str, dict[str, float]] = {}
-
-    for e in expenses:
-        key = e.date.strftime("%Y-%m")
-        month_cat_totals.setdefault(key, {})
-        month_cat_totals[key][e.category] = month_cat_totals[key].get(e.category, 0) + e.amount
-
-    for e in shared_expenses:
-        key = e.date.strftime("%Y-%m")
-        share = _user_share(e)
-        month_cat_totals.setdefault(key, {})
-        month_cat_totals[key][e.category] = month_cat_totals[key].get(e.category, 0) + share
+    all_months = month_keys(start_month, today)
+    month_cat_totals = month_totals(db, current_user.id, couple, all_months)
 
     # Monthly breakdown + spending trends
     monthly_breakdown: list[MonthlyBreakdown] = []
     spending_trends: list[TrendPoint] = []
 
-    # Build list of all months in range (even empty ones)
-    cur = date(start_month.year, start_month.month, 1)
-    end = date(today.year, today.month, 1)
-    all_months: list[str] = []
-    while cur <= end:
-        all_months.append(cur.strftime("%Y-%m"))
-        m = cur.month + 1
-        y = cur.year
-        if m > 12:
-            m = 1
-            y += 1
-        cur = date(y, m, 1)
-
     for month_key in all_months:
         cat_totals = month_cat_totals.get(month_key, {})
         total = sum(cat_totals.values())
@@ -202,3 +317,74 @@ def get_reports(
         spending_trends=spending_trends,
         budget_variance=budget_variance,
     )
+
+
+@router.get("/history", response_model=HistoryResponse, dependencies=[Depends(conditional_get)])
+def get_report_history(
+    years: int = Query(5, ge=1, le=10, description="Calendar years to cover, including the current one"),
+    granularity: str = Query("month", description="week / month / quarter / year; weeks cover the last 52 at most"),
+    top: int = Query(5, ge=1, le=20, description="Categories to keep; the rest are folded into 'Other'"),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
+):
+    """Return long-range spending totals at the requested granularity.
+
+    Month, quarter and year points are folded from month-close snapshots, so
+    their cost and size depend on the window, not on how many expenses it
+    holds. Week points are grouped by day in SQL, so they cover at most the
+    last ``WEEK_HISTORY_LIMIT`` weeks whatever ``years`` asks for.
+    """
+    if granularity not in GRANULARITIES:
+        raise HTTPException(status_code=422, detail=f"Granularity must be one of: {', '.join(GRANULARITIES)}")
+
+    today = date.today()
+    start = date(today.year - years + 1, 1, 1)
+    couple = _active_couple(current_user.id, db)
+
+    # period key -> (start date, {category: amount}), in chronological order
+    periods: dict[str, tuple[date, dict[str, float]]] = {}
+    if granularity == "week":
+        this_week = today - timedelta(days=today.weekday())
+        first_monday = max(
+            start - timedelta(days=start.weekday()), this_week - timedelta(weeks=WEEK_HISTORY_LIMIT - 1)
+        )
+        monday = first_monday
+        while monday <= this_week:
+            periods[_week_key(monday)] = (monday, {})
+            monday += timedelta(weeks=1)
+        for day, category, amount in daily_category_totals(db, current_user.id, couple, first_monday):
+            period = periods.get(_week_key(day - timedelta(days=day.weekday())))
+            if period:  # skips future-dated expenses
+                period[1][category] = period[1].get(category, 0) + amount
+    else:
+        months = month_keys(start, today)
+        totals = month_totals(db, current_user.id, couple, months)
+        for key in months:
+            period_key, period_start = _period(key, granularity)
+            cats = periods.setdefault(period_key, (period_start, {}))[1]
+            for category, amount in totals[key].items():
+                cats[category] = cats.get(category, 0) + amount
+
+    folded, names = top_categories({key: cats for key, (_, cats) in periods.items()}, top)
+
+    points: list[HistoryPoint] = []
+    for key, (period_start, _) in periods.items():
+        cat_totals = folded[key]
+        total = sum(cat_totals.values())
+        points.append(
+            HistoryPoint(
+                period=key,
+                start=period_start,
+                total=round(total, 2),
+                categories=[
+                    CategoryAmount(
+                        category=cat,
+                        total=round(amt, 2),
+                        percentage=round(amt / total * 100, 2) if total > 0 else 0,
+                    )
+                    for cat, amt in sorted(cat_totals.items(), key=lambda x: -x[1])
+                ],
+            )
+        )
+
+    return HistoryResponse(granularity=granularity, categories=names, points=points)
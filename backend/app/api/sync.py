@@ -0,0 +1,149 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.deps import get_current_user
+from app.models.user import User
+from app.models.budget import Budget
+from app.models.couple import Couple, SharedExpense, Settlement
+from app.models.expense import Expense, RecurringExpense, UserCategory
+from app.models.sync import SyncTombstone
+from app.services.categories import DEFAULT_CATEGORIES
+from app.services.sync import SyncToken, decode_token, encode_token
+from app.schemas.couple import SharedExpenseResponse, SettlementResponse
+from app.schemas.dashboard import BudgetResponse
+from app.schemas.expense import CategoryResponse
+from app.schemas.sync import SyncDeletion, SyncResponse
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+@router.get("", response_model=SyncResponse)
+def sync(
+    since: Optional[str] = Query(None, description="Token from the previous sync; omit for a full sync"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Return rows created, updated or deleted since the given change token.
+
+    Clients should apply rows as upserts by id and drop the ids listed in
+    ``deleted``. When ``couple_id`` differs from the previous sync, the
+    client should discard its shared data: every shared row is sent again.
+    """
+    previous = decode_token(since)
+    user_id = current_user.id
+    # Counters are read before the rows, so rows written during this sync are sent again next time
+    user_seq = current_user.sync_seq
+
+    def changed(query, model, seq):
+        return query.filter(model.change_seq > seq) if seq is not None else query
+
+    user_since = previous.user_seq if previous else None
+    expenses = changed(db.query(Expense).filter(Expense.user_id == user_id), Expense, user_since).all()
+    recurring = changed(
+        db.query(RecurringExpense).filter(RecurringExpense.user_id == user_id), RecurringExpense, user_since
+    ).all()
+    custom_categories = changed(
+        db.query(UserCategory).filter(UserCategory.user_id == user_id), UserCategory, user_since
+    ).all()
+    budgets = changed(db.query(Budget).filter(Budget.user_id == user_id), Budget, user_since).all()
+
+    couple = (
+        db.query(Couple)
+        .filter(
+            and_(
+                Couple.status == "active",
+                or_(Couple.user_1_id == user_id, Couple.user_2_id == user_id),
+            )
+        )
+        .first()
+    )
+    couple_since = previous.couple_seq if previous and couple and previous.couple_id == couple.id else None
+    token = SyncToken(user_seq, couple.id if couple else 0, couple.sync_seq if couple else 0)
+
+    shared_responses: list[SharedExpenseResponse] = []
+    settlement_responses: list[SettlementResponse] = []
+    if couple:
+        names = dict(
+            db.query(User.id, User.name).filter(User.id.in_([couple.user_1_id, couple.user_2_id])).all()
+        )
+        shared = changed(
+            db.query(SharedExpense).filter(SharedExpense.couple_id == couple.id), SharedExpense, couple_since
+        ).all()
+        shared_responses = [
+            SharedExpenseResponse(
+                id=e.id,
+                couple_id=e.couple_id,
+                paid_by_user_id=e.paid_by_user_id,
+                paid_by_name=names.get(e.paid_by_user_id),
+                amount=e.amount,
+                category=e.category,
+                description=e.description,
+                split_type=e.split_type,
+                split_ratio=e.split_ratio,
+                date=e.date,
+                paid_from_joint=e.paid_from_joint or False,
+                created_at=e.created_at,
+            )
+            for e in shared
+        ]
+        settlements = changed(
+            db.query(Settlement).filter(Settlement.couple_id == couple.id), Settlement, couple_since
+        ).all()
+        settlement_responses = [
+            SettlementResponse(
+                id=s.id,
+                couple_id=s.couple_id,
+                paid_by_user_id=s.paid_by_user_id,
+                paid_to_user_id=s.paid_to_user_id,
+                paid_by_name=names.get(s.paid_by_user_id),
+                paid_to_name=names.get(s.paid_to_user_id),
+                amount=s.amount,
+                note=s.note,
+                created_at=s.created_at,
+            )
+            for s in settlements
+        ]
+
+    deleted: list[SyncDeletion] = []
+    if previous:
+        owner = and_(SyncTombstone.user_id == user_id, SyncTombstone.change_seq > user_since)
+        if couple_since is not None:
+            owner = or_(owner, and_(SyncTombstone.couple_id == couple.id, SyncTombstone.change_seq > couple_since))
+        tombstones = db.query(SyncTombstone.entity, SyncTombstone.entity_id).filter(owner).all()
+        deleted = [SyncDeletion(entity=entity, id=entity_id) for entity, entity_id in tombstones]
+
+    categories = [
+        CategoryResponse(id=c.id, name=c.name, icon=c.icon, color=c.color, is_default=False)
+        for c in custom_categories
+    ]
+    if not previous:
+        categories = [
+            CategoryResponse(name=c["name"], icon=c["icon"], color=c["color"], is_default=True)
+            for c in DEFAULT_CATEGORIES
+        ] + categories
+
+    return SyncResponse(
+        token=encode_token(token),
+        full=previous is None,
+        expenses=expenses,
+        recurring_expenses=recurring,
+        categories=categories,
+        budgets=[
+            BudgetResponse(
+                id=b.id,
+                user_id=b.user_id,
+                category=b.category,
+                monthly_limit=b.monthly_limit,
+                created_at=b.created_at,
+            )
+            for b in budgets
+        ],
+        shared_expenses=shared_responses,
+        settlements=settlement_responses,
+        deleted=deleted,
+        couple_id=couple.id if couple else None,
+    )
@@ -0,0 +1,122 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, false, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.database import get_read_db
+from app.core.deps import get_current_read_user
+from app.core.etag import conditional_get
+from app.models.couple import Couple, SharedExpense
+from app.models.expense import Expense
+from app.models.user import User
+from app.schemas.timeline import TimelineItem, TimelinePage
+from app.services.search import filter_expenses
+from app.services.splits import share_column
+
+router = APIRouter(prefix="/timeline", tags=["Timeline"])
+
+KINDS = ("personal", "shared")
+
+
+def encode_cursor(item: TimelineItem) -> str:
+    return f"{item.date.isoformat()}.{item.kind}.{item.id}"
+
+
+def decode_cursor(cursor: str) -> tuple[date, str, int]:
+    try:
+        day, kind, row_id = cursor.split(".")
+        if kind not in KINDS:
+            raise ValueError(kind)
+        return date.fromisoformat(day), kind, int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid timeline cursor")
+
+
+def _after(model, kind: str, cursor_date: date, cursor_kind: str, cursor_id: int):
+    """Rows of ``model`` (all of ``kind``) that sort strictly after the cursor, descending."""
+    if kind < cursor_kind:
+        return model.date <= cursor_date
+    if kind > cursor_kind:
+        return model.date < cursor_date
+    return or_(model.date < cursor_date, and_(model.date == cursor_date, model.id < cursor_id))
+
+
+@router.get("", response_model=TimelinePage, dependencies=[Depends(conditional_get)])
+def get_timeline(
+    category: Optional[str] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    search: Optional[str] = Query(None),
+    min_amount: Optional[float] = Query(None),
+    max_amount: Optional[float] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; omit for the first page"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_read_user),
+    db: Session = Depends(get_read_db),
+):
+    """Personal and shared expenses in one list, newest first.
+
+    Ordered by (date, kind, id), descending, and paginated by keyset: each
+    page continues strictly after the cursor, so pages stay stable while
+    new expenses are added. Shared expenses carry the caller's share.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    filters = dict(
+        category=category, start_date=start_date, end_date=end_date,
+        search=search, min_amount=min_amount, max_amount=max_amount,
+    )
+
+    def page(model, kind: str, owner_filter, columns):
+        query = select(literal(kind).label("kind"), model.id, model.date, *columns).where(owner_filter)
+        query, _ = filter_expenses(db, query, model, **filters)
+        if after:
+            query = query.where(_after(model, kind, *after))
+        # Each source is cut to one page first, so both can stop early on their (owner, date) index
+        return select(query.order_by(model.date.desc(), model.id.desc()).limit(limit + 1).subquery())
+
+    branches = [
+        page(
+            Expense, "personal", Expense.user_id == current_user.id,
+            (
+                Expense.category, Expense.description, Expense.amount,
+                Expense.amount.label("user_share"), Expense.user_id.label("paid_by_user_id"),
+                false().label("paid_from_joint"), Expense.created_at,
+            ),
+        )
+    ]
+
+    couple = (
+        db.query(Couple)
+        .filter(
+            and_(
+                Couple.status == "active",
+                or_(Couple.user_1_id == current_user.id, Couple.user_2_id == current_user.id),
+            )
+        )
+        .first()
+    )
+    if couple:
+        branches.append(
+            page(
+                SharedExpense, "shared", SharedExpense.couple_id == couple.id,
+                (
+                    SharedExpense.category, SharedExpense.description, SharedExpense.amount,
+                    share_column(couple, current_user.id).label("user_share"), SharedExpense.paid_by_user_id,
+                    func.coalesce(SharedExpense.paid_from_joint, False).label("paid_from_joint"),
+                    SharedExpense.created_at,
+                ),
+            )
+        )
+
+    merged = union_all(*branches).subquery() if len(branches) > 1 else branches[0].subquery()
+    rows = db.execute(
+        select(merged)
+        .order_by(merged.c.date.desc(), merged.c.kind.desc(), merged.c.id.desc())
+        .limit(limit + 1)
+    ).all()
+
+    items = [TimelineItem(**row._mapping) for row in rows[:limit]]
+    next_cursor = encode_cursor(items[-1]) if len(rows) > limit else None
+    return TimelinePage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,47 @@
+"""Response compression and JSON serialization setup.
+
+Brotli is used when ``brotli-asgi`` is installed (falling back to gzip for
+clients that don't accept ``br``), otherwise Starlette's gzip middleware.
+Responses smaller than ``COMPRESSION_MIN_SIZE`` are sent as-is, and the
+Server-Sent Events stream is never compressed because compressors buffer
+small writes.
+"""
+
+from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import GZipMiddleware
+
+UNCOMPRESSED_PREFIXES = ("/api/events/",)
+
+
+def default_response_class(fast_json: bool) -> type[JSONResponse]:
+    """ORJSONResponse when enabled and orjson is installed, else the stdlib encoder."""
+    if fast_json:
+        try:
+            import orjson  # noqa: F401
+            from fastapi.responses import ORJSONResponse
+
+            return ORJSONResponse
+        except ImportError:
+            pass
+    return JSONResponse
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: int = 1024, brotli: bool = True):
+        self.app = app
+        self.compressed = None
+        if brotli:
+            try:
+                from brotli_asgi import BrotliMiddleware
+
+                self.compressed = BrotliMiddleware(app, quality=4, minimum_size=minimum_size)
+            except ImportError:
+                pass
+        if self.compressed is None:
+            self.compressed = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not scope["path"].startswith(UNCOMPRESSED_PREFIXES):
+            await self.compressed(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
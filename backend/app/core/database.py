@@ -1,12 +1,55 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+"""Engines and sessions.
+
+Writes go to the primary (``DATABASE_URL``). When ``DATABASE_REPLICA_URL``
+is set, read-only endpoints take their session from ``get_read_db`` and
+send their queries to the replica instead; without it both engines are
+the same. ``get_current_read_user`` keeps a user on the primary for
+``REPLICA_STICKY_SECONDS`` after anything they can see changed, so they
+always read their own writes.
+"""
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 
 from app.core.config import get_settings
+from app.core.metrics import query_finished, query_started
 
 settings = get_settings()
 
 engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+replica_engine = (
+    create_engine(settings.DATABASE_REPLICA_URL, pool_pre_ping=True) if settings.DATABASE_REPLICA_URL else engine
+)
+for _engine in {engine, replica_engine}:
+    event.listen(_engine, "before_cursor_execute", query_started)
+    event.listen(_engine, "after_cursor_execute", query_finished)
+
+
+class RoutingSession(Session):
+    """Session that reads from the replica while ``info["replica"]`` is set.
+
+    Flushes always go to the primary. So does anything that may write:
+    a statement other than a plain SELECT (``text()`` included, e.g.
+    ``pg_notify``), or any statement while ORM changes are pending. The
+    first such statement pins the session to the primary, so it reads its
+    own writes from then on.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("replica"):
+            # new/dirty/deleted keep their pre-flush contents until a flush completes
+            pending = self.new or self.dirty or self.deleted
+            if not pending and (clause is None or clause.is_select):
+                return replica_engine
+            self.use_primary()
+        return engine
+
+    def use_primary(self) -> None:
+        """Send the rest of this session's statements to the primary; call before a read-only endpoint writes."""
+        self.info["replica"] = False
+
+
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
 
 
 class Base(DeclarativeBase):
@@ -19,3 +62,12 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """Session for read-only endpoints; pair it with ``get_current_read_user``."""
+    db = SessionLocal(info={"replica": True})
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,18 +1,20 @@
+from datetime import datetime, timedelta, timezone
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.config import get_settings
+from app.core.database import get_db, get_read_db
 from app.core.security import decode_access_token
 from app.models.user import User
 
+settings = get_settings()
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+def _authenticate(token: str, db: Session) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -27,7 +29,42 @@ def get_current_user(
         raise credentials_exception
 
     user = db.query(User).filter(User.id == int(user_id)).first()
-    if user is None:
+    # Inactive users are awaiting background deletion
+    if user is None or not user.is_active:
         raise credentials_exception
 
     return user
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    return _authenticate(token, db)
+
+
+def recently_changed(user: User) -> bool:
+    """Whether the user's data changed within REPLICA_STICKY_SECONDS, so a replica may not have it yet."""
+    changed = user.data_changed_at
+    if changed is None:
+        return False
+    if changed.tzinfo is None:
+        changed = changed.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - changed < timedelta(seconds=settings.REPLICA_STICKY_SECONDS)
+
+
+def get_current_read_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_read_db),
+) -> User:
+    """``get_current_user`` for read-only endpoints using ``get_read_db``.
+
+    The user is loaded from the primary, so ``data_version`` (and the ETag
+    built from it) is current. The rest of the request reads from the
+    replica unless the user's data changed within REPLICA_STICKY_SECONDS,
+    in which case it stays on the primary.
+    """
+    db.info["replica"] = False
+    user = _authenticate(token, db)
+    db.info["replica"] = not recently_changed(user)
+    return user
@@ -0,0 +1,64 @@
+"""Conditional GET support for read endpoints.
+
+``conditional_get`` is added to a route's dependencies. It builds a weak
+ETag from the caller's data version counter (see
+``app.services.data_version``), the request URL and today's date, and
+answers a matching ``If-None-Match`` with 304 before the endpoint runs any
+queries. ``ETagMiddleware`` attaches the ETag to the endpoint's response.
+Routes using it are read-only and take ``get_read_db`` /
+``get_current_read_user``.
+"""
+
+import zlib
+from datetime import date
+
+from fastapi import Depends, HTTPException, Request, status
+
+from app.core.deps import get_current_read_user
+from app.models.user import User
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(request: Request, user: User) -> str:
+    # Date is included because dashboards and reports are relative to today
+    target = f"{request.url.path}?{request.url.query}".encode("utf-8")
+    return f'W/"{user.id}-{user.data_version}-{date.today().isoformat()}-{zlib.crc32(target):08x}"'
+
+
+def conditional_get(request: Request, current_user: User = Depends(get_current_read_user)) -> None:
+    etag = compute_etag(request, current_user)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Authorization"},
+        )
+    request.state.etag = etag
+
+
+class ETagMiddleware:
+    """Add the ETag computed by ``conditional_get`` to successful responses."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                etag = scope.get("state", {}).get("etag")
+                if etag:
+                    headers = list(message.get("headers", []))
+                    headers += [
+                        (b"etag", etag.encode("latin-1")),
+                        (b"cache-control", CACHE_CONTROL.encode("latin-1")),
+                        (b"vary", b"Authorization"),
+                    ]
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,181 @@
+"""Live change events pushed to clients over Server-Sent Events.
+
+Write paths call ``publish`` with the users affected by a change. On
+PostgreSQL the event is sent with ``pg_notify`` inside the writer's
+transaction, so it is only delivered if the transaction commits, and every
+worker's LISTEN thread fans it out to the SSE streams it holds. On other
+databases (local SQLite) events are dispatched in-process after commit.
+"""
+
+import asyncio
+import json
+import logging
+import select
+import threading
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "splitmint_events"
+_QUEUE_SIZE = 100
+_PENDING_KEY = "pending_events"
+
+
+class EventBroker:
+    """Per-process registry of SSE subscriber queues, keyed by user id."""
+
+    def __init__(self):
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+        self._listeners: list[Callable[[dict], None]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        with self._lock:
+            queues = self._subscribers.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[user_id]
+
+    def add_listener(self, listener: Callable[[dict], None]) -> None:
+        """Register a callback run for every event seen by this process."""
+        self._listeners.append(listener)
+
+    def dispatch(self, message: dict) -> None:
+        """Deliver a message to local subscribers. Safe to call from any thread."""
+        for listener in self._listeners:
+            try:
+                listener(message)
+            except Exception:
+                logger.exception("Event listener failed")
+
+        if self._loop is None:
+            return
+        payload = {"type": message["type"], "data": message.get("data") or {}}
+        with self._lock:
+            queues = [
+                q for user_id in message.get("users", []) for q in self._subscribers.get(user_id, ())
+            ]
+        for queue in queues:
+            self._loop.call_soon_threadsafe(_offer, queue, payload)
+
+
+def _offer(queue: asyncio.Queue, payload: dict) -> None:
+    # A full queue means the client is not reading; it will resync on reconnect
+    try:
+        queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        pass
+
+
+broker = EventBroker()
+
+
+# ─── Publishing ──────────────────────────────────────────────────────────────
+
+def publish(db: Session, user_ids: Iterable[int], event_type: str, data: Optional[dict[str, Any]] = None) -> None:
+    """Queue an event for the given users; it is delivered when ``db`` commits."""
+    message = {"type": event_type, "users": sorted(set(user_ids)), "data": data or {}}
+    if not message["users"]:
+        return
+    # NOTIFY is a write: it must reach the primary even from a read session
+    if engine.dialect.name == "postgresql":
+        db.use_primary()
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CHANNEL, "payload": json.dumps(message, default=str)},
+        )
+    else:
+        db.info.setdefault(_PENDING_KEY, []).append(message)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _dispatch_pending(session: Session) -> None:
+    for message in session.info.pop(_PENDING_KEY, []):
+        broker.dispatch(message)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ─── LISTEN/NOTIFY fan-out ───────────────────────────────────────────────────
+
+class NotificationListener(threading.Thread):
+    """Background thread that relays PostgreSQL notifications to the broker."""
+
+    def __init__(self, dsn: str):
+        super().__init__(name="event-listener", daemon=True)
+        self._dsn = dsn
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        import psycopg2
+
+        backoff = 1.0
+        while not self._stop_event.is_set():
+            try:
+                conn = psycopg2.connect(self._dsn)
+                conn.set_session(autocommit=True)
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {CHANNEL}")
+                backoff = 1.0
+                self._listen(conn)
+            except Exception:
+                logger.exception("Event listener connection lost, retrying in %.0fs", backoff)
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _listen(self, conn) -> None:
+        try:
+            while not self._stop_event.is_set():
+                if select.select([conn], [], [], 5.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    try:
+                        broker.dispatch(json.loads(notify.payload))
+                    except ValueError:
+                        logger.warning("Ignoring malformed event payload")
+        finally:
+            conn.close()
+
+
+_listener: Optional[NotificationListener] = None
+
+
+def start_event_listener() -> None:
+    global _listener
+    broker.attach(asyncio.get_running_loop())
+    if engine.dialect.name != "postgresql" or _listener is not None:
+        return
+    dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    _listener = NotificationListener(dsn)
+    _listener.start()
+
+
+def stop_event_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,161 @@
+"""Per-request SQL instrumentation and Prometheus metrics.
+
+``app.core.database`` hooks ``query_started``/``query_finished`` into the
+engine's cursor events. While a request is in flight, ``MetricsMiddleware``
+keeps a ``RequestStats`` in a context variable, so each statement is
+counted against the route that issued it. Statements slower than
+``SLOW_QUERY_MS`` are logged with their route.
+
+Histograms are kept per process; with several uvicorn workers each worker
+reports its own series. ``/metrics`` is not proxied by nginx.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Optional
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+ROWS_BUCKETS = (1, 10, 100, 1000, 10000, 100000)
+
+
+class RequestStats:
+    __slots__ = ("scope", "queries", "db_time", "rows")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.queries = 0
+        self.db_time = 0.0
+        self.rows = 0
+
+    @property
+    def route(self) -> str:
+        # Set by the router once matched; the template keeps label cardinality bounded
+        route = self.scope.get("route")
+        return route.path if route is not None else "unmatched"
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+# ─── Engine hooks ────────────────────────────────────────────────────────────
+
+def query_started(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def query_finished(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+        # psycopg2 reports the row count of a SELECT up front; sqlite3 reports -1
+        if cursor.description is not None and cursor.rowcount > 0:
+            stats.rows += cursor.rowcount
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s",
+            elapsed * 1000,
+            stats.route if stats else "-",
+            " ".join(statement.split())[:500],
+        )
+
+
+# ─── Histograms ──────────────────────────────────────────────────────────────
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+            for i in range(bisect_left(self.buckets, value), len(self.buckets)):
+                series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted(self._series.items())
+        for (method, route), series in items:
+            base = f'method="{method}",route="{route}"'
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{base},le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{base}}} {series[-2]}")
+            lines.append(f"{self.name}_count{{{base}}} {series[-1]}")
+        return lines
+
+
+REQUEST_LATENCY = Histogram("splitmint_request_duration_seconds", "Request latency by route.", LATENCY_BUCKETS)
+REQUEST_DB_TIME = Histogram("splitmint_request_db_seconds", "Time spent in SQL per request.", LATENCY_BUCKETS)
+REQUEST_QUERIES = Histogram("splitmint_request_queries", "SQL statements per request.", COUNT_BUCKETS)
+REQUEST_ROWS = Histogram("splitmint_request_rows_fetched", "Rows fetched per request.", ROWS_BUCKETS)
+HISTOGRAMS = (REQUEST_LATENCY, REQUEST_DB_TIME, REQUEST_QUERIES, REQUEST_ROWS)
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for histogram in HISTOGRAMS:
+        lines.extend(histogram.render())
+    return "\n".join(lines) + "\n"
+
+
+# ─── Middleware ──────────────────────────────────────────────────────────────
+
+class MetricsMiddleware:
+    """Collect per-request stats; optionally report them in ``X-Query-Count``."""
+
+    def __init__(self, app, query_count_header: bool = False):
+        self.app = app
+        self.query_count_header = query_count_header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _current.set(stats)
+        start = time.perf_counter()
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and self.query_count_header:
+                headers = list(message.get("headers", []))
+                headers += [
+                    (b"x-query-count", str(stats.queries).encode("latin-1")),
+                    (b"x-db-time-ms", f"{stats.db_time * 1000:.1f}".encode("latin-1")),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current.reset(token)
+            labels = (scope["method"], stats.route)
+            REQUEST_LATENCY.observe(labels, time.perf_counter() - start)
+            REQUEST_DB_TIME.observe(labels, stats.db_time)
+            REQUEST_QUERIES.observe(labels, stats.queries)
+            REQUEST_ROWS.observe(labels, stats.rows)
@@ -0,0 +1,62 @@
+"""Move history older than ARCHIVE_AFTER_MONTHS into Parquet cold storage.
+
+Run from ``backend/`` monthly, after ``close_months``:
+
+    python -m app.jobs.archive_history
+
+Months before the archive cutoff are snapshotted first, so reports keep
+reading them from snapshots. Rows are then moved table by table, one
+owner and year at a time, each in its own transaction. Re-running after
+an interruption is safe.
+"""
+
+import argparse
+from datetime import date
+
+from sqlalchemy import func
+
+from app.core.config import MIN_ARCHIVE_MONTHS, get_settings
+from app.core.database import SessionLocal
+from app.models import user, expense, couple, budget, sync, report  # noqa
+from app.models.couple import SharedExpense
+from app.models.expense import Expense
+from app.services.archive import ARCHIVED_TABLES, archive_cutoff, archive_group, archive_groups
+from app.services.snapshots import close_month, month_key
+
+
+def months_before(first: date, cutoff: date) -> list[tuple[int, int]]:
+    """Every (year, month) from ``first``'s month up to, not including, ``cutoff``'s."""
+    start = first.year * 12 + first.month - 1
+    end = cutoff.year * 12 + cutoff.month - 1
+    return [(i // 12, i % 12 + 1) for i in range(start, end)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    if not get_settings().ARCHIVE_AFTER_MONTHS:
+        parser.error(f"set ARCHIVE_AFTER_MONTHS to at least {MIN_ARCHIVE_MONTHS} to enable archival")
+    cutoff = archive_cutoff()
+
+    db = SessionLocal()
+    try:
+        oldest = [
+            d for d in (db.query(func.min(Expense.date)).scalar(), db.query(func.min(SharedExpense.date)).scalar()) if d
+        ]
+        if oldest:
+            for year, month in months_before(min(oldest), cutoff):
+                written = close_month(db, year, month)
+                db.commit()
+                if written:
+                    print(f"{month_key(year, month)}: {written} snapshots")
+
+        for table in ARCHIVED_TABLES:
+            moved = sum(archive_group(db, table, owner_id, year, cutoff) for owner_id, year in archive_groups(db, table, cutoff))
+            print(f"{table}: {moved} rows archived before {cutoff.isoformat()}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Freeze closed months into report snapshots.
+
+Run from ``backend/`` shortly after each month end, and ideally daily so
+months re-opened by back-dated writes are frozen again:
+
+    python -m app.jobs.close_months [--months 120]
+
+Every month in the window except the current one is closed for each user
+who has no snapshot for it yet; existing snapshots are left alone. Run it
+when write traffic is low: a back-dated write that commits while a month
+is being closed can leave that month's snapshot without it until the
+write's month is touched again. Months before the archive cutoff are
+skipped: their rows are in cold storage (``app.jobs.archive_history``).
+Budget spend rollups (``category_spend``) of past months are dropped.
+"""
+
+import argparse
+from datetime import date
+
+from app.core.database import SessionLocal
+from app.models import user, expense, couple, budget, sync, report  # noqa
+from app.models.budget import CategorySpend
+from app.services.archive import archive_cutoff
+from app.services.snapshots import close_month, month_key
+
+
+def closed_months(today: date, count: int) -> list[tuple[int, int]]:
+    """The ``count`` months before ``today``'s month, oldest first."""
+    index = today.year * 12 + today.month - 1
+    return [(i // 12, i % 12 + 1) for i in range(index - count, index)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months", type=int, default=120, help="closed months to check (report history covers 10 years)")
+    args = parser.parse_args()
+
+    cutoff = archive_cutoff()
+    db = SessionLocal()
+    try:
+        for year, month in closed_months(date.today(), args.months):
+            if cutoff and date(year, month, 1) < cutoff:
+                continue
+            written = close_month(db, year, month)
+            db.commit()
+            if written:
+                print(f"{month_key(year, month)}: {written} snapshots")
+
+        today = date.today()
+        dropped = (
+            db.query(CategorySpend)
+            .filter(CategorySpend.year * 12 + CategorySpend.month < today.year * 12 + today.month)
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        if dropped:
+            print(f"{dropped} past-month spend rollups dropped")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Create upcoming yearly partitions for expenses and shared expenses.
+
+Run from ``backend/`` monthly (PostgreSQL only; a no-op elsewhere):
+
+    python -m app.jobs.create_partitions [--years-ahead 1] [--detach-before 2016]
+
+Partitions are created for the current year and ``--years-ahead`` years
+after it. Rows that landed in the DEFAULT partition for those years are
+moved into the new partition. ``--detach-before`` detaches the partitions
+of earlier years, leaving them as plain tables to archive or drop.
+"""
+
+import argparse
+from datetime import date
+
+from app.core.database import SessionLocal
+from app.services.partitions import (
+    PARTITIONED_TABLES, attached_partitions, create_year_partition, detach_year_partition,
+    is_partitioned, partition_name,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years-ahead", type=int, default=1, help="future years to create partitions for")
+    parser.add_argument("--detach-before", type=int, default=None, help="detach partitions for years before this one")
+    args = parser.parse_args()
+
+    this_year = date.today().year
+    db = SessionLocal()
+    try:
+        for table in PARTITIONED_TABLES:
+            if not is_partitioned(db, table):
+                print(f"{table}: not partitioned, skipping")
+                continue
+            for year in range(this_year, this_year + args.years_ahead + 1):
+                if create_year_partition(db, table, year):
+                    db.commit()
+                    print(f"{partition_name(table, year)}: created")
+            if args.detach_before is not None:
+                attached = attached_partitions(db, table)
+                years = sorted(
+                    int(name.rsplit("_y", 1)[1]) for name in attached if name.startswith(f"{table}_y")
+                )
+                for year in years:
+                    if year < args.detach_before and detach_year_partition(db, table, year):
+                        db.commit()
+                        print(f"{partition_name(table, year)}: detached")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
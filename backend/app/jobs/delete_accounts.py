@@ -0,0 +1,46 @@
+"""Finish account deletions that did not complete.
+
+Deletions normally run in the API process right after ``DELETE
+/api/auth/me`` responds. Run this from ``backend/`` periodically (hourly
+is plenty) to resume jobs lost to a restart and retry failed ones:
+
+    python -m app.jobs.delete_accounts [--min-age 30]
+
+Jobs younger than ``--min-age`` minutes are skipped, as they may still be
+running in an API worker.
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from app.core.database import SessionLocal
+from app.models import user, expense, couple, budget, salary, sync, report  # noqa
+from app.models.user import AccountDeletion
+from app.services.account_deletion import run_deletion
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-age", type=int, default=30, help="minutes before an unfinished job is retried")
+    args = parser.parse_args()
+
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=args.min_age)
+    db = SessionLocal()
+    try:
+        job_ids = [
+            job_id
+            for (job_id,) in db.query(AccountDeletion.id).filter(
+                AccountDeletion.status != "done",
+                AccountDeletion.created_at < cutoff,
+            )
+        ]
+    finally:
+        db.close()
+
+    for job_id in job_ids:
+        run_deletion(job_id)
+        print(f"{job_id}: retried")
+
+
+if __name__ == "__main__":
+    main()
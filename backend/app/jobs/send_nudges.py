@@ -0,0 +1,98 @@
+"""Send the monthly budget and savings nudges.
+
+Run from ``backend/`` hourly (e.g. from cron):
+
+    python -m app.jobs.send_nudges
+
+Each active user with a monthly budget or income has their spend this
+month (personal plus their share of shared) checked against it: past 80%
+of the budget they get a budget alert, and from the 15th a savings alert
+while they are saving less than 20% of their income. A nudge is sent at
+most once a day. Per-category budget warnings are raised at write time
+by ``app.services.budget_alerts`` instead.
+"""
+
+import argparse
+from datetime import date
+
+from sqlalchemy import func, or_
+
+from app.core.database import SessionLocal
+from app.models import user, expense, couple, budget, salary, sync, report  # noqa
+from app.models.couple import Couple, SharedExpense
+from app.models.expense import Expense
+from app.models.user import User
+from app.services.budget_alerts import create_notification_if_new
+from app.services.partitions import month_bounds
+
+
+def month_spend(db, today: date) -> dict[int, float]:
+    """``{user_id: spend}`` for the current month, summed for every user at once."""
+    month_start, next_month = month_bounds(today)
+    spend: dict[int, float] = {
+        user_id: float(total)
+        for user_id, total in db.query(Expense.user_id, func.sum(Expense.amount))
+        .filter(Expense.date >= month_start, Expense.date < next_month)
+        .group_by(Expense.user_id)
+    }
+    shared = (
+        db.query(Couple.user_1_id, Couple.user_2_id, func.sum(SharedExpense.user_1_share), func.sum(SharedExpense.user_2_share))
+        .join(SharedExpense, SharedExpense.couple_id == Couple.id)
+        .filter(Couple.status == "active", SharedExpense.date >= month_start, SharedExpense.date < next_month)
+        .group_by(Couple.id, Couple.user_1_id, Couple.user_2_id)
+    )
+    for user_1_id, user_2_id, user_1_total, user_2_total in shared:
+        spend[user_1_id] = spend.get(user_1_id, 0.0) + float(user_1_total)
+        spend[user_2_id] = spend.get(user_2_id, 0.0) + float(user_2_total)
+    return spend
+
+
+def send_nudges(db, user: User, month_expenses: float, today: date) -> None:
+    """Create the user's nudges for this month's spend, unless already sent today."""
+    # 1. Overall budget warning (80% of monthly budget)
+    if user.monthly_budget > 0 and month_expenses >= user.monthly_budget * 0.8:
+        create_notification_if_new(
+            db,
+            user.id,
+            "Budget Alert ⚠️",
+            f"You've spent ₹{month_expenses:,.0f} of your ₹{user.monthly_budget:,.0f} monthly budget ({month_expenses/user.monthly_budget*100:.0f}%).",
+            "budget_warning",
+            today,
+        )
+
+    # 2. Savings below target
+    if user.monthly_income > 0:
+        savings_rate = (user.monthly_income - month_expenses) / user.monthly_income * 100
+        if savings_rate < 20 and today.day >= 15:
+            create_notification_if_new(
+                db,
+                user.id,
+                "Savings Alert 💰",
+                f"Your savings rate is only {savings_rate:.0f}% this month. Consider reducing discretionary spending.",
+                "savings_alert",
+                today,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    today = date.today()
+    db = SessionLocal()
+    try:
+        spend = month_spend(db, today)
+        users = (
+            db.query(User)
+            .filter(User.is_active == True, or_(User.monthly_budget > 0, User.monthly_income > 0))
+            .all()
+        )
+        for user in users:
+            send_nudges(db, user, spend.get(user.id, 0.0), today)
+        db.commit()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
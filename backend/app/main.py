@@ -1,15 +1,24 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from app.core.compression import CompressionMiddleware, default_response_class
 from app.core.config import get_settings
 from app.core.database import engine, Base
-from app.api import auth, expenses, couple, budgets, dashboard, reports, salary
+from app.core.etag import ETagMiddleware
+from app.core.events import start_event_listener, stop_event_listener
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.api import auth, expenses, couple, budgets, dashboard, reports, salary, events, sync, timeline
 
 # Import all models so they register with Base
 from app.models import user, expense, couple as couple_models, budget  # noqa
 from app.models.expense import RecurringExpense, UserCategory  # noqa
 from app.models.couple import Settlement  # noqa
 from app.models.salary import SalaryCredit  # noqa
+from app.models.sync import SyncTombstone  # noqa
+from app.models.report import MonthlySnapshot, MonthlySnapshotCategory  # noqa
+from app.services import data_version  # noqa  (registers version bump hook)
+from app.services import splits  # noqa  (stores split shares on write)
 
 settings = get_settings()
 
@@ -19,6 +28,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=default_response_class(settings.FAST_JSON),
 )
 
 # CORS
@@ -37,6 +47,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ETag / conditional GET for versioned read endpoints
+app.add_middleware(ETagMiddleware)
+
+# Per-route latency and SQL statement counts
+app.add_middleware(MetricsMiddleware, query_count_header=settings.QUERY_COUNT_HEADER)
+
+# Compression — added last so it is the outermost layer
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    brotli=settings.BROTLI,
+)
+
 # Create tables (dev only — use Alembic in production)
 if settings.DEBUG:
     Base.metadata.create_all(bind=engine)
@@ -49,6 +72,19 @@ app.include_router(budgets.router, prefix="/api")
 app.include_router(dashboard.router, prefix="/api")
 app.include_router(reports.router, prefix="/api")
 app.include_router(salary.router, prefix="/api")
+app.include_router(events.router, prefix="/api")
+app.include_router(sync.router, prefix="/api")
+app.include_router(timeline.router, prefix="/api")
+
+
+@app.on_event("startup")
+async def startup():
+    start_event_listener()
+
+
+@app.on_event("shutdown")
+def shutdown():
+    stop_event_listener()
 
 
 @app.get("/")
@@ -60,6 +96,12 @@ def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    # Prometheus text exposition format; not proxied by nginx
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/health")
 def health():
     return {"status": "healthy"}
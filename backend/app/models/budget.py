@@ -1,29 +1,59 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index, UniqueConstraint
 
 from app.core.database import Base
+from app.models.types import Money
 
 
 class Budget(Base):
     __tablename__ = "budgets"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     category = Column(String(50), nullable=False)
-    monthly_limit = Column(Float, nullable=False)
+    monthly_limit = Column(Money(), nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")  # user's sync_seq at the last write
+
+    __table_args__ = (
+        Index("ix_budgets_user_change", "user_id", "change_seq"),
+    )
+
+
+class CategorySpend(Base):
+    """A user's spend in one category and month: personal plus their share of shared.
+
+    Kept for the current month by ``app.services.budget_alerts``, which
+    adds every reported change to it so budget thresholds are evaluated
+    without summing the month. A row is seeded from the expense tables the
+    first time its category is touched in a month; the month-close job
+    drops rows for past months.
+    """
+
+    __tablename__ = "category_spend"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    category = Column(String(50), nullable=False)
+    amount = Column(Money(), nullable=False, default=0.0)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", "month", "category", name="uq_category_spend_user_month_category"),
+    )
 
 
 class Notification(Base):
     __tablename__ = "notifications"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String(200), nullable=False)
     message = Column(String(500), nullable=False)
     notification_type = Column(String(50), nullable=False)  # budget_warning, monthly_summary, savings_alert, imbalance_alert
@@ -1,16 +1,18 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Date, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Date, Text, Boolean, Index
 
 from app.core.database import Base
+from app.models.types import Money
 
 
 class Couple(Base):
     __tablename__ = "couples"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_1_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    user_2_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_1_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_2_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     status = Column(String(20), default="pending")  # pending / active / dissolved
+    sync_seq = Column(Integer, nullable=False, default=0, server_default="0")  # delta sync change counter for shared rows
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
 
@@ -18,38 +20,63 @@ class SharedExpense(Base):
     __tablename__ = "shared_expenses"
 
     id = Column(Integer, primary_key=True, index=True)
-    couple_id = Column(Integer, ForeignKey("couples.id"), nullable=False, index=True)
-    paid_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    amount = Column(Float, nullable=False)
+    couple_id = Column(Integer, ForeignKey("couples.id", ondelete="CASCADE"), nullable=False, index=True)
+    paid_by_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    amount = Column(Money(), nullable=False)
     category = Column(String(50), nullable=False)
     description = Column(Text, nullable=True)
     split_type = Column(String(20), nullable=False, default="equal")  # equal / percentage / custom
     split_ratio = Column(String(20), nullable=False, default="50:50")  # e.g. "50:50", "60:40", "3000:7000"
     date = Column(Date, nullable=False)
     paid_from_joint = Column(Boolean, default=False)  # True = deducted from joint account
+    # Parsed from split_ratio on every write (app.services.splits)
+    user_1_share = Column(Money(), nullable=False, default=0.0, server_default="0")
+    user_2_share = Column(Money(), nullable=False, default=0.0, server_default="0")
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")  # couple's sync_seq at the last write
+
+    # PostgreSQL also has a GIN full-text index on description + category (migration 010)
+    __table_args__ = (
+        Index("ix_shared_expenses_couple_change", "couple_id", "change_seq"),
+        Index("ix_shared_expenses_couple_date", "couple_id", "date"),
+    )
 
 
 class Settlement(Base):
     __tablename__ = "settlements"
 
     id = Column(Integer, primary_key=True, index=True)
-    couple_id = Column(Integer, ForeignKey("couples.id"), nullable=False, index=True)
-    paid_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    paid_to_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    amount = Column(Float, nullable=False)
+    couple_id = Column(Integer, ForeignKey("couples.id", ondelete="CASCADE"), nullable=False, index=True)
+    paid_by_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    paid_to_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    amount = Column(Money(), nullable=False)
     note = Column(Text, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")  # couple's sync_seq at the last write
+
+    __table_args__ = (
+        Index("ix_settlements_couple_change", "couple_id", "change_seq"),
+    )
 
 
 class SavingsGoal(Base):
     __tablename__ = "savings_goals"
 
     id = Column(Integer, primary_key=True, index=True)
-    couple_id = Column(Integer, ForeignKey("couples.id"), nullable=False, index=True)
+    couple_id = Column(Integer, ForeignKey("couples.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String(200), nullable=False)
-    target_amount = Column(Float, nullable=False)
-    current_amount = Column(Float, default=0.0)
+    target_amount = Column(Money(), nullable=False)
+    current_amount = Column(Money(), default=0.0)
     deadline = Column(Date, nullable=True)
     is_completed = Column(Boolean, default=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -59,9 +86,9 @@ class SavingsContribution(Base):
     __tablename__ = "savings_contributions"
 
     id = Column(Integer, primary_key=True, index=True)
-    goal_id = Column(Integer, ForeignKey("savings_goals.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    amount = Column(Float, nullable=False)
+    goal_id = Column(Integer, ForeignKey("savings_goals.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    amount = Column(Money(), nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
 
@@ -71,7 +98,7 @@ class JointAccount(Base):
     __tablename__ = "joint_accounts"
 
     id = Column(Integer, primary_key=True, index=True)
-    couple_id = Column(Integer, ForeignKey("couples.id"), nullable=False, unique=True, index=True)
+    couple_id = Column(Integer, ForeignKey("couples.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
     account_name = Column(String(100), default="Joint Account")
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -81,9 +108,9 @@ class JointAccountContribution(Base):
     __tablename__ = "joint_account_contributions"
 
     id = Column(Integer, primary_key=True, index=True)
-    joint_account_id = Column(Integer, ForeignKey("joint_accounts.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    amount = Column(Float, nullable=False)
+    joint_account_id = Column(Integer, ForeignKey("joint_accounts.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    amount = Column(Money(), nullable=False)
     contribution_type = Column(String(30), nullable=False, default="salary")  # salary / bonus / savings / other / withdrawal
     note = Column(Text, nullable=True)
     date = Column(Date, nullable=False)
@@ -94,9 +121,11 @@ class JointAccountTransaction(Base):
     __tablename__ = "joint_account_transactions"
 
     id = Column(Integer, primary_key=True, index=True)
-    joint_account_id = Column(Integer, ForeignKey("joint_accounts.id"), nullable=False, index=True)
-    shared_expense_id = Column(Integer, ForeignKey("shared_expenses.id"), nullable=True, index=True)
-    amount = Column(Float, nullable=False)  # positive = debit (expense), negative = credit (refund)
+    joint_account_id = Column(Integer, ForeignKey("joint_accounts.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Not a foreign key: PostgreSQL cannot reference the partitioned shared_expenses by id alone
+    # (migration 013). Deleting a shared expense deletes its transaction explicitly.
+    shared_expense_id = Column(Integer, nullable=True, index=True)
+    amount = Column(Money(), nullable=False)  # positive = debit (expense), negative = credit (refund)
     description = Column(Text, nullable=True)
     date = Column(Date, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
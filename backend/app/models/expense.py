@@ -1,41 +1,66 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Date, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Date, Text, Boolean, Index, func
 
 from app.core.database import Base
+from app.models.types import Money
 
 
 class UserCategory(Base):
     __tablename__ = "user_categories"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(50), nullable=False)
     icon = Column(String(10), nullable=False, default="📌")
     color = Column(String(10), nullable=False, default="#6b7280")
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")  # user's sync_seq at the last write
+
+    __table_args__ = (
+        Index("ix_user_categories_user_change", "user_id", "change_seq"),
+        # Names are unique per user, ignoring case
+        Index("uq_user_categories_user_lower_name", user_id, func.lower(name), unique=True),
+    )
 
 
 class Expense(Base):
     __tablename__ = "expenses"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    amount = Column(Float, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    amount = Column(Money(), nullable=False)
     category = Column(String(50), nullable=False)
     expense_type = Column(String(20), nullable=False, default="personal")  # personal / shared
     date = Column(Date, nullable=False)
     description = Column(Text, nullable=True)
     is_recurring = Column(Boolean, default=False)
-    recurring_id = Column(Integer, ForeignKey("recurring_expenses.id"), nullable=True)
+    recurring_id = Column(Integer, ForeignKey("recurring_expenses.id", ondelete="SET NULL"), nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")  # user's sync_seq at the last write
+
+    # PostgreSQL also has a GIN full-text index on description + category (migration 010)
+    __table_args__ = (
+        Index("ix_expenses_user_change", "user_id", "change_seq"),
+        Index("ix_expenses_user_date", "user_id", "date"),
+    )
 
 
 class RecurringExpense(Base):
     __tablename__ = "recurring_expenses"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    amount = Column(Float, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    amount = Column(Money(), nullable=False)
     category = Column(String(50), nullable=False)
     description = Column(Text, nullable=True)
     frequency = Column(String(20), nullable=False, default="monthly")  # monthly / weekly / yearly
@@ -46,3 +71,13 @@ class RecurringExpense(Base):
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")  # user's sync_seq at the last write
+
+    __table_args__ = (
+        Index("ix_recurring_expenses_user_change", "user_id", "change_seq"),
+    )
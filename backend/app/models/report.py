@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint
+
+from app.core.database import Base
+from app.models.types import Money
+
+
+class MonthlySnapshot(Base):
+    """Frozen spend totals for one user and one closed month.
+
+    Written by the month-close job (``python -m app.jobs.close_months``) and
+    deleted when a back-dated write touches the month; reports compute
+    months without a snapshot live.
+    """
+
+    __tablename__ = "monthly_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)  # 1-12
+    personal_total = Column(Money(), nullable=False, default=0.0)
+    shared_total = Column(Money(), nullable=False, default=0.0)  # the user's share of shared expenses
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", "month", name="uq_monthly_snapshot_user_month"),
+    )
+
+
+class MonthlySnapshotCategory(Base):
+    """Per-category breakdown of a MonthlySnapshot (same user, year and month)."""
+
+    __tablename__ = "monthly_snapshot_categories"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    category = Column(String(50), nullable=False)
+    personal = Column(Money(), nullable=False, default=0.0)
+    shared = Column(Money(), nullable=False, default=0.0)
+
+    __table_args__ = (
+        Index("ix_monthly_snapshot_categories_user_month", "user_id", "year", "month"),
+    )
+
+
+class ArchivedTotal(Base):
+    """Sums of archived shared expenses or joint account transactions.
+
+    Written by the archive job (``python -m app.jobs.archive_history``) as it
+    moves rows to cold storage, so all-time balances (the couple balance and
+    the joint account balance) still count rows no longer in the database.
+    One row per owner, payer and payment source.
+    """
+
+    __tablename__ = "archived_totals"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(30), nullable=False)  # shared_expenses / joint_account_transactions
+    owner_id = Column(Integer, nullable=False)  # couple id / joint account id
+    paid_by_user_id = Column(Integer, nullable=True)  # shared expenses only
+    paid_from_joint = Column(Boolean, nullable=False, default=False)
+    amount = Column(Money(), nullable=False, default=0.0)
+    user_1_share = Column(Money(), nullable=False, default=0.0)
+    user_2_share = Column(Money(), nullable=False, default=0.0)
+    row_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_archived_totals_source_owner", "source", "owner_id"),
+    )
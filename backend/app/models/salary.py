@@ -1,15 +1,16 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Date, UniqueConstraint
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Date, UniqueConstraint
 
 from app.core.database import Base
+from app.models.types import Money
 
 
 class SalaryCredit(Base):
     __tablename__ = "salary_credits"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    amount = Column(Float, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    amount = Column(Money(), nullable=False)
     credited_date = Column(Date, nullable=False)
     month = Column(Integer, nullable=False)  # 1-12
     year = Column(Integer, nullable=False)
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, DateTime, Index
+
+from app.core.database import Base
+
+
+class SyncTombstone(Base):
+    """Record of a deleted row, so delta-sync clients can drop their copy.
+
+    Owner columns are plain integers (no FK) so tombstones never block
+    deleting the user or couple they belong to.
+    """
+
+    __tablename__ = "sync_tombstones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String(30), nullable=False)  # expense / shared_expense / settlement / budget / category / recurring_expense
+    entity_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, nullable=True)
+    couple_id = Column(Integer, nullable=True)
+    deleted_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")  # owner's sync_seq at the delete
+
+    __table_args__ = (
+        Index("ix_sync_tombstones_user_change", "user_id", "change_seq"),
+        Index("ix_sync_tombstones_couple_change", "couple_id", "change_seq"),
+    )
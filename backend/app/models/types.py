@@ -0,0 +1,35 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+from sqlalchemy import Numeric
+from sqlalchemy.types import TypeDecorator
+
+CENT = Decimal("0.01")
+
+
+def to_money(value) -> Decimal:
+    """Round an amount to whole paise (half up, as PostgreSQL rounds numeric input)."""
+    return Decimal(str(value)).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+class Money(TypeDecorator):
+    """Monetary amount stored exactly as NUMERIC(14, 2).
+
+    Amounts are rounded to two places before they are written. On
+    PostgreSQL the column is a true NUMERIC, so ``SUM()`` is exact; SQLite
+    gives NUMERIC columns REAL affinity, so its sums are floating point and
+    can be off in the last place. Values are read back as ``float`` to keep
+    the API schemas unchanged, so code that accumulates amounts and writes
+    the result back (rollups, snapshots) should add them up with
+    ``to_money``.
+    """
+
+    impl = Numeric
+    cache_ok = True
+
+    def __init__(self):
+        super().__init__(precision=14, scale=2, asdecimal=False)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return to_money(value)
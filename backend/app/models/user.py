@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
 
 from app.core.database import Base
+from app.models.types import Money
 
 
 class User(Base):
@@ -11,13 +12,35 @@ class User(Base):
     name = Column(String(100), nullable=False)
     email = Column(String(255), unique=True, index=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
-    monthly_income = Column(Float, default=0.0)
+    monthly_income = Column(Money(), default=0.0)
     salary_date = Column(Integer, default=1)  # Day of month (1-31)
-    monthly_budget = Column(Float, default=0.0)
+    monthly_budget = Column(Money(), default=0.0)
     is_active = Column(Boolean, default=True)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")  # bumped on every write to the user's data
+    data_changed_at = Column(DateTime, nullable=True)  # when data_version was last bumped; see get_current_read_user
+    categories_version = Column(Integer, nullable=False, default=0, server_default="0")  # bumped on writes to the user's custom categories
+    sync_seq = Column(Integer, nullable=False, default=0, server_default="0")  # delta sync change counter (app.services.sync)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+
+
+class AccountDeletion(Base):
+    """A background job deleting a user's account and data.
+
+    ``user_id`` is a plain integer (no FK): the row outlives the user so
+    the job's outcome can still be looked up by its random id.
+    """
+
+    __tablename__ = "account_deletions"
+
+    id = Column(String(36), primary_key=True)  # uuid4
+    user_id = Column(Integer, nullable=False, index=True)
+    status = Column(String(20), nullable=False, default="pending")  # pending / running / done / failed
+    rows_deleted = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    finished_at = Column(DateTime, nullable=True)
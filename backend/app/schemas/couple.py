@@ -4,6 +4,8 @@ from datetime import date as Date, datetime
 from typing import Optional, List
 from pydantic import BaseModel
 
+from app.schemas.expense import ExpenseTotals
+
 
 # --- Couple ---
 class CoupleInvite(BaseModel):
@@ -62,6 +64,11 @@ class SharedExpenseResponse(BaseModel):
         from_attributes = True
 
 
+class SharedExpenseListWithTotals(BaseModel):
+    items: List[SharedExpenseResponse]
+    totals: ExpenseTotals  # over every matching row
+
+
 class BalanceSummary(BaseModel):
     total_shared: float
     total_joint: float = 0.0
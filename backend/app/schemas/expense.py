@@ -23,6 +23,25 @@ class CategoryResponse(BaseModel):
         from_attributes = True
 
 
+class CategoryUpdate(BaseModel):
+    name: Optional[str] = None
+    icon: Optional[str] = None
+    color: Optional[str] = None
+
+
+class CategoryMerge(BaseModel):
+    into: str  # name of a default or custom category
+
+
+class CategoryMoveResult(BaseModel):
+    category: CategoryResponse
+    # Rows relabelled, per table
+    expenses: int = 0
+    shared_expenses: int = 0
+    recurring_expenses: int = 0
+    budgets: int = 0
+
+
 class ExpenseCreate(BaseModel):
     amount: float
     category: str
@@ -55,11 +74,53 @@ class ExpenseResponse(BaseModel):
         from_attributes = True
 
 
+class CategoryTotal(BaseModel):
+    category: str
+    count: int
+    total: float
+
+
+class ExpenseTotals(BaseModel):
+    count: int
+    total: float
+    categories: List[CategoryTotal]
+
+
+class ExpenseListWithTotals(BaseModel):
+    items: List[ExpenseResponse]
+    totals: ExpenseTotals  # over every matching row, not just this page
+
+
 class ExpenseFilter(BaseModel):
     category: Optional[str] = None
     expense_type: Optional[str] = None
     start_date: Optional[Date] = None
     end_date: Optional[Date] = None
+    search: Optional[str] = None
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+
+
+# --- Bulk edits ---
+class ExpenseBulkChanges(BaseModel):
+    category: Optional[str] = None
+    expense_type: Optional[str] = None
+    date: Optional[Date] = None
+    description: Optional[str] = None
+
+
+class ExpenseBulkDelete(BaseModel):
+    # Exactly one of ids / filter selects the expenses
+    ids: Optional[List[int]] = None
+    filter: Optional[ExpenseFilter] = None
+
+
+class ExpenseBulkUpdate(ExpenseBulkDelete):
+    changes: ExpenseBulkChanges
+
+
+class BulkResult(BaseModel):
+    affected: int
 
 
 # --- Recurring Expenses ---
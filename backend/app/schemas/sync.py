@@ -0,0 +1,24 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+from app.schemas.couple import SharedExpenseResponse, SettlementResponse
+from app.schemas.dashboard import BudgetResponse
+from app.schemas.expense import CategoryResponse, ExpenseResponse, RecurringExpenseResponse
+
+
+class SyncDeletion(BaseModel):
+    entity: str  # expense / shared_expense / settlement / budget / category / recurring_expense
+    id: int
+
+
+class SyncResponse(BaseModel):
+    token: str  # pass back as ?since= on the next sync
+    full: bool  # True when no token was given and every row is included
+    expenses: List[ExpenseResponse] = []
+    recurring_expenses: List[RecurringExpenseResponse] = []
+    categories: List[CategoryResponse] = []
+    budgets: List[BudgetResponse] = []
+    shared_expenses: List[SharedExpenseResponse] = []
+    settlements: List[SettlementResponse] = []
+    deleted: List[SyncDeletion] = []
+    couple_id: Optional[int] = None
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from datetime import date as Date, datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class TimelineItem(BaseModel):
+    kind: str  # personal / shared
+    id: int
+    date: Date
+    category: str
+    description: Optional[str]
+    amount: float  # full amount of the expense
+    user_share: float  # the caller's part: the whole amount for personal expenses
+    paid_by_user_id: int
+    paid_from_joint: bool = False
+    created_at: datetime
+
+
+class TimelinePage(BaseModel):
+    items: List[TimelineItem]
+    next_cursor: Optional[str] = None  # pass back as ?cursor= for the next page; None on the last page
@@ -37,6 +37,17 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+class AccountDeletionResponse(BaseModel):
+    id: str
+    status: str  # pending / running / done / failed
+    rows_deleted: int = 0
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
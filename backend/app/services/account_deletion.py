@@ -0,0 +1,127 @@
+"""Background account deletion.
+
+``DELETE /api/auth/me`` deactivates the user, dissolves their couples and
+queues an ``AccountDeletion`` job, which runs after the response is sent.
+The job removes the user's data table by table in batches of
+``BATCH_SIZE`` rows, committing after each batch so no lock is held for
+long, and finally deletes the couples and the user row. On PostgreSQL the
+foreign keys cascade (migration 012), so rows written while the job ran
+go with their parents rather than blocking the final delete. The
+account's cold-storage files (``app.services.archive``) are removed last.
+
+Jobs interrupted by a restart are picked up again by
+``python -m app.jobs.delete_accounts``; every step can safely run twice.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.budget import Budget, CategorySpend, Notification
+from app.models.couple import (
+    Couple, JointAccount, JointAccountContribution, JointAccountTransaction,
+    SavingsContribution, SavingsGoal, Settlement, SharedExpense,
+)
+from app.models.expense import Expense, RecurringExpense, UserCategory
+from app.models.report import ArchivedTotal, MonthlySnapshot, MonthlySnapshotCategory
+from app.models.salary import SalaryCredit
+from app.models.sync import SyncTombstone
+from app.models.user import AccountDeletion, User
+from app.services.archive import delete_archived
+
+logger = logging.getLogger(__name__)
+
+# Rows removed per DELETE; each batch is its own transaction
+BATCH_SIZE = 1000
+
+
+def _couple_steps(couple_ids):
+    """(model, condition) pairs in foreign-key order: children before parents."""
+    joint_ids = select(JointAccount.id).where(JointAccount.couple_id.in_(couple_ids))
+    goal_ids = select(SavingsGoal.id).where(SavingsGoal.couple_id.in_(couple_ids))
+    return [
+        (ArchivedTotal, and_(ArchivedTotal.source == "joint_account_transactions", ArchivedTotal.owner_id.in_(joint_ids))),
+        (ArchivedTotal, and_(ArchivedTotal.source == "shared_expenses", ArchivedTotal.owner_id.in_(couple_ids))),
+        (JointAccountTransaction, JointAccountTransaction.joint_account_id.in_(joint_ids)),
+        (JointAccountContribution, JointAccountContribution.joint_account_id.in_(joint_ids)),
+        (JointAccount, JointAccount.couple_id.in_(couple_ids)),
+        (SavingsContribution, SavingsContribution.goal_id.in_(goal_ids)),
+        (SavingsGoal, SavingsGoal.couple_id.in_(couple_ids)),
+        (Settlement, Settlement.couple_id.in_(couple_ids)),
+        (SharedExpense, SharedExpense.couple_id.in_(couple_ids)),
+        (SyncTombstone, SyncTombstone.couple_id.in_(couple_ids)),
+    ]
+
+
+def _user_steps(user_id: int):
+    return [
+        (Notification, Notification.user_id == user_id),
+        (Budget, Budget.user_id == user_id),
+        (CategorySpend, CategorySpend.user_id == user_id),
+        (SalaryCredit, SalaryCredit.user_id == user_id),
+        (SyncTombstone, SyncTombstone.user_id == user_id),
+        (MonthlySnapshotCategory, MonthlySnapshotCategory.user_id == user_id),
+        (MonthlySnapshot, MonthlySnapshot.user_id == user_id),
+        (Expense, Expense.user_id == user_id),
+        (RecurringExpense, RecurringExpense.user_id == user_id),
+        (UserCategory, UserCategory.user_id == user_id),
+    ]
+
+
+def _delete_in_batches(db: Session, model, condition) -> int:
+    deleted = 0
+    while True:
+        batch = select(model.id).where(condition).limit(BATCH_SIZE)
+        result = db.execute(
+            delete(model).where(model.id.in_(batch)).execution_options(synchronize_session=False)
+        )
+        db.commit()
+        deleted += result.rowcount
+        if result.rowcount < BATCH_SIZE:
+            return deleted
+
+
+def delete_account_data(db: Session, user_id: int) -> int:
+    """Delete a user, their couples and everything that belongs to them; returns rows deleted."""
+    couple_ids = select(Couple.id).where(or_(Couple.user_1_id == user_id, Couple.user_2_id == user_id))
+    archived_couples = db.execute(couple_ids).scalars().all()
+    archived_joints = db.execute(
+        select(JointAccount.id).where(JointAccount.couple_id.in_(archived_couples))
+    ).scalars().all()
+    deleted = 0
+    for model, condition in (*_couple_steps(couple_ids), *_user_steps(user_id)):
+        deleted += _delete_in_batches(db, model, condition)
+
+    for model, condition in ((Couple, Couple.id.in_(couple_ids)), (User, User.id == user_id)):
+        deleted += db.execute(
+            delete(model).where(condition).execution_options(synchronize_session=False)
+        ).rowcount
+    db.commit()
+    delete_archived(user_id, archived_couples, archived_joints)
+    return deleted
+
+
+def run_deletion(job_id: str) -> None:
+    """Run a queued AccountDeletion job in its own session, recording the outcome."""
+    db = SessionLocal()
+    try:
+        job = db.get(AccountDeletion, job_id)
+        if job is None or job.status == "done":
+            return
+        job.status = "running"
+        db.commit()
+        try:
+            job.rows_deleted = delete_account_data(db, job.user_id)
+            job.status = "done"
+        except Exception as exc:
+            db.rollback()
+            logger.exception("Account deletion %s failed", job_id)
+            job.status = "failed"
+            job.error = str(exc)
+        job.finished_at = datetime.now(timezone.utc)
+        db.commit()
+    finally:
+        db.close()
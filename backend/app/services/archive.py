@@ -0,0 +1,310 @@
+"""Cold storage for old history.
+
+With ``ARCHIVE_AFTER_MONTHS`` set, ``python -m app.jobs.archive_history``
+moves expenses, shared expenses, joint account transactions and
+notifications dated before the archive cutoff out of the database into
+zstd-compressed Parquet files under ``ARCHIVE_DIR``, one file per table,
+owner and year:
+
+    archive/expenses/user_id=12/year=2021.parquet
+    archive/shared_expenses/couple_id=3/year=2021.parquet
+
+Rollups stay in the database: archived months are snapshotted before their
+rows leave, and ``archived_totals`` keeps the sums that all-time balances
+need. Reports read archived rows only for months without a snapshot, and
+exports read them for the requested date range, through the store returned
+by ``get_archive_store()``; ``set_archive_store`` swaps in another backend.
+
+Expenses dated before the cutoff are read-only, so archived months never
+need their snapshots rebuilt. Archiving writes no sync tombstones: delta
+sync clients keep their copies of archived rows. Parquet support comes
+from ``pyarrow``, which is only imported once an archive file is read or
+written.
+"""
+
+import os
+import shutil
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, extract, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.budget import Notification
+from app.models.couple import Couple, JointAccount, JointAccountTransaction, SharedExpense
+from app.models.expense import Expense
+from app.models.report import ArchivedTotal
+from app.models.types import to_money
+from app.services.data_version import bump_data_version
+
+settings = get_settings()
+
+# table -> (model, owner column, date column), in the order the job archives them:
+# joint account transactions reference shared expenses
+ARCHIVED_TABLES = {
+    "joint_account_transactions": (JointAccountTransaction, "joint_account_id", "date"),
+    "notifications": (Notification, "user_id", "created_at"),
+    "shared_expenses": (SharedExpense, "couple_id", "date"),
+    "expenses": (Expense, "user_id", "date"),
+}
+
+# Rows removed per DELETE
+BATCH_SIZE = 1000
+
+
+def archive_cutoff(today: Optional[date] = None) -> Optional[date]:
+    """First day of the oldest month still in the database, or None when archival is disabled."""
+    months = settings.ARCHIVE_AFTER_MONTHS
+    if months <= 0:
+        return None
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def ensure_writable(*dates: Optional[date]) -> None:
+    """Reject writes to archived months, whose rows and snapshots are frozen."""
+    cutoff = archive_cutoff()
+    if cutoff and any(d is not None and d < cutoff for d in dates):
+        raise HTTPException(
+            status_code=400, detail=f"Expenses before {cutoff.isoformat()} are archived and read-only"
+        )
+
+
+# ───────────── Stores ─────────────────────────────────────────────────
+
+
+class ArchiveStore(ABC):
+    """Where archived rows live, as one batch of rows per table, owner and year."""
+
+    @abstractmethod
+    def years(self, table: str, owner_id: int) -> list[int]:
+        """Years with archived rows for the owner, oldest first."""
+
+    @abstractmethod
+    def read(self, table: str, owner_id: int, year: int) -> list[dict]:
+        """The batch's rows, or an empty list."""
+
+    @abstractmethod
+    def write(self, table: str, owner_id: int, year: int, rows: list[dict]) -> None:
+        """Add rows to the batch, replacing any already stored with the same id."""
+
+    @abstractmethod
+    def delete(self, table: str, owner_id: int) -> None:
+        """Remove everything archived for the owner."""
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise RuntimeError("Archived history is stored as Parquet; install pyarrow to read or write it") from exc
+    return pyarrow, pyarrow.parquet
+
+
+class ParquetArchiveStore(ArchiveStore):
+    """Parquet files on local disk, laid out as Hive-style partitions."""
+
+    def __init__(self, root: str, compression: str = "zstd"):
+        self.root = Path(root)
+        self.compression = compression
+
+    def _dir(self, table: str, owner_id: int) -> Path:
+        return self.root / table / f"{ARCHIVED_TABLES[table][1]}={owner_id}"
+
+    def _path(self, table: str, owner_id: int, year: int) -> Path:
+        return self._dir(table, owner_id) / f"year={year}.parquet"
+
+    def years(self, table: str, owner_id: int) -> list[int]:
+        return sorted(int(path.stem.split("=", 1)[1]) for path in self._dir(table, owner_id).glob("year=*.parquet"))
+
+    def read(self, table: str, owner_id: int, year: int) -> list[dict]:
+        path = self._path(table, owner_id, year)
+        if not path.exists():
+            return []
+        _, parquet = _pyarrow()
+        return parquet.read_table(path).to_pylist()
+
+    def write(self, table: str, owner_id: int, year: int, rows: list[dict]) -> None:
+        pyarrow, parquet = _pyarrow()
+        merged = {row["id"]: row for row in self.read(table, owner_id, year)}
+        merged.update((row["id"], row) for row in rows)
+        path = self._path(table, owner_id, year)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".parquet.tmp")
+        parquet.write_table(
+            pyarrow.Table.from_pylist([merged[key] for key in sorted(merged)]), tmp, compression=self.compression
+        )
+        os.replace(tmp, path)  # readers never see a half-written file
+
+    def delete(self, table: str, owner_id: int) -> None:
+        shutil.rmtree(self._dir(table, owner_id), ignore_errors=True)
+
+
+_store: Optional[ArchiveStore] = None
+
+
+def get_archive_store() -> ArchiveStore:
+    global _store
+    if _store is None:
+        _store = ParquetArchiveStore(settings.ARCHIVE_DIR)
+    return _store
+
+
+def set_archive_store(store: Optional[ArchiveStore]) -> None:
+    """Use another store for archived rows; None goes back to the default Parquet store."""
+    global _store
+    _store = store
+
+
+# ───────────── Reading ────────────────────────────────────────────────
+
+
+def read_archived(
+    table: str, owner_id: int, start: Optional[date] = None, before: Optional[date] = None
+) -> list[dict]:
+    """Archived rows of one owner dated in [start, before), oldest first; either bound may be omitted."""
+    store = get_archive_store()
+    date_column = ARCHIVED_TABLES[table][2]
+    rows: list[dict] = []
+    for year in store.years(table, owner_id):
+        if (start and year < start.year) or (before and year > (before - timedelta(days=1)).year):
+            continue
+        for row in store.read(table, owner_id, year):
+            on = row[date_column]
+            on = on.date() if isinstance(on, datetime) else on
+            if (start is None or on >= start) and (before is None or on < before):
+                rows.append(row)
+    rows.sort(key=lambda row: (row[date_column], row["id"]))
+    return rows
+
+
+def archived_spend(
+    user_id: int, couple: Optional[Couple], start: date, before: date
+) -> list[tuple[date, str, float]]:
+    """(date, category, amount) per day and category of archived personal spend plus the user's share of shared spend."""
+    totals: dict[tuple[date, str], float] = defaultdict(float)
+    for row in read_archived("expenses", user_id, start, before):
+        totals[row["date"], row["category"]] += row["amount"]
+    if couple:
+        share = "user_1_share" if couple.user_1_id == user_id else "user_2_share"
+        for row in read_archived("shared_expenses", couple.id, start, before):
+            totals[row["date"], row["category"]] += row[share]
+    return [(day, category, amount) for (day, category), amount in totals.items()]
+
+
+def delete_archived(user_id: int, couple_ids: Iterable[int], joint_ids: Iterable[int]) -> None:
+    """Remove a deleted account's archive files; their ``archived_totals`` rows go with the database rows."""
+    store = get_archive_store()
+    owners = {"expenses": [user_id], "notifications": [user_id], "shared_expenses": couple_ids,
+              "joint_account_transactions": joint_ids}
+    for table, owner_ids in owners.items():
+        for owner_id in owner_ids:
+            store.delete(table, owner_id)
+
+
+# ───────────── Archiving ──────────────────────────────────────────────
+
+
+def _add_rollups(db: Session, table: str, owner_id: int, rows: list[dict]) -> None:
+    """Fold shared expenses and joint transactions into ``archived_totals`` before they leave."""
+    if table == "shared_expenses":
+        keys = [(row["paid_by_user_id"], bool(row["paid_from_joint"])) for row in rows]
+    elif table == "joint_account_transactions":
+        keys = [(None, False)] * len(rows)
+    else:
+        return
+    zero = to_money(0)
+    sums: dict[tuple, list] = {}
+    for key, row in zip(keys, rows):
+        total = sums.setdefault(key, [zero, zero, zero, 0])
+        total[0] += to_money(row["amount"])
+        total[1] += to_money(row.get("user_1_share") or 0)
+        total[2] += to_money(row.get("user_2_share") or 0)
+        total[3] += 1
+    for (paid_by, from_joint), (amount, user_1_share, user_2_share, count) in sums.items():
+        rollup = (
+            db.query(ArchivedTotal)
+            .filter(
+                ArchivedTotal.source == table,
+                ArchivedTotal.owner_id == owner_id,
+                ArchivedTotal.paid_by_user_id == paid_by,
+                ArchivedTotal.paid_from_joint == from_joint,
+            )
+            .first()
+        )
+        if rollup is None:
+            rollup = ArchivedTotal(
+                source=table, owner_id=owner_id, paid_by_user_id=paid_by, paid_from_joint=from_joint,
+                amount=0.0, user_1_share=0.0, user_2_share=0.0, row_count=0,
+            )
+            db.add(rollup)
+        rollup.amount = float(to_money(rollup.amount) + amount)
+        rollup.user_1_share = float(to_money(rollup.user_1_share) + user_1_share)
+        rollup.user_2_share = float(to_money(rollup.user_2_share) + user_2_share)
+        rollup.row_count += count
+
+
+def _bump(db: Session, table: str, owner_id: int) -> None:
+    if table == "expenses":
+        bump_data_version(db, user_ids=[owner_id])
+    elif table == "shared_expenses":
+        bump_data_version(db, couple_ids=[owner_id])
+    elif table == "joint_account_transactions":
+        couple_id = db.query(JointAccount.couple_id).filter(JointAccount.id == owner_id).scalar()
+        bump_data_version(db, couple_ids=[couple_id] if couple_id else [])
+
+
+def archive_group(db: Session, table: str, owner_id: int, year: int, cutoff: date) -> int:
+    """Move one owner's rows for ``year`` (before ``cutoff``) to the store; returns rows moved.
+
+    The file is written before the rows are deleted and the rollups and
+    deletes commit together, so an interrupted run loses nothing and can
+    simply be repeated.
+
+    Not streamed: the rows being moved and the year's existing batch are
+    held in memory together while the batch is rewritten, so memory grows
+    with one owner's rows in one table for one year: roughly 20 MB per ten
+    thousand rows. The monthly job adds one month to each batch.
+    """
+    model, owner_column, date_column = ARCHIVED_TABLES[table]
+    when = getattr(model, date_column)
+    start, end = date(year, 1, 1), min(date(year + 1, 1, 1), cutoff)
+    if date_column == "created_at":
+        start, end = datetime(start.year, 1, 1), datetime(end.year, end.month, end.day)
+    rows = [
+        dict(row)
+        for row in db.execute(
+            select(model.__table__)
+            .where(getattr(model, owner_column) == owner_id, when >= start, when < end)
+            .order_by(model.id)
+        ).mappings()
+    ]
+    if not rows:
+        return 0
+
+    get_archive_store().write(table, owner_id, year, rows)
+    _add_rollups(db, table, owner_id, rows)
+    ids = [row["id"] for row in rows]
+    for i in range(0, len(ids), BATCH_SIZE):
+        db.execute(delete(model).where(model.id.in_(ids[i:i + BATCH_SIZE])).execution_options(synchronize_session=False))
+    _bump(db, table, owner_id)
+    db.commit()
+    return len(rows)
+
+
+def archive_groups(db: Session, table: str, cutoff: date) -> Iterable[tuple[int, int]]:
+    """(owner id, year) pairs that still have rows before ``cutoff``."""
+    model, owner_column, date_column = ARCHIVED_TABLES[table]
+    when = getattr(model, date_column)
+    bound = cutoff if date_column == "date" else datetime(cutoff.year, cutoff.month, cutoff.day)
+    year = extract("year", when)
+    owner = getattr(model, owner_column)
+    rows = db.query(owner, year).filter(when < bound).distinct().order_by(owner, year).all()
+    return [(int(owner_id), int(y)) for owner_id, y in rows]
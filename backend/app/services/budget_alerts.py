@@ -0,0 +1,271 @@
+"""Incremental budget threshold evaluation.
+
+Every write that changes a category's monthly spend reports the change here
+via ``record_spend_changes``. Changes to the current month are added to the
+user's ``category_spend`` row for the category, one UPDATE that returns the
+new spend, so nothing sums the month's expenses on the write path. The
+evaluator compares the spend before (new spend minus the change) and after
+against the user's cached budget limits and only creates a notification
+when the 80% or 100% threshold is crossed, so budgets no longer need to be
+rescanned on every dashboard load. Changes to closed months drop that
+month's report snapshot instead.
+
+A write that changes current-month spend without reporting it leaves the
+rollup wrong for the rest of the month.
+
+Budget limits are cached per process for ``_LIMITS_TTL_SECONDS``. A limit
+change clears the cache of the process that made it only, so the other
+workers evaluate writes against the old limit for up to a minute.
+"""
+
+import time
+from datetime import date
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.events import publish
+from app.models.budget import Budget, CategorySpend, Notification
+from app.models.couple import Couple, SharedExpense
+from app.models.expense import Expense
+from app.services.partitions import month_bounds
+from app.services.snapshots import invalidate_snapshots
+from app.services.splits import share_column
+
+# (percent, title suffix) — checked from the highest threshold down
+BUDGET_THRESHOLDS = (
+    (100, "Budget Exceeded 🚨"),
+    (80, "Budget Warning ⚠️"),
+)
+
+# Budget limits change rarely; the TTL bounds how long other workers use an old limit
+_LIMITS_TTL_SECONDS = 60.0
+_limits_cache: dict[int, Tuple[float, dict[str, float]]] = {}
+
+
+# ─── Budget limit cache ──────────────────────────────────────────────────────
+
+def get_budget_limits(user_id: int, db: Session) -> dict[str, float]:
+    """Return ``{category: monthly_limit}`` for a user, cached per process."""
+    now = time.monotonic()
+    cached = _limits_cache.get(user_id)
+    if cached and cached[0] > now:
+        return cached[1]
+    rows = db.query(Budget.category, Budget.monthly_limit).filter(Budget.user_id == user_id).all()
+    limits = {category: limit for category, limit in rows}
+    _limits_cache[user_id] = (now + _LIMITS_TTL_SECONDS, limits)
+    return limits
+
+
+def invalidate_budget_limits(user_id: int) -> None:
+    _limits_cache.pop(user_id, None)
+
+
+# ─── Spend change evaluation ─────────────────────────────────────────────────
+
+def record_spend_change(db: Session, user_id: int, category: str, on_date: date, delta: float) -> None:
+    """Evaluate a single change to a user's spend in a category."""
+    record_spend_changes(db, user_id, [(category, on_date, delta)])
+
+
+def record_spend_changes(
+    db: Session, user_id: int, changes: Iterable[Tuple[str, date, float]]
+) -> None:
+    """Evaluate changes to a user's spend, given as ``(category, date, delta)``.
+
+    Must be called after the write has been flushed, so a category's first
+    change in a month seeds its rollup with the write included. Changes to
+    the same category are merged first; each remaining current-month change
+    costs one statement. Changes dated in a closed month drop its report
+    snapshot instead.
+    """
+    today = date.today()
+    merged: dict[str, float] = {}
+    closed_months: set[Tuple[int, int]] = set()
+    for category, on_date, delta in changes:
+        if (on_date.year, on_date.month) != (today.year, today.month):
+            if on_date < today:
+                closed_months.add((on_date.year, on_date.month))
+            continue
+        merged[category] = merged.get(category, 0.0) + delta
+
+    if closed_months:
+        invalidate_snapshots(db, user_id, closed_months)
+
+    merged = {cat: delta for cat, delta in merged.items() if delta}
+    if not merged:
+        return
+
+    limits = get_budget_limits(user_id, db) if any(delta > 0 for delta in merged.values()) else {}
+    for category, delta in merged.items():
+        spend = add_month_spend(db, user_id, category, today, delta)
+        limit = limits.get(category)
+        if delta > 0 and limit:
+            _notify_if_crossed(db, user_id, category, limit, spend - delta, limit, spend, today)
+
+
+def record_limit_change(
+    db: Session, user_id: int, category: str, old_limit: Optional[float], new_limit: float
+) -> None:
+    """Evaluate a budget limit change against the category's current spend."""
+    invalidate_budget_limits(user_id)
+    today = date.today()
+    spend = add_month_spend(db, user_id, category, today, 0.0)
+    _notify_if_crossed(db, user_id, category, old_limit, spend, new_limit, spend, today)
+
+
+# ─── Monthly spend rollup ────────────────────────────────────────────────────
+
+def add_month_spend(db: Session, user_id: int, category: str, today: date, delta: float) -> float:
+    """Add ``delta`` to the user's spend in ``category`` this month and return the new total."""
+    key = and_(
+        CategorySpend.user_id == user_id,
+        CategorySpend.year == today.year,
+        CategorySpend.month == today.month,
+        CategorySpend.category == category,
+    )
+    bump = (
+        update(CategorySpend)
+        .where(key)
+        .values(amount=CategorySpend.amount + delta)
+        .returning(CategorySpend.amount)
+        .execution_options(synchronize_session=False)
+    )
+    spend = db.execute(bump).scalar()
+    if spend is not None:
+        return float(spend)
+
+    # First change this month: seed from the expense tables, which already include it
+    dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    spend = db.execute(
+        dialect_insert(CategorySpend)
+        .values(
+            user_id=user_id, year=today.year, month=today.month, category=category,
+            amount=current_month_spend(db, user_id, category, today),
+        )
+        .on_conflict_do_nothing()
+        .returning(CategorySpend.amount)
+    ).scalar()
+    if spend is None:  # a concurrent write seeded it first, without this change
+        spend = db.execute(bump).scalar()
+    return float(spend)
+
+
+def reset_month_spend(db: Session, user_id: int, today: date) -> None:
+    """Drop the user's rollup for this month; each category is reseeded from the rows when next touched.
+
+    For changes that move spend without a write to report, such as the
+    user's couple being dissolved.
+    """
+    db.query(CategorySpend).filter(
+        CategorySpend.user_id == user_id,
+        CategorySpend.year == today.year,
+        CategorySpend.month == today.month,
+    ).delete(synchronize_session=False)
+
+
+def current_month_spend(db: Session, user_id: int, category: str, today: date) -> float:
+    """Personal spend plus the user's share of shared spend in a category this month, summed from the rows."""
+    month_start, next_month = month_bounds(today)
+    personal = (
+        db.query(func.coalesce(func.sum(Expense.amount), 0))
+        .filter(
+            and_(
+                Expense.user_id == user_id,
+                Expense.category == category,
+                Expense.date >= month_start,
+                Expense.date < next_month,
+            )
+        )
+        .scalar()
+    )
+
+    couple = (
+        db.query(Couple)
+        .filter(
+            and_(
+                Couple.status == "active",
+                or_(Couple.user_1_id == user_id, Couple.user_2_id == user_id),
+            )
+        )
+        .first()
+    )
+    shared = 0.0
+    if couple:
+        shared = (
+            db.query(func.coalesce(func.sum(share_column(couple, user_id)), 0))
+            .filter(
+                and_(
+                    SharedExpense.couple_id == couple.id,
+                    SharedExpense.category == category,
+                    SharedExpense.date >= month_start,
+                    SharedExpense.date < next_month,
+                )
+            )
+            .scalar()
+        )
+
+    return float(personal) + float(shared)
+
+
+def _notify_if_crossed(
+    db: Session,
+    user_id: int,
+    category: str,
+    limit_before: Optional[float],
+    spend_before: float,
+    limit_after: float,
+    spend_after: float,
+    today: date,
+) -> None:
+    if not limit_after or limit_after <= 0:
+        return
+    pct_before = (spend_before / limit_before * 100) if limit_before else 0
+    pct_after = spend_after / limit_after * 100
+    for threshold, label in BUDGET_THRESHOLDS:
+        if pct_before < threshold <= pct_after:
+            create_notification_if_new(
+                db,
+                user_id,
+                f"{category} {label}",
+                f"You've spent ₹{spend_after:,.0f} of ₹{limit_after:,.0f} for {category}.",
+                "budget_warning",
+                today,
+            )
+            return
+
+
+# ─── Notifications ───────────────────────────────────────────────────────────
+
+def create_notification_if_new(
+    db: Session, user_id: int, title: str, message: str, ntype: str, today: date
+):
+    """Create notification only if one doesn't already exist today for same type+title.
+
+    Moves a read session (``get_read_db``) to the primary first, so the
+    check sees today's notifications and the write and its event go there.
+    """
+    db.use_primary()
+    existing = (
+        db.query(Notification)
+        .filter(
+            and_(
+                Notification.user_id == user_id,
+                Notification.title == title,
+                Notification.notification_type == ntype,
+                func.date(Notification.created_at) == today,
+            )
+        )
+        .first()
+    )
+    if not existing:
+        notif = Notification(
+            user_id=user_id,
+            title=title,
+            message=message,
+            notification_type=ntype,
+        )
+        db.add(notif)
+        publish(db, [user_id], "notification", {"title": title, "notification_type": ntype})
@@ -0,0 +1,221 @@
+"""Category catalogue, rename and merge.
+
+The category picker lists the default categories followed by the user's
+custom ones. That catalogue is cached per process, keyed on the user's
+``categories_version``, which every write to their custom categories
+bumps and nothing else does. The user row is read from the primary, so a
+worker never serves a list another worker has since changed, and writes
+to expenses or budgets do not empty the cache.
+
+Categories are referenced by name, so renaming or merging one rewrites
+every row that uses it: the user's expenses, recurring expenses and
+budgets, and the shared expenses the user paid for. Shared expenses the
+partner paid for keep their label, as do the partner's budgets. Deleting
+a category merges it into "Other". Rows are moved with chunked
+``UPDATE ... WHERE id IN (SELECT ... LIMIT n)`` statements that each
+commit on their own, so a long history never holds its locks for long,
+and re-running an interrupted move finishes it.
+
+Report snapshots are relabelled in place instead of being rebuilt, for
+the partner too where their share of a moved shared expense is counted,
+and the per-process budget limit cache is dropped. Rows already in
+archive files are not rewritten: exports of archived months show the
+category names the rows had when they were archived.
+"""
+
+from datetime import date
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, extract, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.budget import Budget
+from app.models.couple import Couple, SharedExpense
+from app.models.expense import Expense, RecurringExpense, UserCategory
+from app.services.budget_alerts import invalidate_budget_limits, record_spend_changes
+from app.services.data_version import bump_data_version
+from app.services.partitions import month_bounds
+from app.services.snapshots import move_snapshot_category
+from app.services.sync import SYNCED_MODELS, advance_change_seq
+from app.schemas.expense import CategoryResponse
+
+DEFAULT_CATEGORIES = [
+    {"name": "Food", "icon": "🍔", "color": "#f97316"},
+    {"name": "Rent", "icon": "🏠", "color": "#8b5cf6"},
+    {"name": "Utilities", "icon": "💡", "color": "#06b6d4"},
+    {"name": "Travel", "icon": "✈️", "color": "#ec4899"},
+    {"name": "Shopping", "icon": "🛒", "color": "#f59e0b"},
+    {"name": "Subscriptions", "icon": "📱", "color": "#6366f1"},
+    {"name": "EMI", "icon": "🏦", "color": "#ef4444"},
+    {"name": "Entertainment", "icon": "🎬", "color": "#14b8a6"},
+    {"name": "Health", "icon": "🏥", "color": "#22c55e"},
+    {"name": "Other", "icon": "📦", "color": "#94a3b8"},
+]
+DEFAULT_RESPONSES = tuple(
+    CategoryResponse(name=c["name"], icon=c["icon"], color=c["color"], is_default=True)
+    for c in DEFAULT_CATEGORIES
+)
+DEFAULTS_BY_NAME = {c.name.lower(): c for c in DEFAULT_RESPONSES}
+# Where a deleted category's references are moved
+FALLBACK_CATEGORY = "Other"
+
+# Rows rewritten per UPDATE; each chunk is its own transaction
+CHUNK_SIZE = 1000
+
+# user id -> (categories_version the list was read at, list)
+_catalogue_cache: dict[int, Tuple[int, list[CategoryResponse]]] = {}
+
+
+# ─── Catalogue ───────────────────────────────────────────────────────────────
+
+def get_catalogue(db: Session, user_id: int, categories_version: int) -> list[CategoryResponse]:
+    """Default plus custom categories for a user at ``categories_version``, cached per process. Do not mutate."""
+    cached = _catalogue_cache.get(user_id)
+    if cached and cached[0] == categories_version:
+        return cached[1]
+    custom = db.query(UserCategory).filter(UserCategory.user_id == user_id).order_by(UserCategory.id).all()
+    catalogue = [
+        *DEFAULT_RESPONSES,
+        *(CategoryResponse(id=c.id, name=c.name, icon=c.icon, color=c.color, is_default=False) for c in custom),
+    ]
+    _catalogue_cache[user_id] = (categories_version, catalogue)
+    return catalogue
+
+
+def invalidate_catalogue(user_id: int) -> None:
+    _catalogue_cache.pop(user_id, None)
+
+
+# ─── Rename and merge ────────────────────────────────────────────────────────
+
+
+def _move_rows(db: Session, model, owner_condition, owner_id: int, old: str, new: str, **versioned) -> int:
+    """Relabel ``old`` to ``new`` on the rows matching ``owner_condition``, one chunk per commit.
+
+    ``owner_id`` is the user or couple whose sync counter stamps the moved rows.
+    """
+    owner = SYNCED_MODELS[model][1]
+    moved = 0
+    while True:
+        seq = advance_change_seq(db, owner, [owner_id])[owner_id]
+        chunk = (
+            select(model.id)
+            .where(and_(owner_condition, model.category == old))
+            .order_by(model.id)
+            .limit(CHUNK_SIZE)
+        )
+        result = db.execute(
+            update(model)
+            .where(model.id.in_(chunk))
+            .values(category=new, change_seq=seq)
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            return moved
+        bump_data_version(db, **versioned)
+        db.commit()
+        moved += result.rowcount
+
+
+def _shared_moves(db: Session, couple: Couple, user_id: int, old: str) -> dict[int, dict[tuple[int, int], float]]:
+    """{partner id: {(year, month): share}} of the ``old`` shared expenses ``user_id`` paid for."""
+    year, month = extract("year", SharedExpense.date), extract("month", SharedExpense.date)
+    rows = db.execute(
+        select(year, month, func.sum(SharedExpense.user_1_share), func.sum(SharedExpense.user_2_share))
+        .where(
+            and_(
+                SharedExpense.couple_id == couple.id,
+                SharedExpense.paid_by_user_id == user_id,
+                SharedExpense.category == old,
+            )
+        )
+        .group_by(year, month)
+    ).all()
+    moves: dict[int, dict[tuple[int, int], float]] = {couple.user_1_id: {}, couple.user_2_id: {}}
+    for y, m, user_1_share, user_2_share in rows:
+        moves[couple.user_1_id][int(y), int(m)] = float(user_1_share or 0)
+        moves[couple.user_2_id][int(y), int(m)] = float(user_2_share or 0)
+    return moves
+
+
+def move_category(db: Session, user_id: int, old: str, new: str) -> dict[str, int]:
+    """Relabel every reference to ``old`` as ``new`` and return the rows moved per table.
+
+    When ``new`` is already in use this is a merge: the spend moved into
+    it is evaluated against its budget (and the partner's, for their share
+    of moved shared expenses), and if both categories have a budget the
+    one for ``old`` is dropped. Commits as it goes; the caller updates or
+    deletes the category row itself.
+    """
+    today = date.today()
+    month_start, next_month = month_bounds(today)
+    couple: Optional[Couple] = (
+        db.query(Couple)
+        .filter(
+            and_(
+                Couple.status == "active",
+                or_(Couple.user_1_id == user_id, Couple.user_2_id == user_id),
+            )
+        )
+        .first()
+    )
+    moved_personal = (
+        db.query(func.coalesce(func.sum(Expense.amount), 0))
+        .filter(
+            and_(
+                Expense.user_id == user_id,
+                Expense.category == old,
+                Expense.date >= month_start,
+                Expense.date < next_month,
+            )
+        )
+        .scalar()
+    )
+    shared_moves = _shared_moves(db, couple, user_id, old) if couple else {}
+
+    counts = {
+        "expenses": _move_rows(db, Expense, Expense.user_id == user_id, user_id, old, new, user_ids=[user_id]),
+        "recurring_expenses": _move_rows(
+            db, RecurringExpense, RecurringExpense.user_id == user_id, user_id, old, new, user_ids=[user_id]
+        ),
+        "shared_expenses": 0,
+    }
+    if couple:
+        counts["shared_expenses"] = _move_rows(
+            db,
+            SharedExpense,
+            and_(SharedExpense.couple_id == couple.id, SharedExpense.paid_by_user_id == user_id),
+            couple.id,
+            old,
+            new,
+            couple_ids=[couple.id],
+        )
+
+    budgets = {
+        b.category: b
+        for b in db.query(Budget).filter(and_(Budget.user_id == user_id, Budget.category.in_([old, new])))
+    }
+    counts["budgets"] = 0
+    if old in budgets:
+        if new in budgets:
+            db.delete(budgets[old])
+        else:
+            budgets[old].category = new
+        counts["budgets"] = 1
+    invalidate_budget_limits(user_id)
+
+    move_snapshot_category(db, user_id, old, new, shared=shared_moves.get(user_id, {}))
+    for partner_id, by_month in shared_moves.items():
+        if partner_id != user_id:
+            move_snapshot_category(db, partner_id, old, new, personal=False, shared=by_month)
+
+    db.flush()
+    this_month = (today.year, today.month)
+    moved_spend = float(moved_personal) + shared_moves.get(user_id, {}).get(this_month, 0.0)
+    if moved_spend:
+        record_spend_changes(db, user_id, [(old, today, -moved_spend), (new, today, moved_spend)])
+    for partner_id, by_month in shared_moves.items():
+        if partner_id != user_id and by_month.get(this_month):
+            moved = by_month[this_month]
+            record_spend_changes(db, partner_id, [(old, today, -moved), (new, today, moved)])
+    return counts
@@ -0,0 +1,112 @@
+"""Per-user data version counters.
+
+``users.data_version`` is bumped whenever a flush touches data visible to
+that user, including couple-scoped rows (which bump both partners). ETags
+for read endpoints are derived from it, so validating a cached response
+costs no more than loading the current user. ``users.data_changed_at``
+records when, and keeps the user's reads on the primary database for a
+short while afterwards. ``users.categories_version`` is bumped only by
+writes to the user's custom categories, for the category catalogue cache.
+
+ORM flushes are tracked automatically. Set-based ``query.update()`` /
+``query.delete()`` calls bypass the ORM and must call
+``bump_data_version`` (and ``bump_categories_version``) themselves.
+"""
+
+from datetime import datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import event, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.budget import Notification
+from app.models.couple import (
+    Couple, JointAccount, JointAccountContribution, JointAccountTransaction,
+    SavingsContribution, SavingsGoal,
+)
+from app.models.expense import UserCategory
+from app.models.sync import SyncTombstone
+from app.models.user import User
+
+# Rows that never affect a versioned (ETag'd) response
+_UNVERSIONED = (Notification, SyncTombstone)
+
+
+def bump_data_version(
+    db: Session, user_ids: Iterable[int] = (), couple_ids: Iterable[int] = ()
+) -> None:
+    """Invalidate cached responses for the given users and couples."""
+    user_ids, couple_ids = set(user_ids), set(couple_ids)
+    conditions = []
+    if user_ids:
+        conditions.append(User.id.in_(user_ids))
+    if couple_ids:
+        conditions.append(User.id.in_(select(Couple.user_1_id).where(Couple.id.in_(couple_ids))))
+        conditions.append(User.id.in_(select(Couple.user_2_id).where(Couple.id.in_(couple_ids))))
+    if not conditions:
+        return
+    db.connection().execute(
+        update(User)
+        .where(or_(*conditions))
+        .values(data_version=User.data_version + 1, data_changed_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_categories_version(db: Session, user_ids: Iterable[int]) -> None:
+    """Invalidate the cached category catalogues of the given users."""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    db.connection().execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(categories_version=User.categories_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _bump_after_flush(session: Session, flush_context) -> None:
+    user_ids: set[int] = set()
+    couple_ids: set[int] = set()
+    joint_ids: set[int] = set()
+    goal_ids: set[int] = set()
+    category_user_ids: set[int] = set()
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _UNVERSIONED):
+            continue
+        if isinstance(obj, UserCategory):
+            category_user_ids.add(obj.user_id)
+        if isinstance(obj, User):
+            user_ids.add(obj.id)
+            # The partner sees this user's name on couple endpoints
+            couple_ids.update(
+                session.connection().execute(
+                    select(Couple.id).where(or_(Couple.user_1_id == obj.id, Couple.user_2_id == obj.id))
+                ).scalars()
+            )
+        elif isinstance(obj, Couple):
+            user_ids.update((obj.user_1_id, obj.user_2_id))
+        elif isinstance(obj, (JointAccountContribution, JointAccountTransaction)):
+            joint_ids.add(obj.joint_account_id)
+        elif isinstance(obj, SavingsContribution):
+            goal_ids.add(obj.goal_id)
+        elif hasattr(obj, "couple_id"):
+            couple_ids.add(obj.couple_id)
+        elif hasattr(obj, "user_id"):
+            user_ids.add(obj.user_id)
+
+    conn = session.connection()
+    if joint_ids:
+        couple_ids.update(
+            conn.execute(select(JointAccount.couple_id).where(JointAccount.id.in_(joint_ids))).scalars()
+        )
+    if goal_ids:
+        couple_ids.update(
+            conn.execute(select(SavingsGoal.couple_id).where(SavingsGoal.id.in_(goal_ids))).scalars()
+        )
+    bump_data_version(session, user_ids, couple_ids)
+    bump_categories_version(session, category_user_ids)
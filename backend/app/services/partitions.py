@@ -0,0 +1,86 @@
+"""Yearly range partitions for ``expenses`` and ``shared_expenses``.
+
+On PostgreSQL, migration 013 partitions both tables by ``date``: one
+partition per calendar year (``expenses_y2026``) plus a DEFAULT partition
+for dates no yearly partition covers. The models and queries are
+unchanged, but the planner can only prune partitions for plain range
+conditions on ``date``, so filter with ``month_bounds`` rather than
+``extract()``.
+
+``python -m app.jobs.create_partitions`` creates next year's partitions
+ahead of time and can detach old years, which turns retention and
+archival into a metadata operation instead of a bulk DELETE.
+"""
+
+from datetime import date
+from typing import Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+PARTITIONED_TABLES = ("expenses", "shared_expenses")
+
+
+def month_bounds(d: date) -> Tuple[date, date]:
+    """[first day of d's month, first day of the next month)."""
+    start = date(d.year, d.month, 1)
+    if d.month == 12:
+        return start, date(d.year + 1, 1, 1)
+    return start, date(d.year, d.month + 1, 1)
+
+
+def partition_name(table: str, year: int) -> str:
+    return f"{table}_y{year}"
+
+
+def is_partitioned(db: Session, table: str) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    kind = db.execute(text("SELECT relkind FROM pg_class WHERE relname = :table"), {"table": table}).scalar()
+    return kind == "p"
+
+
+def attached_partitions(db: Session, table: str) -> set[str]:
+    rows = db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+    return set(rows.scalars())
+
+
+def create_year_partition(db: Session, table: str, year: int) -> bool:
+    """Attach a partition for ``year`` unless one exists; returns whether one was created.
+
+    Rows for that year already sitting in the DEFAULT partition are moved
+    into the new partition first, since PostgreSQL refuses to attach a
+    range the DEFAULT partition holds rows for. The caller commits.
+    """
+    name = partition_name(table, year)
+    if name in attached_partitions(db, table):
+        return False
+    bounds = {"start": date(year, 1, 1), "end": date(year + 1, 1, 1)}
+    in_year = "date >= :start AND date < :end"
+    db.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+    db.execute(text(f"INSERT INTO {name} SELECT * FROM {table}_default WHERE {in_year}"), bounds)
+    db.execute(text(f"DELETE FROM {table}_default WHERE {in_year}"), bounds)
+    db.execute(
+        text(f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')")
+    )
+    return True
+
+
+def detach_year_partition(db: Session, table: str, year: int) -> bool:
+    """Detach ``year``'s partition, leaving it as a plain table; returns whether it was attached.
+
+    The caller commits. Detached rows no longer appear in any query.
+    """
+    name = partition_name(table, year)
+    if name not in attached_partitions(db, table):
+        return False
+    db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    return True
@@ -0,0 +1,107 @@
+"""Expense search, list filters and filtered totals.
+
+On PostgreSQL, ``search`` is matched against a ``simple``-config tsvector of
+an expense's description and category, served by the GIN expression
+indexes from migration 010. Every word in the search term is a prefix
+match, so results narrow as the user types, and matches are ranked with
+``ts_rank``. Other databases fall back to a case-insensitive substring
+match.
+
+The tsvector expression below must stay identical to the indexed one, or
+PostgreSQL will not use the index.
+"""
+
+import re
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.orm import Query, Session
+
+TS_CONFIG = literal_column("'simple'")
+_WORD = re.compile(r"\w+")
+
+
+def search_document(model):
+    """The tsvector indexed for ``model`` (Expense or SharedExpense)."""
+    return func.to_tsvector(TS_CONFIG, func.coalesce(model.description, "") + " " + model.category)
+
+
+def prefix_query(term: str) -> Optional[str]:
+    """``to_tsquery`` text matching every word of ``term`` as a prefix, or None if it has no words."""
+    words = _WORD.findall(term.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def search_clause(db: Session, model, term: str) -> tuple:
+    """Return (filter condition, ranking ORDER BY clauses) for a search term."""
+    ts_query = prefix_query(term) if db.get_bind().dialect.name == "postgresql" else None
+    if ts_query:
+        document = search_document(model)
+        tsquery = func.to_tsquery(TS_CONFIG, ts_query)
+        return document.op("@@")(tsquery), [func.ts_rank(document, tsquery).desc()]
+
+    # Escape LIKE wildcard characters
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return or_(model.description.ilike(f"%{escaped}%"), model.category.ilike(f"%{escaped}%")), []
+
+
+def filter_expenses(
+    db: Session,
+    query: Query,
+    model,
+    category: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    search: Optional[str] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
+) -> tuple[Query, list]:
+    """Apply the list filters shared by personal and shared expenses.
+
+    Returns the filtered query and the ORDER BY clauses that rank search
+    matches (empty without a search); callers append their own ordering.
+    """
+    if category:
+        query = query.filter(model.category == category)
+    if start_date:
+        query = query.filter(model.date >= start_date)
+    if end_date:
+        query = query.filter(model.date <= end_date)
+    ranking: list = []
+    if search:
+        condition, ranking = search_clause(db, model, search)
+        query = query.filter(condition)
+    if min_amount is not None:
+        query = query.filter(model.amount >= min_amount)
+    if max_amount is not None:
+        query = query.filter(model.amount <= max_amount)
+    return query, ranking
+
+
+def filtered_totals(query: Query, model) -> dict:
+    """Count, sum and per-category breakdown of every row a filtered list query matches.
+
+    One grouped query: the overall figures are window sums over the
+    per-category groups, so they are exact however many rows match and
+    independent of the page being returned.
+    """
+    rows = (
+        query.with_entities(
+            model.category,
+            func.count(model.id),
+            func.sum(model.amount),
+            func.sum(func.count(model.id)).over(),
+            func.sum(func.sum(model.amount)).over(),
+        )
+        .group_by(model.category)
+        .order_by(func.sum(model.amount).desc())
+        .all()
+    )
+    return {
+        "count": int(rows[0][3]) if rows else 0,
+        "total": round(float(rows[0][4]), 2) if rows else 0.0,
+        "categories": [{"category": c, "count": n, "total": round(float(amt), 2)} for c, n, amt, _, _ in rows],
+    }
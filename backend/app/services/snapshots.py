@@ -0,0 +1,209 @@
+"""Month-close snapshots for reports.
+
+Closed months rarely change, so each user's per-category spend for a
+closed month (personal amounts and their share of shared expenses) is
+frozen into ``monthly_snapshots`` / ``monthly_snapshot_categories`` by the
+month-close job. ``record_spend_changes`` drops the snapshot of any closed
+month a write touches; reports sum months without a snapshot live until
+the next job run freezes them again.
+"""
+
+from datetime import date, datetime
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import and_, exists, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.couple import Couple, SharedExpense
+from app.models.expense import Expense
+from app.models.report import MonthlySnapshot, MonthlySnapshotCategory
+from app.models.types import to_money
+from app.models.user import User
+
+
+def month_key(year: int, month: int) -> str:
+    return f"{int(year):04d}-{int(month):02d}"
+
+
+def _month_index(model):
+    return model.year * 12 + model.month
+
+
+def load_snapshots(db: Session, user_id: int, start_month: date, end_month: date) -> dict[str, dict[str, float]]:
+    """{"YYYY-MM": {category: amount}} for the user's snapshotted months in [start_month, end_month)."""
+    rows = db.execute(
+        select(
+            MonthlySnapshot.year,
+            MonthlySnapshot.month,
+            MonthlySnapshotCategory.category,
+            MonthlySnapshotCategory.personal + MonthlySnapshotCategory.shared,
+        )
+        .select_from(MonthlySnapshot)
+        .outerjoin(
+            MonthlySnapshotCategory,
+            and_(
+                MonthlySnapshotCategory.user_id == MonthlySnapshot.user_id,
+                MonthlySnapshotCategory.year == MonthlySnapshot.year,
+                MonthlySnapshotCategory.month == MonthlySnapshot.month,
+            ),
+        )
+        .where(
+            and_(
+                MonthlySnapshot.user_id == user_id,
+                _month_index(MonthlySnapshot) >= start_month.year * 12 + start_month.month,
+                _month_index(MonthlySnapshot) < end_month.year * 12 + end_month.month,
+            )
+        )
+    ).all()
+
+    totals: dict[str, dict[str, float]] = {}
+    for year, month, category, amount in rows:
+        cats = totals.setdefault(month_key(year, month), {})
+        if category is not None:  # a closed month with no spend has no category rows
+            cats[category] = amount
+    return totals
+
+
+def invalidate_snapshots(
+    db: Session, user_id: int, months: Optional[Iterable[Tuple[int, int]]] = None
+) -> None:
+    """Drop the user's snapshots for the given (year, month) pairs, or all of them."""
+    if months is not None:
+        months = sorted(set(months))
+        if not months:
+            return
+    for model in (MonthlySnapshotCategory, MonthlySnapshot):
+        query = db.query(model).filter(model.user_id == user_id)
+        if months is not None:
+            query = query.filter(or_(*(and_(model.year == y, model.month == m) for y, m in months)))
+        query.delete(synchronize_session=False)
+
+
+def close_month(db: Session, year: int, month: int) -> int:
+    """Snapshot (year, month) for every user who existed then and has no snapshot for it.
+
+    Returns the number of snapshots written; the caller commits.
+    """
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    pending = select(User.id).where(
+        and_(
+            User.created_at < datetime(end.year, end.month, end.day),
+            ~exists().where(
+                and_(
+                    MonthlySnapshot.user_id == User.id,
+                    MonthlySnapshot.year == year,
+                    MonthlySnapshot.month == month,
+                )
+            ),
+        )
+    )
+    user_ids = db.execute(pending).scalars().all()
+    if not user_ids:
+        return 0
+
+    # (user_id, category) -> [personal, shared]
+    breakdown: dict[tuple[int, str], list[float]] = {}
+    personal = db.execute(
+        select(Expense.user_id, Expense.category, func.sum(Expense.amount))
+        .where(and_(Expense.user_id.in_(pending), Expense.date >= start, Expense.date < end))
+        .group_by(Expense.user_id, Expense.category)
+    )
+    for user_id, category, amount in personal:
+        breakdown.setdefault((user_id, category), [0.0, 0.0])[0] = amount
+
+    for owner, share in ((Couple.user_1_id, SharedExpense.user_1_share), (Couple.user_2_id, SharedExpense.user_2_share)):
+        shared = db.execute(
+            select(owner, SharedExpense.category, func.sum(share))
+            .join(Couple, Couple.id == SharedExpense.couple_id)
+            .where(
+                and_(
+                    Couple.status == "active",
+                    owner.in_(pending),
+                    SharedExpense.date >= start,
+                    SharedExpense.date < end,
+                )
+            )
+            .group_by(owner, SharedExpense.category)
+        )
+        for user_id, category, amount in shared:
+            breakdown.setdefault((user_id, category), [0.0, 0.0])[1] += amount
+
+    totals = {user_id: [0.0, 0.0] for user_id in user_ids}
+    for (user_id, _), (personal_amount, shared_amount) in breakdown.items():
+        totals[user_id][0] += personal_amount
+        totals[user_id][1] += shared_amount
+
+    db.execute(
+        insert(MonthlySnapshot),
+        [
+            {"user_id": user_id, "year": year, "month": month, "personal_total": p, "shared_total": s}
+            for user_id, (p, s) in totals.items()
+        ],
+    )
+    if breakdown:
+        db.execute(
+            insert(MonthlySnapshotCategory),
+            [
+                {"user_id": user_id, "year": year, "month": month, "category": category, "personal": p, "shared": s}
+                for (user_id, category), (p, s) in breakdown.items()
+            ],
+        )
+    return len(totals)
+
+
+def move_snapshot_category(
+    db: Session,
+    user_id: int,
+    old: str,
+    new: str,
+    personal: bool = True,
+    shared: Optional[dict[Tuple[int, int], float]] = None,
+) -> None:
+    """Move the user's ``old`` snapshot amounts onto ``new``, month by month.
+
+    Used when a category is renamed or merged, so snapshots stay valid
+    without being rebuilt. ``personal`` moves all personal spend; ``shared``
+    maps (year, month) to the amount of shared spend to move, since only
+    the shared expenses the renaming user paid for are relabelled.
+    Monthly totals are unchanged.
+    """
+    shared = shared or {}
+    rows = (
+        db.query(MonthlySnapshotCategory)
+        .filter(
+            and_(
+                MonthlySnapshotCategory.user_id == user_id,
+                MonthlySnapshotCategory.category.in_([old, new]),
+            )
+        )
+        .all()
+    )
+    by_month: dict[tuple[int, int], dict[str, MonthlySnapshotCategory]] = {}
+    for row in rows:
+        by_month.setdefault((row.year, row.month), {})[row.category] = row
+
+    for (year, month), cats in by_month.items():
+        source, target = cats.get(old), cats.get(new)
+        if source is None:
+            continue
+        held = {"personal": to_money(source.personal), "shared": to_money(source.shared)}
+        moves = {
+            "personal": held["personal"] if personal else to_money(0),
+            "shared": min(to_money(shared.get((year, month), 0)), held["shared"]),
+        }
+        if not any(moves.values()):
+            continue
+        if target is None and moves == held:
+            source.category = new
+            continue
+        if target is None:
+            target = MonthlySnapshotCategory(
+                user_id=user_id, year=year, month=month, category=new, personal=0.0, shared=0.0
+            )
+            db.add(target)
+        for column, amount in moves.items():
+            setattr(target, column, float(to_money(getattr(target, column)) + amount))
+            setattr(source, column, float(held[column] - amount))
+        if not source.personal and not source.shared:
+            db.delete(source)
@@ -0,0 +1,77 @@
+"""Shared-expense splits.
+
+``split_ratio`` is parsed once, when a shared expense is flushed, and each
+partner's share is stored in ``user_1_share`` / ``user_2_share``. Balances,
+dashboards, reports and budget checks read or ``SUM()`` those columns
+instead of re-parsing the ratio per row.
+
+Bulk loaders that bypass the ORM must fill the share columns themselves
+with ``split_shares``.
+"""
+
+from decimal import Decimal
+
+from sqlalchemy import event
+
+from app.models.couple import Couple, SharedExpense
+from app.models.types import to_money
+
+
+def calculate_split(amount: float, split_type: str, split_ratio: str, paid_by_is_user1: bool = True):
+    """Return (user1_share, user2_share)."""
+    parts = split_ratio.split(":")
+    if len(parts) != 2:
+        half = amount / 2
+        return half, half
+    if split_type == "equal":
+        half = amount / 2
+        return half, half
+    elif split_type == "percentage":
+        try:
+            p1 = float(parts[0])
+            p2 = float(parts[1])
+        except ValueError:
+            half = amount / 2
+            return half, half
+        # Validate percentages sum to 100
+        if abs((p1 + p2) - 100) > 0.01:
+            half = amount / 2
+            return half, half
+        return amount * p1 / 100, amount * p2 / 100
+    elif split_type == "custom":
+        try:
+            s1 = float(parts[0])
+            s2 = float(parts[1])
+        except ValueError:
+            half = amount / 2
+            return half, half
+        return s1, s2
+    else:
+        half = amount / 2
+        return half, half
+
+
+def share_column(couple: Couple, user_id: int):
+    """The share column holding ``user_id``'s part of the couple's shared expenses."""
+    return SharedExpense.user_1_share if couple.user_1_id == user_id else SharedExpense.user_2_share
+
+
+def split_shares(amount: float, split_type: str, split_ratio: str) -> tuple[Decimal, Decimal]:
+    """The (user_1_share, user_2_share) stored for a shared expense."""
+    user_1_share, user_2_share = calculate_split(amount, split_type, split_ratio)
+    if split_type == "custom":
+        return to_money(user_1_share), to_money(user_2_share)
+    # Round one share and give the remainder to the other, so the shares
+    # of a proportional split always add up to the amount to the paisa
+    user_1_share = to_money(user_1_share)
+    return user_1_share, to_money(amount) - user_1_share
+
+
+@event.listens_for(SharedExpense, "before_insert")
+@event.listens_for(SharedExpense, "before_update")
+def _store_shares(mapper, connection, target: SharedExpense) -> None:
+    user_1_share, user_2_share = split_shares(
+        target.amount, target.split_type or "equal", target.split_ratio or "50:50"
+    )
+    # Same type as the columns load, for code reading the shares after flush
+    target.user_1_share, target.user_2_share = float(user_1_share), float(user_2_share)
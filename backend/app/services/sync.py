@@ -0,0 +1,135 @@
+"""Delta sync support: change counters, change tokens and tombstones.
+
+Every user and couple has a change counter (``sync_seq``). A flush that
+writes or deletes a synced row bumps its owner's counter with an UPDATE in
+the same transaction and stamps the row (or its tombstone) with the new
+value in ``change_seq``. The UPDATE holds the owner's row lock until
+commit, so an owner's counter values commit in order: once a sync has read
+counter ``n``, every row committed later is stamped above ``n``. The change
+token carries the user's and the couple's counters, read before the rows,
+so nothing is missed and no clock is involved. Rows written while a sync
+runs may be sent twice; clients apply changes as idempotent upserts keyed
+by id.
+
+The counter UPDATE makes each owner's row a serialization point: two
+transactions writing synced rows for the same user (or couple) take turns,
+the second waiting for the first to commit. Writes for one owner come from
+a single person or couple, so this is cheap; a long-running transaction
+that writes synced rows blocks that owner's other writes until it ends.
+
+ORM flushes are stamped automatically. Set-based ``query.update()`` /
+``query.delete()`` calls and Core inserts bypass the ORM: they must take a
+value from ``advance_change_seq`` and set ``change_seq`` themselves, and
+deletes must record ``write_tombstones``.
+"""
+
+from typing import Iterable, NamedTuple, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.budget import Budget
+from app.models.couple import Couple, SharedExpense, Settlement
+from app.models.expense import Expense, RecurringExpense, UserCategory
+from app.models.sync import SyncTombstone
+from app.models.user import User
+
+# model -> (entity name, owner column: "user_id" or "couple_id")
+SYNCED_MODELS = {
+    Expense: ("expense", "user_id"),
+    RecurringExpense: ("recurring_expense", "user_id"),
+    UserCategory: ("category", "user_id"),
+    Budget: ("budget", "user_id"),
+    SharedExpense: ("shared_expense", "couple_id"),
+    Settlement: ("settlement", "couple_id"),
+}
+
+# Couples before users, so concurrent flushes take the row locks in the same order
+_OWNERS = {"couple_id": Couple, "user_id": User}
+
+
+class SyncToken(NamedTuple):
+    user_seq: int
+    couple_id: int  # 0 without an active couple
+    couple_seq: int
+
+
+def encode_token(token: SyncToken) -> str:
+    return ".".join(str(part) for part in token)
+
+
+def decode_token(token: Optional[str]) -> Optional[SyncToken]:
+    if not token:
+        return None
+    try:
+        values = [int(part) for part in token.split(".")]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+    if len(values) != 3 or min(values) < 0:
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+    return SyncToken(*values)
+
+
+def advance_change_seq(db: Session, owner: str, owner_ids: Iterable[int]) -> dict[int, int]:
+    """Bump the change counters of the given users (``owner="user_id"``) or couples; returns {id: new value}."""
+    owner_ids = sorted(set(owner_ids))
+    if not owner_ids:
+        return {}
+    model = _OWNERS[owner]
+    rows = db.connection().execute(
+        update(model)
+        .where(model.id.in_(owner_ids))
+        .values(sync_seq=model.sync_seq + 1)
+        .returning(model.id, model.sync_seq)
+        .execution_options(synchronize_session=False)
+    )
+    return dict(rows.all())
+
+
+def write_tombstones(db: Session, model, ids: Iterable[int], owner_id: int) -> None:
+    """Record rows removed by a set-based ``query.delete()``, which skips ``before_flush``."""
+    entity, owner = SYNCED_MODELS[model]
+    ids = list(ids)
+    if not ids:
+        return
+    seq = advance_change_seq(db, owner, [owner_id])[owner_id]
+    db.execute(
+        insert(SyncTombstone),
+        [{"entity": entity, "entity_id": entity_id, owner: owner_id, "change_seq": seq} for entity_id in ids],
+    )
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _stamp_changes(session: Session, flush_context, instances) -> None:
+    written = [
+        obj
+        for obj in (*session.new, *(o for o in session.dirty if session.is_modified(o)))
+        if type(obj) in SYNCED_MODELS
+    ]
+    deleted = [obj for obj in session.deleted if type(obj) in SYNCED_MODELS]
+    if not written and not deleted:
+        return
+
+    seqs = {}
+    for owner in _OWNERS:
+        owner_ids = {
+            getattr(obj, owner) for obj in (*written, *deleted) if SYNCED_MODELS[type(obj)][1] == owner
+        }
+        seqs[owner] = advance_change_seq(session, owner, owner_ids)
+
+    for obj in written:
+        owner = SYNCED_MODELS[type(obj)][1]
+        obj.change_seq = seqs[owner][getattr(obj, owner)]
+    for obj in deleted:
+        entity, owner = SYNCED_MODELS[type(obj)]
+        session.add(
+            SyncTombstone(
+                entity=entity,
+                entity_id=obj.id,
+                user_id=obj.user_id if owner == "user_id" else None,
+                couple_id=obj.couple_id if owner == "couple_id" else None,
+                change_seq=seqs[owner][getattr(obj, owner)],
+            )
+        )
@@ -0,0 +1,169 @@
+"""Micro-benchmarks for pure-Python hot paths.
+
+Times ``calculate_split``, ``_compute_next_date``, the reports month
+bucketing and response-model construction over synthetic rows at several
+sizes, without a database. Run from ``backend/``:
+
+    python -m benchmarks.bench_helpers [--sizes 1000 10000 100000] \\
+        [--baseline benchmarks/baselines/bench_helpers.json] [--threshold 0.25]
+
+With ``--baseline``, the run fails (exit status 1) when any case is slower
+than its stored time by more than ``--threshold``. Store a new baseline
+with ``--write-baseline`` after an intentional change; baselines are
+machine-specific.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+
+from app.api.expenses import _compute_next_date
+from app.api.reports import bucket_by_month
+from app.models.couple import SharedExpense
+from app.models.expense import Expense, RecurringExpense
+from app.schemas.couple import SharedExpenseResponse
+from app.schemas.expense import ExpenseResponse
+from app.services.categories import DEFAULT_CATEGORIES
+from app.services.splits import calculate_split
+
+CATEGORIES = [c["name"] for c in DEFAULT_CATEGORIES]
+SPLITS = (("equal", "50:50"), ("percentage", "60:40"), ("custom", "300:700"), ("equal", "bad"))
+
+
+def build_rows(n: int, seed: int):
+    """Transient ORM instances shaped like seeded data, spread over two years."""
+    rng = random.Random(seed)
+    today = date.today()
+    created = datetime(2024, 1, 1, 12, 0, 0)
+    expenses, shared, recurring = [], [], []
+    for i in range(n):
+        d = today - timedelta(days=rng.randrange(730))
+        category = rng.choice(CATEGORIES)
+        expenses.append(Expense(
+            id=i, user_id=1, amount=round(rng.uniform(50, 5000), 2), category=category,
+            expense_type="personal", date=d, description=f"Expense {i}", is_recurring=False,
+            recurring_id=None, created_at=created,
+        ))
+        split_type, ratio = rng.choice(SPLITS)
+        amount = round(rng.uniform(50, 5000), 2)
+        u1, u2 = calculate_split(amount, split_type, ratio)
+        shared.append(SharedExpense(
+            id=i, couple_id=1, paid_by_user_id=rng.choice((1, 2)), amount=amount,
+            category=category, description=None, split_type=split_type, split_ratio=ratio, date=d,
+            paid_from_joint=False, user_1_share=u1, user_2_share=u2, created_at=created,
+        ))
+        recurring.append(RecurringExpense(
+            frequency=rng.choice(("monthly", "weekly", "yearly")), day_of_month=rng.randint(1, 31),
+            day_of_week=rng.randint(0, 6), next_date=d, start_date=d,
+        ))
+    return expenses, shared, recurring
+
+
+def cases(expenses, shared, recurring):
+    names = {1: "Asha", 2: "Rahul"}
+
+    def split_all():
+        for e in shared:
+            calculate_split(e.amount, e.split_type, e.split_ratio, e.paid_by_user_id == 1)
+
+    def next_dates():
+        for r in recurring:
+            _compute_next_date(r.frequency, r.day_of_month, r.day_of_week, after=r.next_date,
+                               start_month=r.start_date.month)
+
+    # What the reports query returns, one row per expense in the worst case
+    grouped = [(e.date.year, e.date.month, e.category, e.amount) for e in expenses]
+
+    def bucketing():
+        bucket_by_month(grouped)
+
+    def shared_responses():
+        for e in shared:
+            SharedExpenseResponse(
+                id=e.id, couple_id=e.couple_id, paid_by_user_id=e.paid_by_user_id,
+                paid_by_name=names.get(e.paid_by_user_id), amount=e.amount, category=e.category,
+                description=e.description, split_type=e.split_type, split_ratio=e.split_ratio,
+                date=e.date, paid_from_joint=e.paid_from_joint or False, created_at=e.created_at,
+            )
+
+    def expense_responses():
+        # What FastAPI does for response_model=List[ExpenseResponse] with ORM rows
+        for e in expenses:
+            ExpenseResponse.model_validate(e)
+
+    return {
+        "calculate_split": split_all,
+        "compute_next_date": next_dates,
+        "report_bucketing": bucketing,
+        "shared_expense_response": shared_responses,
+        "expense_response": expense_responses,
+    }
+
+
+def run(sizes: list[int], repeat: int, seed: int) -> dict:
+    results = {}
+    for n in sizes:
+        rows = build_rows(n, seed)
+        for name, fn in cases(*rows).items():
+            # Fewer repeats for the largest inputs keeps the full run around a minute
+            best = min(timeit.repeat(fn, number=1, repeat=repeat if n <= 10000 else max(3, repeat // 2)))
+            results[f"{name}[{n}]"] = {
+                "ms": round(best * 1000, 3),
+                "ns_per_row": round(best / n * 1e9, 1),
+            }
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    failures = []
+    for key, base in baseline["results"].items():
+        current = results.get(key)
+        if current and current["ms"] > base["ms"] * (1 + threshold):
+            failures.append(f"{key}: {current['ms']} ms vs baseline {base['ms']} ms")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against stored results")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--write-baseline", metavar="PATH", help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat, args.seed)
+    report = {
+        "meta": {"python": platform.python_version(), "machine": f"{platform.system()} {platform.machine()}"},
+        "results": results,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'case':>34} {'ms':>10} {'ns/row':>9}")
+        for key, r in results.items():
+            print(f"{key:>34} {r['ms']:>10} {r['ns_per_row']:>9}")
+
+    if args.write_baseline:
+        with open(args.write_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(results, json.load(f), args.threshold)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
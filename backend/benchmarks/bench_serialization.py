@@ -0,0 +1,164 @@
+"""Compare JSON serialization CPU time and bytes on the wire for heavy payloads.
+
+Builds response models shaped like the largest endpoints (24-month reports,
+a long shared-expense list and a joint-account summary), then measures the
+stdlib ``JSONResponse`` against ``ORJSONResponse`` and the compressed size
+with gzip and Brotli. Run from ``backend/``:
+
+    python -m benchmarks.bench_serialization [--rows 2000] [--repeat 20] [--json]
+"""
+
+import argparse
+import gzip
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.reports import BudgetVarianceItem, CategoryAmount, MonthlyBreakdown, ReportsResponse, TrendPoint
+from app.services.categories import DEFAULT_CATEGORIES
+from app.schemas.couple import (
+    JointAccountContributionResponse, JointAccountResponse, JointAccountSummary,
+    JointAccountTransactionResponse, SharedExpenseResponse,
+)
+
+CATEGORIES = [c["name"] for c in DEFAULT_CATEGORIES]
+
+
+def build_reports(rng: random.Random) -> ReportsResponse:
+    months = []
+    for i in range(24):
+        cats = [
+            CategoryAmount(category=c, total=round(rng.uniform(100, 20000), 2), percentage=round(rng.uniform(0, 40), 2))
+            for c in CATEGORIES
+        ]
+        months.append(MonthlyBreakdown(month=f"{2024 + i // 12}-{i % 12 + 1:02d}", total=sum(c.total for c in cats), categories=cats))
+    return ReportsResponse(
+        monthly_breakdown=months,
+        spending_trends=[TrendPoint(month=m.month, total=m.total) for m in months],
+        budget_variance=[
+            BudgetVarianceItem(category=c, budget=10000, actual=5000, variance=5000, percent_used=50.0)
+            for c in CATEGORIES
+        ],
+    )
+
+
+def build_shared_expenses(rng: random.Random, rows: int) -> list[SharedExpenseResponse]:
+    start = date(2023, 1, 1)
+    return [
+        SharedExpenseResponse(
+            id=i,
+            couple_id=1,
+            paid_by_user_id=rng.choice((1, 2)),
+            paid_by_name=rng.choice(("Asha", "Rahul")),
+            amount=round(rng.uniform(50, 5000), 2),
+            category=rng.choice(CATEGORIES),
+            description=f"Shared expense #{i}",
+            split_type="equal",
+            split_ratio="50:50",
+            date=start + timedelta(days=i % 700),
+            paid_from_joint=rng.random() < 0.3,
+            created_at=datetime(2024, 1, 1, 12, 0, 0),
+        )
+        for i in range(rows)
+    ]
+
+
+def build_joint_summary(rng: random.Random) -> JointAccountSummary:
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return JointAccountSummary(
+        account=JointAccountResponse(id=1, couple_id=1, account_name="Joint Account", is_active=True, total_balance=12345.67, created_at=now),
+        total_contributions=500000.0,
+        total_spent=487654.33,
+        balance=12345.67,
+        user_1_contributed=250000.0,
+        user_2_contributed=250000.0,
+        user_1_percent=50.0,
+        user_2_percent=50.0,
+        recent_contributions=[
+            JointAccountContributionResponse(
+                id=i, joint_account_id=1, user_id=1, user_name="Asha", amount=round(rng.uniform(1000, 50000), 2),
+                contribution_type="salary", note=None, date=date(2024, 1, 1), created_at=now,
+            )
+            for i in range(20)
+        ],
+        recent_transactions=[
+            JointAccountTransactionResponse(
+                id=i, joint_account_id=1, shared_expense_id=i, amount=round(rng.uniform(50, 5000), 2),
+                description="Food: groceries", date=date(2024, 1, 1), created_at=now,
+            )
+            for i in range(20)
+        ],
+    )
+
+
+def _time(fn, repeat: int) -> float:
+    """Best-of-``repeat`` CPU time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return best * 1000
+
+
+def measure(name: str, payload, repeat: int) -> dict:
+    # FastAPI runs jsonable_encoder before render(); both are timed separately
+    encoders = {"stdlib": JSONResponse}
+    try:
+        from fastapi.responses import ORJSONResponse
+        import orjson  # noqa: F401
+
+        encoders["orjson"] = ORJSONResponse
+    except ImportError:
+        pass
+
+    result = {"payload": name}
+    result["encoder_ms"] = round(_time(lambda: jsonable_encoder(payload), repeat), 3)
+    content = jsonable_encoder(payload)
+    for label, response_class in encoders.items():
+        render = response_class(content=None).render
+        result[f"{label}_render_ms"] = round(_time(lambda: render(content), repeat), 3)
+        body = render(content)
+
+    result["raw_bytes"] = len(body)
+    result["gzip_bytes"] = len(gzip.compress(body, compresslevel=6))
+    try:
+        import brotli
+
+        result["brotli_bytes"] = len(brotli.compress(body, quality=4))
+    except ImportError:
+        pass
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000, help="shared expense rows")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = {
+        "reports_24_months": build_reports(rng),
+        f"shared_expenses_{args.rows}": build_shared_expenses(rng, args.rows),
+        "joint_account_summary": build_joint_summary(rng),
+    }
+    results = [measure(name, payload, args.repeat) for name, payload in payloads.items()]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    columns = list(results[0].keys())
+    print("  ".join(f"{c:>24}" if i == 0 else f"{c:>12}" for i, c in enumerate(columns)))
+    for row in results:
+        print("  ".join(f"{str(row.get(c, '-')):>24}" if i == 0 else f"{str(row.get(c, '-')):>12}" for i, c in enumerate(columns)))
+
+
+if __name__ == "__main__":
+    main()
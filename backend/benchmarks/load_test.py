@@ -0,0 +1,267 @@
+"""Load-test a running API with a realistic traffic mix.
+
+Virtual users log in as users created by ``benchmarks.seed_data`` and loop
+over a weighted mix of requests (dashboards, expense creation, filtered
+listing, couple balance, reports and exports) for a fixed duration. The
+run is summarised as throughput and p50/p95/p99 latency per scenario.
+
+    uvicorn app.main:app --workers 4 &
+    python -m benchmarks.load_test --users 50 --duration 60 --json results.json \\
+        --baseline benchmarks/baselines/load_test.json
+
+With ``--baseline``, the run fails (exit status 1) when a scenario's p95
+regresses by more than ``--threshold`` or its error rate rises. Baselines
+are machine- and dataset-specific: regenerate them with
+``--write-baseline`` on the machine that compares against them. The
+``create_expense`` scenario writes rows, so restore the seeded database
+between runs that are meant to be compared.
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import threading
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+
+import httpx
+from sqlalchemy import create_engine, select
+
+from app.core.config import get_settings
+from app.services.categories import DEFAULT_CATEGORIES
+from app.models.couple import Couple
+from app.models.user import User
+from benchmarks.seed_data import EMAIL_DOMAIN, PASSWORD
+
+CATEGORIES = [c["name"] for c in DEFAULT_CATEGORIES]
+
+VirtualUser = namedtuple("VirtualUser", "email in_couple")
+
+
+# ─── Scenarios ───────────────────────────────────────────────────────────────
+# Each takes (client, rng, user) and returns the response, or None when the
+# scenario does not apply to this user.
+
+def dashboard(client, rng, user):
+    return client.get("/api/dashboard/individual")
+
+
+def couple_dashboard(client, rng, user):
+    return client.get("/api/dashboard/couple") if user.in_couple else None
+
+
+def create_expense(client, rng, user):
+    category = rng.choice(CATEGORIES)
+    return client.post("/api/expenses/", json={
+        "amount": round(rng.uniform(50, 3000), 2),
+        "category": category,
+        "date": (date.today() - timedelta(days=rng.randint(0, 10))).isoformat(),
+        "description": f"Load test {category}",
+    })
+
+
+def list_expenses(client, rng, user):
+    params = {"limit": 50, "start_date": (date.today() - timedelta(days=90)).isoformat()}
+    if rng.random() < 0.5:
+        params["category"] = rng.choice(CATEGORIES)
+    if rng.random() < 0.2:
+        params["search"] = rng.choice(CATEGORIES)[:3].lower()
+    return client.get("/api/expenses/", params=params)
+
+
+def couple_balance(client, rng, user):
+    return client.get("/api/couple/balance") if user.in_couple else None
+
+
+def shared_expenses(client, rng, user):
+    return client.get("/api/couple/expenses") if user.in_couple else None
+
+
+def reports(client, rng, user):
+    return client.get("/api/reports", params={"months": rng.choice((3, 6, 12))})
+
+
+def export_expenses(client, rng, user):
+    start = (date.today() - timedelta(days=365)).isoformat()
+    return client.get("/api/expenses/export", params={"start_date": start})
+
+
+def login(client, rng, user):
+    return client.post("/api/auth/login", json={"email": user.email, "password": PASSWORD})
+
+
+SCENARIOS = {  # name -> (weight, function)
+    "dashboard": (20, dashboard),
+    "couple_dashboard": (8, couple_dashboard),
+    "create_expense": (12, create_expense),
+    "list_expenses": (20, list_expenses),
+    "couple_balance": (10, couple_balance),
+    "shared_expenses": (8, shared_expenses),
+    "reports": (10, reports),
+    "export_expenses": (4, export_expenses),
+    "login": (3, login),
+}
+
+
+# ─── Runner ──────────────────────────────────────────────────────────────────
+
+def pick_users(database_url: str, count: int, seed: int) -> list[VirtualUser]:
+    """Sample seeded users; couple scenarios only run for users in a couple."""
+    engine = create_engine(database_url)
+    with engine.connect() as conn:
+        coupled = set(conn.execute(
+            select(Couple.user_1_id).where(Couple.status == "active")
+            .union(select(Couple.user_2_id).where(Couple.status == "active"))
+        ).scalars())
+        users = conn.execute(
+            select(User.id, User.email).where(User.email.like(f"%@{EMAIL_DOMAIN}")).order_by(User.id)
+        ).all()
+    engine.dispose()
+    if not users:
+        raise SystemExit("No seeded users found; run `python -m benchmarks.seed_data` first")
+    rng = random.Random(seed)
+    sample = rng.sample(users, min(count, len(users)))
+    return [VirtualUser(email, uid in coupled) for uid, email in sample]
+
+
+def run_virtual_user(base_url, user, seed, deadline, results, lock):
+    rng = random.Random(seed)
+    names = list(SCENARIOS)
+    weights = [SCENARIOS[n][0] for n in names]
+    samples: dict[str, list] = {n: [] for n in names}
+
+    with httpx.Client(base_url=base_url, timeout=60, headers={"Accept-Encoding": "gzip"}) as client:
+        r = client.post("/api/auth/login", json={"email": user.email, "password": PASSWORD})
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                response = SCENARIOS[name][1](client, rng, user)
+                if response is None:
+                    continue
+                response.read()
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            samples[name].append((time.perf_counter() - start, ok))
+
+    with lock:
+        for name, values in samples.items():
+            results.setdefault(name, []).extend(values)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank method
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarise(samples: list[tuple[float, bool]], elapsed: float) -> dict:
+    latencies = sorted(s[0] * 1000 for s in samples)
+    errors = sum(1 for s in samples if not s[1])
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "throughput_rps": round(len(samples) / elapsed, 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    failures = []
+    for name, base in baseline["scenarios"].items():
+        current = report["scenarios"].get(name)
+        if not current or not base["requests"]:
+            continue
+        limit = base["p95_ms"] * (1 + threshold)
+        if current["p95_ms"] > limit:
+            failures.append(f"{name}: p95 {current['p95_ms']} ms > {limit:.2f} ms (baseline {base['p95_ms']} ms)")
+        if current["error_rate"] > base["error_rate"] + 0.01:
+            failures.append(f"{name}: error rate {current['error_rate']:.2%} (baseline {base['error_rate']:.2%})")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--database-url", default=get_settings().DATABASE_URL, help="used to pick seeded users")
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", metavar="PATH", help="write the report to PATH ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a stored report")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed p95 regression (0.2 = 20%%)")
+    parser.add_argument("--write-baseline", metavar="PATH", help="store this run as the new baseline")
+    args = parser.parse_args()
+
+    users = pick_users(args.database_url, args.users, args.seed)
+    results: dict[str, list] = {}
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + args.duration
+    threads = [
+        threading.Thread(
+            target=run_virtual_user,
+            args=(args.base_url, user, args.seed + i, deadline, results, lock),
+        )
+        for i, user in enumerate(users)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "meta": {
+            "base_url": args.base_url,
+            "database": create_engine(args.database_url).dialect.name,
+            "virtual_users": len(users),
+            "duration_s": round(elapsed, 1),
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}",
+        },
+        "total": summarise([s for v in results.values() for s in v], elapsed),
+        "scenarios": {name: summarise(results[name], elapsed) for name in SCENARIOS if results.get(name)},
+    }
+
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+        print(f"{'scenario':>18} {'req':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+        for name, s in [*report["scenarios"].items(), ("total", report["total"])]:
+            print(f"{name:>18} {s['requests']:>7} {s['errors']:>5} {s['throughput_rps']:>8} "
+                  f"{s['p50_ms']:>8} {s['p95_ms']:>8} {s['p99_ms']:>8}")
+
+    if args.write_baseline:
+        with open(args.write_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(report, json.load(f), args.threshold)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
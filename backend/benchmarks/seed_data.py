@@ -0,0 +1,367 @@
+"""Generate a large, realistic dataset for benchmarking.
+
+Creates users with personal expenses, recurring templates, custom
+categories, budgets, salary credits and notifications, and pairs a share
+of them into couples with years of shared expenses, settlements, savings
+goals and joint-account history. Rows are built from the existing models'
+tables and bulk-loaded with COPY on PostgreSQL (multi-row INSERTs
+elsewhere), bypassing the ORM and its session hooks. Run from ``backend/``
+against a migrated database:
+
+    python -m benchmarks.seed_data --users 5000 --expenses-per-month 80 --months 24
+
+That is roughly 10M personal expenses. Output is deterministic for a given
+``--seed`` and starting database. Every seeded user's password is
+``password123``.
+"""
+
+import argparse
+import csv
+import io
+import math
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, func, select, text
+
+from app.core.config import get_settings
+from app.core.database import Base
+from app.core.security import get_password_hash
+from app.services.categories import DEFAULT_CATEGORIES
+from app.models.budget import Budget, Notification
+from app.models.couple import (
+    Couple, JointAccount, JointAccountContribution, JointAccountTransaction,
+    SavingsContribution, SavingsGoal, Settlement, SharedExpense,
+)
+from app.models.expense import Expense, RecurringExpense, UserCategory
+from app.models.salary import SalaryCredit
+from app.models.user import User
+from app.services.splits import split_shares
+
+PASSWORD = "password123"
+EMAIL_DOMAIN = "seed.example.com"
+
+# (weight, median amount) per default category; amounts are log-normal
+CATEGORY_PROFILE = {
+    "Food": (30, 450),
+    "Rent": (2, 18000),
+    "Utilities": (6, 1500),
+    "Travel": (8, 2500),
+    "Shopping": (18, 1800),
+    "Subscriptions": (6, 499),
+    "EMI": (2, 12000),
+    "Entertainment": (12, 800),
+    "Health": (6, 1200),
+    "Other": (10, 600),
+}
+CATEGORIES = [c["name"] for c in DEFAULT_CATEGORIES]
+CATEGORY_WEIGHTS = [CATEGORY_PROFILE[c][0] for c in CATEGORIES]
+SPLITS = (("equal", "50:50"), ("percentage", "60:40"), ("percentage", "70:30"), ("custom", None))
+SPLIT_WEIGHTS = (70, 12, 8, 10)
+
+COLUMNS = {
+    User: ("id", "name", "email", "password_hash", "monthly_income", "salary_date", "monthly_budget",
+           "is_active", "data_version", "created_at", "updated_at"),
+    UserCategory: ("id", "user_id", "name", "icon", "color", "created_at", "updated_at"),
+    Budget: ("id", "user_id", "category", "monthly_limit", "created_at", "updated_at"),
+    SalaryCredit: ("id", "user_id", "amount", "credited_date", "month", "year", "created_at"),
+    Notification: ("id", "user_id", "title", "message", "notification_type", "is_read", "created_at"),
+    RecurringExpense: ("id", "user_id", "amount", "category", "description", "frequency", "day_of_month",
+                       "is_active", "next_date", "start_date", "created_at", "updated_at"),
+    Expense: ("id", "user_id", "amount", "category", "expense_type", "date", "description",
+              "is_recurring", "recurring_id", "created_at", "updated_at"),
+    Couple: ("id", "user_1_id", "user_2_id", "status", "created_at"),
+    SharedExpense: ("id", "couple_id", "paid_by_user_id", "amount", "category", "description",
+                    "split_type", "split_ratio", "date", "paid_from_joint", "user_1_share", "user_2_share",
+                    "created_at", "updated_at"),
+    Settlement: ("id", "couple_id", "paid_by_user_id", "paid_to_user_id", "amount", "note",
+                 "created_at", "updated_at"),
+    SavingsGoal: ("id", "couple_id", "title", "target_amount", "current_amount", "deadline",
+                  "is_completed", "created_at"),
+    SavingsContribution: ("id", "goal_id", "user_id", "amount", "created_at"),
+    JointAccount: ("id", "couple_id", "account_name", "is_active", "created_at"),
+    JointAccountContribution: ("id", "joint_account_id", "user_id", "amount", "contribution_type",
+                               "note", "date", "created_at"),
+    JointAccountTransaction: ("id", "joint_account_id", "shared_expense_id", "amount", "description",
+                              "date", "created_at"),
+}
+
+
+class BulkLoader:
+    """Buffer rows per table and load them in foreign-key order."""
+
+    def __init__(self, conn, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.copy = conn.dialect.name == "postgresql"
+        self.buffers = {model: [] for model in COLUMNS}
+        self.next_ids = {
+            model: (conn.execute(select(func.max(model.__table__.c.id))).scalar() or 0) + 1
+            for model in COLUMNS
+        }
+        self.counts = {model: 0 for model in COLUMNS}
+        self.pending = 0
+        for model, columns in COLUMNS.items():
+            missing = set(columns) - set(model.__table__.c.keys())
+            if missing:
+                raise SystemExit(f"{model.__tablename__} has no column(s) {sorted(missing)}; update COLUMNS")
+
+    def next_id(self, model) -> int:
+        value = self.next_ids[model]
+        self.next_ids[model] += 1
+        return value
+
+    def add(self, model, row: tuple) -> None:
+        self.buffers[model].append(row)
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        # Parents before children, so foreign keys are satisfied per batch
+        for model in COLUMNS:
+            rows = self.buffers[model]
+            if not rows:
+                continue
+            if self.copy:
+                self._copy(model, rows)
+            else:
+                columns = COLUMNS[model]
+                self.conn.execute(model.__table__.insert(), [dict(zip(columns, r)) for r in rows])
+            self.counts[model] += len(rows)
+            self.buffers[model] = []
+        self.pending = 0
+
+    def _copy(self, model, rows: list) -> None:
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        buf.seek(0)
+        cursor = self.conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {model.__tablename__} ({', '.join(COLUMNS[model])}) FROM STDIN WITH (FORMAT csv)", buf
+            )
+        finally:
+            cursor.close()
+
+    def finish(self) -> None:
+        self.flush()
+        if self.copy:
+            for model in COLUMNS:
+                table = model.__tablename__
+                self.conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+                ))
+
+
+class Generator:
+    def __init__(self, loader: BulkLoader, args):
+        self.load = loader
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.today = date.today()
+        index = self.today.year * 12 + self.today.month - 1
+        self.months = [divmod(i, 12) for i in range(index - args.months + 1, index + 1)]
+        self.months = [(y, m + 1) for y, m in self.months]
+        self.start = date(*self.months[0], 1)
+        # One hash for every seeded user; bcrypt would dominate the run otherwise
+        self.password_hash = get_password_hash(PASSWORD)
+
+    # ── Distributions ────────────────────────────────────────────────
+
+    def poisson(self, mean: float) -> int:
+        # Knuth for small means, normal approximation otherwise
+        if mean > 30:
+            return max(0, round(self.rng.gauss(mean, math.sqrt(mean))))
+        limit, k, p = math.exp(-mean), 0, 1.0
+        while True:
+            p *= self.rng.random()
+            if p <= limit:
+                return k
+            k += 1
+
+    def amount(self, category: str) -> float:
+        median = CATEGORY_PROFILE.get(category, (0, 600))[1]
+        return round(self.rng.lognormvariate(math.log(median), 0.6), 2)
+
+    def category(self) -> str:
+        return self.rng.choices(CATEGORIES, CATEGORY_WEIGHTS)[0]
+
+    def day_in(self, year: int, month: int) -> date:
+        last = (date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)).day
+        d = date(year, month, self.rng.randint(1, last))
+        return min(d, self.today)
+
+    def stamp(self, d: date) -> datetime:
+        return datetime(d.year, d.month, d.day, self.rng.randint(7, 22), self.rng.randint(0, 59))
+
+    # ── Entities ─────────────────────────────────────────────────────
+
+    def run(self) -> None:
+        user_ids = [self.user() for _ in range(self.args.users)]
+        self.rng.shuffle(user_ids)
+        couples = int(len(user_ids) * self.args.couple_ratio) // 2
+        for i in range(couples):
+            self.couple(user_ids[2 * i], user_ids[2 * i + 1])
+        self.load.finish()
+
+    def user(self) -> int:
+        rng, load = self.rng, self.load
+        uid = load.next_id(User)
+        joined = self.stamp(self.start)
+        income = round(rng.lognormvariate(math.log(80000), 0.5), -2)
+        activity = rng.lognormvariate(0, 0.5)  # heavy and light spenders
+        load.add(User, (
+            uid, f"Seed User {uid}", f"user{uid}@{EMAIL_DOMAIN}", self.password_hash, income,
+            rng.randint(1, 28), round(income * 0.7, -2), True, 0, joined, joined,
+        ))
+
+        custom = [f"Custom {i + 1}" for i in range(rng.choice((0, 0, 1, 2, 3)))]
+        for name in custom:
+            load.add(UserCategory, (load.next_id(UserCategory), uid, name, "📌", "#6b7280", joined, joined))
+        for category in rng.sample(CATEGORIES, rng.randint(2, 6)):
+            limit = round(self.amount(category) * rng.uniform(8, 20), -2)
+            load.add(Budget, (load.next_id(Budget), uid, category, limit, joined, joined))
+
+        templates = []
+        for _ in range(rng.randint(0, 4)):
+            rid = load.next_id(RecurringExpense)
+            category = rng.choice(("Rent", "Subscriptions", "EMI", "Utilities"))
+            amt, day = self.amount(category), rng.randint(1, 28)
+            templates.append((rid, category, amt, day))
+            load.add(RecurringExpense, (
+                rid, uid, amt, category, f"{category} (recurring)", "monthly", day, True,
+                self.today + timedelta(days=30), self.start, joined, joined,
+            ))
+
+        for y, m in self.months:
+            credited = self.day_in(y, m)
+            load.add(SalaryCredit, (load.next_id(SalaryCredit), uid, income, credited, m, y, self.stamp(credited)))
+            for rid, category, amt, day in templates:
+                d = min(date(y, m, day), self.today)
+                load.add(Expense, (
+                    load.next_id(Expense), uid, amt, category, "personal", d, f"{category} (recurring)",
+                    True, rid, self.stamp(d), self.stamp(d),
+                ))
+            for _ in range(self.poisson(self.args.expenses_per_month * activity)):
+                category = rng.choice(custom) if custom and rng.random() < 0.05 else self.category()
+                d = self.day_in(y, m)
+                created = self.stamp(d)
+                load.add(Expense, (
+                    load.next_id(Expense), uid, self.amount(category), category, "personal", d,
+                    f"{category} #{rng.randint(1, 9999)}" if rng.random() < 0.6 else None,
+                    False, None, created, created,
+                ))
+
+        for _ in range(self.poisson(self.args.notifications)):
+            d = self.day_in(*rng.choice(self.months))
+            load.add(Notification, (
+                load.next_id(Notification), uid, "Monthly summary", "Seeded notification",
+                "monthly_summary", rng.random() < 0.8, self.stamp(d),
+            ))
+        return uid
+
+    def couple(self, user_1: int, user_2: int) -> None:
+        rng, load = self.rng, self.load
+        cid = load.next_id(Couple)
+        load.add(Couple, (cid, user_1, user_2, "active", self.stamp(self.start)))
+
+        joint = None
+        if rng.random() < self.args.joint_ratio:
+            joint = load.next_id(JointAccount)
+            load.add(JointAccount, (joint, cid, "Joint Account", True, self.stamp(self.start)))
+
+        for y, m in self.months:
+            if joint:
+                for uid in (user_1, user_2):
+                    d = self.day_in(y, m)
+                    load.add(JointAccountContribution, (
+                        load.next_id(JointAccountContribution), joint, uid,
+                        round(rng.uniform(5000, 30000), -2), "salary", None, d, self.stamp(d),
+                    ))
+            for _ in range(self.poisson(self.args.shared_per_month)):
+                self.shared_expense(cid, user_1, user_2, joint, y, m)
+            if rng.random() < 0.6:
+                payer, payee = (user_1, user_2) if rng.random() < 0.5 else (user_2, user_1)
+                created = self.stamp(self.day_in(y, m))
+                load.add(Settlement, (
+                    load.next_id(Settlement), cid, payer, payee, round(rng.uniform(200, 8000), 2),
+                    None, created, created,
+                ))
+
+        for _ in range(rng.randint(0, 3)):
+            gid = load.next_id(SavingsGoal)
+            target = round(rng.uniform(20000, 500000), -3)
+            contributions = [round(rng.uniform(500, 10000), -2) for _ in range(rng.randint(0, 24))]
+            current = sum(contributions)
+            load.add(SavingsGoal, (
+                gid, cid, f"Goal {gid}", target, current, None, current >= target, self.stamp(self.start),
+            ))
+            for amt in contributions:
+                created = self.stamp(self.day_in(*rng.choice(self.months)))
+                load.add(SavingsContribution, (
+                    load.next_id(SavingsContribution), gid, rng.choice((user_1, user_2)), amt, created,
+                ))
+
+    def shared_expense(self, cid: int, user_1: int, user_2: int, joint, y: int, m: int) -> None:
+        rng, load = self.rng, self.load
+        category = self.category()
+        amt = self.amount(category)
+        split_type, ratio = rng.choices(SPLITS, SPLIT_WEIGHTS)[0]
+        if split_type == "custom":
+            first = round(amt * rng.uniform(0.2, 0.8), 2)
+            ratio = f"{first}:{round(amt - first, 2)}"
+        from_joint = joint is not None and rng.random() < 0.3
+        d = self.day_in(y, m)
+        created = self.stamp(d)
+        sid = load.next_id(SharedExpense)
+        load.add(SharedExpense, (
+            sid, cid, rng.choice((user_1, user_2)), amt, category,
+            f"{category} together" if rng.random() < 0.5 else None,
+            split_type, ratio, d, from_joint, *split_shares(amt, split_type, ratio), created, created,
+        ))
+        if from_joint:
+            load.add(JointAccountTransaction, (
+                load.next_id(JointAccountTransaction), joint, sid, amt, category, d, created,
+            ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=get_settings().DATABASE_URL)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--months", type=int, default=24, help="months of history per user")
+    parser.add_argument("--expenses-per-month", type=float, default=40, help="mean personal expenses per user-month")
+    parser.add_argument("--couple-ratio", type=float, default=0.6, help="share of users paired into couples")
+    parser.add_argument("--shared-per-month", type=float, default=25, help="mean shared expenses per couple-month")
+    parser.add_argument("--joint-ratio", type=float, default=0.5, help="share of couples with a joint account")
+    parser.add_argument("--notifications", type=float, default=10, help="mean notifications per user")
+    parser.add_argument("--batch-size", type=int, default=50000, help="rows buffered before each load")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--create-schema", action="store_true", help="create missing tables first (non-Alembic setups)")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if args.create_schema:
+        Base.metadata.create_all(engine)
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        loader = BulkLoader(conn, args.batch_size)
+        Generator(loader, args).run()
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ANALYZE"))
+    elapsed = time.perf_counter() - started
+
+    total = sum(loader.counts.values())
+    for model, count in loader.counts.items():
+        print(f"{model.__tablename__:>28}  {count:>12,}")
+    print(f"{'total':>28}  {total:>12,}  in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+    print(f"Seeded users log in with password '{PASSWORD}'")
+
+
+if __name__ == "__main__":
+    main()
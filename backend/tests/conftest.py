@@ -0,0 +1,205 @@
+"""Shared fixtures for the API test suite.
+
+Tests run against a throwaway SQLite file by default. Set
+``TEST_DATABASE_URL`` to run against a local PostgreSQL database instead;
+its tables are created on import and emptied after every test. Read-only
+endpoints go through a second engine on the same database, standing in
+for a replica.
+"""
+
+import os
+import random
+import tempfile
+from datetime import date, timedelta
+
+_tmp_dir = tempfile.mkdtemp(prefix="splitmint-tests-")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL", f"sqlite:///{_tmp_dir}/test.db")
+os.environ["DATABASE_REPLICA_URL"] = os.environ["DATABASE_URL"]
+os.environ["REPLICA_STICKY_SECONDS"] = "0"  # same database, so no lag to wait out
+os.environ["DEBUG"] = "true"  # create_all on import
+os.environ["QUERY_COUNT_HEADER"] = "true"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.services.categories import DEFAULT_CATEGORIES  # noqa: E402
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.core.security import create_access_token, get_password_hash  # noqa: E402
+from app.models.budget import Budget, Notification  # noqa: E402
+from app.models.couple import (  # noqa: E402
+    Couple, JointAccount, JointAccountContribution, JointAccountTransaction,
+    SavingsContribution, SavingsGoal, Settlement, SharedExpense,
+)
+from app.models.expense import Expense, RecurringExpense, UserCategory  # noqa: E402
+from app.models.salary import SalaryCredit  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services import budget_alerts, categories  # noqa: E402
+
+PASSWORD = "secret123"
+_PASSWORD_HASH = get_password_hash(PASSWORD)  # bcrypt is slow; hash once per run
+CATEGORIES = [c["name"] for c in DEFAULT_CATEGORIES]
+
+
+def query_count(response) -> int:
+    """Statements the request executed, as reported by ``MetricsMiddleware``."""
+    return int(response.headers["x-query-count"])
+
+
+def auth_headers(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+def add_user(db, name: str, **fields) -> User:
+    user = User(name=name, email=f"{name.lower()}@example.com", password_hash=_PASSWORD_HASH, **fields)
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture(scope="session")
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+        budget_alerts._limits_cache.clear()
+        categories._catalogue_cache.clear()
+
+
+@pytest.fixture
+def alice(db) -> User:
+    return add_user(db, "Alice", monthly_income=100000)
+
+
+@pytest.fixture
+def bob(db) -> User:
+    return add_user(db, "Bob", monthly_income=100000)
+
+
+@pytest.fixture
+def couple(db, alice, bob) -> Couple:
+    """Alice and Bob as an active couple."""
+    couple = Couple(user_1_id=alice.id, user_2_id=bob.id, status="active")
+    db.add(couple)
+    db.commit()
+    return couple
+
+
+class World:
+    """Seed data for the statement budgets: a couple (Alice and Bob) with a
+    joint account and a savings goal.
+
+    ``grow(n)`` adds ``n`` more rows of every kind the read endpoints
+    return, spread over the last six months. Seeding is deterministic.
+    """
+
+    def __init__(self, db, seed: int = 1234):
+        self.db = db
+        self.rng = random.Random(seed)
+        self.today = date.today()
+        self._serial = 0
+
+        self.alice = self.add_user("Alice")
+        self.bob = self.add_user("Bob")
+        self.couple = Couple(user_1_id=self.alice.id, user_2_id=self.bob.id, status="active")
+        db.add(self.couple)
+        db.flush()
+        self.joint = JointAccount(couple_id=self.couple.id)
+        self.goal = SavingsGoal(couple_id=self.couple.id, title="Holiday", target_amount=1_000_000)
+        db.add_all([self.joint, self.goal])
+        db.add(SalaryCredit(
+            user_id=self.alice.id, amount=90000, month=self.today.month,
+            year=self.today.year, credited_date=self.today,
+        ))
+        db.commit()
+        self.headers = auth_headers(self.alice)
+
+    def add_user(self, name: str) -> User:
+        self._serial += 1
+        user = User(
+            name=name,
+            email=f"{name.lower()}{self._serial}@example.com",
+            password_hash=_PASSWORD_HASH,
+            monthly_income=100000,
+        )
+        self.db.add(user)
+        self.db.flush()
+        return user
+
+    def _date(self) -> date:
+        return self.today - timedelta(days=self.rng.randrange(0, 180))
+
+    def _amount(self) -> float:
+        return round(self.rng.uniform(50, 5000), 2)
+
+    def grow(self, n: int) -> None:
+        db, rng = self.db, self.rng
+        alice, bob, couple = self.alice, self.bob, self.couple
+        for _ in range(n):
+            self._serial += 1
+            payer = rng.choice((alice, bob))
+            category = rng.choice(CATEGORIES)
+            custom = f"Custom {self._serial}"
+
+            recurring = RecurringExpense(
+                user_id=alice.id, amount=self._amount(), category=category,
+                frequency="monthly", day_of_month=rng.randint(1, 28),
+                next_date=self.today + timedelta(days=30), start_date=self.today,
+            )
+            db.add(recurring)
+            db.flush()
+            db.add_all([
+                Expense(user_id=alice.id, amount=self._amount(), category=category, date=self._date()),
+                Expense(
+                    user_id=alice.id, amount=self._amount(), category=custom, date=self.today,
+                    is_recurring=True, recurring_id=recurring.id,
+                ),
+                UserCategory(user_id=alice.id, name=custom),
+                Budget(user_id=alice.id, category=custom, monthly_limit=self._amount()),
+                Notification(
+                    user_id=alice.id, title=f"Note {self._serial}", message="Seeded",
+                    notification_type="monthly_summary",
+                ),
+                SharedExpense(
+                    couple_id=couple.id, paid_by_user_id=payer.id, amount=self._amount(),
+                    category=category, split_type=rng.choice(("equal", "percentage")),
+                    split_ratio=rng.choice(("50:50", "60:40")), date=self._date(),
+                    paid_from_joint=rng.random() < 0.2,
+                ),
+                Settlement(
+                    couple_id=couple.id, paid_by_user_id=payer.id,
+                    paid_to_user_id=bob.id if payer is alice else alice.id, amount=self._amount(),
+                ),
+                JointAccountContribution(
+                    joint_account_id=self.joint.id, user_id=payer.id, amount=self._amount(),
+                    date=self._date(),
+                ),
+                JointAccountTransaction(
+                    joint_account_id=self.joint.id, amount=self._amount(), date=self._date(),
+                ),
+                SavingsGoal(couple_id=couple.id, title=f"Goal {self._serial}", target_amount=10000),
+                SavingsContribution(goal_id=self.goal.id, user_id=payer.id, amount=self._amount()),
+            ])
+            # A pending invite to Alice from a new user
+            inviter = self.add_user(f"Inviter{self._serial}")
+            db.add(Couple(user_1_id=inviter.id, user_2_id=alice.id, status="pending"))
+        db.commit()
+
+    @property
+    def expense_id(self) -> int:
+        return self.db.query(Expense.id).filter(Expense.user_id == self.alice.id).first()[0]
+
+
+@pytest.fixture
+def world(db):
+    return World(db)
@@ -0,0 +1,57 @@
+"""Background account deletion."""
+
+from datetime import date
+
+from app.models.budget import Budget, CategorySpend
+from app.models.couple import Couple, SharedExpense
+from app.models.expense import Expense
+from app.models.user import AccountDeletion, User
+from app.services.account_deletion import run_deletion
+from tests.conftest import auth_headers
+
+
+def test_account_is_deactivated_then_deleted_in_the_background(client, db, alice, bob, couple):
+    db.add_all([
+        Expense(user_id=alice.id, amount=40, category="Food", date=date.today()),
+        Budget(user_id=alice.id, category="Food", monthly_limit=500),
+        SharedExpense(
+            couple_id=couple.id, paid_by_user_id=bob.id, amount=300, category="Rent",
+            split_type="equal", split_ratio="50:50", date=date.today(),
+        ),
+    ])
+    db.commit()
+    client.post(
+        "/api/expenses/", json={"amount": 5, "category": "Food", "date": str(date.today())}, headers=auth_headers(alice)
+    )
+    alice_id, bob_id, couple_id = alice.id, bob.id, couple.id
+
+    response = client.delete("/api/auth/me", headers=auth_headers(alice))
+    assert response.status_code == 202, response.text
+    job_id = response.json()["id"]
+
+    # The test client runs background tasks before returning
+    status = client.get(f"/api/auth/deletions/{job_id}").json()
+    assert status["status"] == "done" and status["rows_deleted"] > 0
+    assert client.get("/api/auth/me", headers=auth_headers(alice)).status_code == 401
+
+    db.expire_all()
+    assert db.get(User, alice_id) is None
+    assert db.query(Expense).filter(Expense.user_id == alice_id).count() == 0
+    assert db.query(CategorySpend).filter(CategorySpend.user_id == alice_id).count() == 0
+    assert db.query(SharedExpense).filter(SharedExpense.couple_id == couple_id).count() == 0
+    assert db.get(Couple, couple_id) is None
+    assert db.get(User, bob_id) is not None
+
+    run_deletion(job_id)  # finished jobs are not run again
+    assert db.get(AccountDeletion, job_id).status == "done"
+
+
+def test_deletion_status_does_not_identify_the_account(client, db):
+    db.add(AccountDeletion(id="job-1", user_id=42, status="failed", error="relation users: permission denied"))
+    db.commit()
+
+    # No token: the account may already be gone, so the job id is the credential
+    response = client.get("/api/auth/deletions/job-1")
+    assert response.status_code == 200, response.text
+    assert sorted(response.json()) == ["created_at", "finished_at", "id", "rows_deleted", "status"]
+    assert client.get("/api/auth/deletions/job-2").status_code == 404
@@ -0,0 +1,101 @@
+"""Cold-storage archival of old history."""
+
+import sys
+from datetime import date, datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings, get_settings
+from app.jobs import archive_history
+from app.models.couple import SharedExpense
+from app.models.expense import Expense
+from app.services.archive import (
+    ArchiveStore, ParquetArchiveStore, archive_cutoff, read_archived, set_archive_store,
+)
+from tests.conftest import auth_headers
+
+
+@pytest.fixture
+def archival(tmp_path, monkeypatch):
+    """Archive rows older than six months into Parquet files under a temporary directory."""
+    monkeypatch.setattr(get_settings(), "ARCHIVE_AFTER_MONTHS", 6)
+    set_archive_store(ParquetArchiveStore(str(tmp_path)))
+    yield tmp_path
+    set_archive_store(None)
+
+
+def _views(client, user) -> dict:
+    """What the user sees of their history: yearly totals and the couple balance."""
+    headers = auth_headers(user)
+    history = client.get("/api/reports/history", params={"years": 3, "granularity": "year"}, headers=headers)
+    balance = client.get("/api/couple/balance", headers=headers)
+    assert history.status_code == balance.status_code == 200
+    return {"history": history.json(), "balance": balance.json()}
+
+
+def test_archiving_moves_rows_without_changing_what_users_see(client, db, alice, bob, couple, archival, monkeypatch):
+    old = date(date.today().year - 2, 3, 15)
+    alice.created_at = bob.created_at = datetime(2020, 1, 1)
+    db.add_all([
+        Expense(user_id=alice.id, amount=100, category="Food", description="Old lunch", date=old),
+        Expense(user_id=alice.id, amount=7, category="Food", date=date.today()),
+        SharedExpense(
+            couple_id=couple.id, paid_by_user_id=alice.id, amount=200, category="Rent",
+            split_type="percentage", split_ratio="70:30", date=old,
+        ),
+    ])
+    db.commit()
+    before = _views(client, alice)
+
+    monkeypatch.setattr(sys, "argv", ["archive_history"])
+    archive_history.main()
+
+    cutoff = archive_cutoff()
+    assert db.query(Expense).filter(Expense.date < cutoff).count() == 0
+    assert db.query(SharedExpense).count() == 0
+    assert (archival / "expenses" / f"user_id={alice.id}" / f"year={old.year}.parquet").exists()
+    assert [row["amount"] for row in read_archived("expenses", alice.id)] == [100]
+    assert _views(client, alice) == before
+
+    export = client.get("/api/expenses/export", headers=auth_headers(alice)).text
+    assert "Old lunch" in export
+
+    archive_history.main()  # nothing left to move; safe to repeat
+    assert len(read_archived("shared_expenses", couple.id)) == 1
+
+
+def test_archived_months_are_read_only(client, db, alice, couple, archival):
+    archived_day = str(archive_cutoff() - timedelta(days=1))
+    expense = Expense(user_id=alice.id, amount=5, category="Food", date=date.today())
+    db.add(expense)
+    db.commit()
+    headers = auth_headers(alice)
+
+    create = client.post("/api/expenses/", json={"amount": 5, "category": "Food", "date": archived_day}, headers=headers)
+    move = client.post(
+        "/api/expenses/bulk-update", json={"ids": [expense.id], "changes": {"date": archived_day}}, headers=headers
+    )
+    shared = client.post(
+        "/api/couple/expenses", json={"amount": 5, "category": "Food", "date": archived_day}, headers=headers
+    )
+    assert create.status_code == move.status_code == shared.status_code == 400
+
+
+def test_archive_horizon_is_validated():
+    assert Settings(ARCHIVE_AFTER_MONTHS=0).ARCHIVE_AFTER_MONTHS == 0
+    assert Settings(ARCHIVE_AFTER_MONTHS=6).ARCHIVE_AFTER_MONTHS == 6
+    with pytest.raises(ValidationError):
+        Settings(ARCHIVE_AFTER_MONTHS=3)
+
+
+def test_archive_stores_must_implement_the_whole_interface():
+    class ReadOnlyStore(ArchiveStore):
+        def years(self, table, owner_id):
+            return []
+
+        def read(self, table, owner_id, year):
+            return []
+
+    with pytest.raises(TypeError):
+        ReadOnlyStore()
@@ -0,0 +1,75 @@
+"""Benchmark tooling: the seed generator and the suites' result handling."""
+
+import json
+import sys
+from pathlib import Path
+
+from app.core.database import engine
+from app.core.security import verify_password
+from app.models.couple import SharedExpense
+from app.models.expense import Expense
+from app.models.user import User
+from benchmarks import bench_helpers, load_test, seed_data
+
+BASELINES = Path(__file__).resolve().parent.parent / "benchmarks" / "baselines"
+
+
+def _seed(monkeypatch, *args: str) -> None:
+    url = engine.url.render_as_string(hide_password=False)
+    monkeypatch.setattr(sys, "argv", ["seed_data", "--database-url", url, *args])
+    seed_data.main()
+
+
+def test_seed_data_is_deterministic_and_consistent(db, monkeypatch):
+    args = ("--users", "4", "--months", "2", "--expenses-per-month", "5", "--couple-ratio", "1", "--seed", "7")
+    _seed(monkeypatch, *args)
+
+    users = db.query(User).order_by(User.id).all()
+    assert len(users) == 4
+    assert verify_password(seed_data.PASSWORD, users[0].password_hash)
+    assert db.query(Expense).count() > 0
+    shared = db.query(SharedExpense).all()
+    assert shared
+    for row in shared:  # loaded without the ORM, so the shares come from the generator
+        assert round(row.user_1_share + row.user_2_share, 2) == row.amount
+
+    first = sorted((e.user_id - users[0].id, e.date, e.category, e.amount) for e in db.query(Expense))
+    _seed(monkeypatch, *args)
+    again = db.query(User).order_by(User.id).all()[4:]
+    second = sorted(
+        (e.user_id - again[0].id, e.date, e.category, e.amount)
+        for e in db.query(Expense).filter(Expense.user_id >= again[0].id)
+    )
+    assert second == first
+
+
+def test_percentiles_use_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert load_test.percentile(values, 50) == 50.0
+    assert load_test.percentile(values, 95) == 95.0
+    assert load_test.percentile(values, 99.5) == 100.0
+    assert load_test.percentile([], 95) == 0.0
+
+    summary = load_test.summarise([(0.010, True), (0.020, True), (0.030, False)], elapsed=1.5)
+    assert summary["requests"] == 3 and summary["errors"] == 1
+    assert summary["p50_ms"] == 20.0 and summary["throughput_rps"] == 2.0
+
+
+def test_load_test_flags_regressions_against_its_baseline():
+    baseline = json.loads((BASELINES / "load_test.json").read_text())
+    assert set(baseline["scenarios"]) == set(load_test.SCENARIOS)
+    assert load_test.compare(baseline, baseline, threshold=0.2) == []
+
+    slower = json.loads(json.dumps(baseline))
+    slower["scenarios"]["dashboard"]["p95_ms"] *= 1.5
+    failures = load_test.compare(slower, baseline, threshold=0.2)
+    assert len(failures) == 1 and failures[0].startswith("dashboard: p95")
+
+
+def test_micro_benchmarks_cover_their_baseline():
+    baseline = json.loads((BASELINES / "bench_helpers.json").read_text())
+    results = bench_helpers.run([100], repeat=1, seed=1)
+
+    names = {key.split("[")[0] for key in baseline["results"]}
+    assert {key.split("[")[0] for key in results} == names
+    assert bench_helpers.compare(results, baseline, threshold=0.2) == []  # no overlapping sizes
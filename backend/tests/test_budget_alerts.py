@@ -0,0 +1,161 @@
+"""Budget thresholds evaluated at write time against the monthly spend rollup."""
+
+import sys
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.jobs import close_months, send_nudges
+from app.models.budget import Budget, CategorySpend, Notification
+from app.models.couple import SharedExpense
+from app.models.expense import Expense
+from app.services import budget_alerts
+from tests.conftest import auth_headers
+
+
+@pytest.fixture
+def statements():
+    seen: list[str] = []
+
+    def record(conn, cursor, sql, *args):
+        seen.append(sql)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _add(client, user, amount, category="Food"):
+    response = client.post(
+        "/api/expenses/",
+        json={"amount": amount, "category": category, "date": date.today().isoformat()},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _budget(client, user, limit, category="Food"):
+    response = client.post(
+        "/api/budgets/", json={"category": category, "monthly_limit": limit}, headers=auth_headers(user)
+    )
+    assert response.status_code in (200, 201), response.text
+
+
+def _titles(db, user):
+    db.expire_all()
+    return sorted(n.title for n in db.query(Notification).filter(Notification.user_id == user.id))
+
+
+def test_thresholds_notify_once_when_crossed(client, db, alice):
+    _budget(client, alice, 1000)
+
+    _add(client, alice, 500)
+    assert _titles(db, alice) == []
+    _add(client, alice, 350)
+    assert _titles(db, alice) == ["Food Budget Warning ⚠️"]
+    _add(client, alice, 10)
+    _add(client, alice, 200)
+    assert _titles(db, alice) == ["Food Budget Exceeded 🚨", "Food Budget Warning ⚠️"]
+
+
+def test_rollup_tracks_deletes_and_is_seeded_from_existing_rows(client, db, alice):
+    db.add(Expense(user_id=alice.id, amount=700, category="Food", date=date.today()))
+    db.commit()
+    _budget(client, alice, 1000)
+    created = _add(client, alice, 100)
+    client.delete(f"/api/expenses/{created['id']}", headers=auth_headers(alice))
+
+    db.expire_all()
+    rollup = db.query(CategorySpend).filter(CategorySpend.user_id == alice.id).one()
+    assert rollup.amount == 700
+    # Back over 80% only once the deleted spend is replaced
+    _add(client, alice, 90)
+    assert _titles(db, alice) == ["Food Budget Warning ⚠️"]
+
+
+def test_partners_share_of_a_shared_expense_counts(client, db, alice, bob, couple):
+    _budget(client, bob, 1000, category="Rent")
+    response = client.post(
+        "/api/couple/expenses",
+        json={"amount": 1800, "category": "Rent", "date": date.today().isoformat()},
+        headers=auth_headers(alice),
+    )
+    assert response.status_code == 201, response.text
+
+    # Bob's half is 900 of his 1000
+    assert _titles(db, bob) == ["Rent Budget Warning ⚠️"]
+    assert _titles(db, alice) == []
+
+
+def test_writes_do_not_sum_the_month_once_seeded(client, alice, statements):
+    _budget(client, alice, 10**6)
+    _add(client, alice, 10)
+    statements.clear()
+    _add(client, alice, 10)
+
+    assert statements
+    assert not any("sum(" in sql.lower() for sql in statements)
+
+
+def test_month_close_drops_past_rollups(client, db, alice, monkeypatch):
+    _add(client, alice, 10)
+    db.add(CategorySpend(user_id=alice.id, year=2020, month=1, category="Food", amount=99))
+    db.commit()
+
+    monkeypatch.setattr(sys, "argv", ["close_months", "--months", "1"])
+    close_months.main()
+
+    db.expire_all()
+    assert [(r.year, r.month) for r in db.query(CategorySpend)] == [(date.today().year, date.today().month)]
+
+
+def test_partners_rollup_is_reseeded_when_the_couple_dissolves(client, db, alice, bob, couple):
+    _budget(client, bob, 1000, category="Rent")
+    client.post(
+        "/api/couple/expenses",
+        json={"amount": 1800, "category": "Rent", "date": date.today().isoformat()},
+        headers=auth_headers(alice),
+    )
+    assert client.delete("/api/auth/me", headers=auth_headers(alice)).status_code == 202
+
+    # Bob's 900 share left with the couple; only his own spend counts now
+    _add(client, bob, 150, category="Rent")
+    db.expire_all()
+    assert db.query(CategorySpend.amount).filter(CategorySpend.user_id == bob.id).scalar() == 150
+    assert _titles(db, bob) == ["Rent Budget Warning ⚠️"]
+
+
+def test_limit_changes_reach_other_workers_after_the_ttl(client, db, alice, monkeypatch):
+    _budget(client, alice, 1000)
+    _add(client, alice, 100)
+
+    # Lowered by another worker, which cannot clear this process's cache
+    db.query(Budget).filter(Budget.user_id == alice.id).update({"monthly_limit": 115})
+    db.commit()
+    _add(client, alice, 10)
+    assert _titles(db, alice) == []
+
+    later = budget_alerts.time.monotonic() + budget_alerts._LIMITS_TTL_SECONDS
+    monkeypatch.setattr(budget_alerts, "time", SimpleNamespace(monotonic=lambda: later))
+    _add(client, alice, 10)
+    assert _titles(db, alice) == ["Food Budget Exceeded 🚨"]
+
+
+def test_nudge_job_counts_the_partners_share_once_a_day(db, alice, bob, couple, monkeypatch):
+    bob.monthly_budget = 1000
+    db.add(SharedExpense(
+        couple_id=couple.id, paid_by_user_id=alice.id, amount=1800, category="Rent",
+        split_type="equal", split_ratio="50:50", date=date.today(),
+    ))
+    db.commit()
+
+    monkeypatch.setattr(sys, "argv", ["send_nudges"])
+    send_nudges.main()
+    send_nudges.main()
+
+    assert _titles(db, bob) == ["Budget Alert ⚠️"]
+    assert _titles(db, alice) == []
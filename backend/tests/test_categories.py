@@ -0,0 +1,136 @@
+"""Category rename and merge, and the cached category catalogue."""
+
+from datetime import date, datetime
+
+from app.models.budget import Budget, CategorySpend
+from app.models.couple import SharedExpense
+from app.models.expense import Expense, UserCategory
+from app.models.report import MonthlySnapshot, MonthlySnapshotCategory
+from app.services.snapshots import close_month, load_snapshots, month_key
+from tests.conftest import auth_headers, query_count
+
+
+def _closed_month() -> date:
+    index = date.today().year * 12 + date.today().month - 3
+    return date(index // 12, index % 12 + 1, 10)
+
+
+def _snapshot(db, user_id: int, on: date) -> dict:
+    start = on.replace(day=1)
+    return load_snapshots(db, user_id, start, date(start.year + start.month // 12, start.month % 12 + 1, 1))[
+        month_key(on.year, on.month)
+    ]
+
+
+def _shared(couple, paid_by, amount: float, on: date) -> SharedExpense:
+    return SharedExpense(
+        couple_id=couple.id, paid_by_user_id=paid_by.id, amount=amount, category="Snacks",
+        split_type="equal", split_ratio="50:50", date=on,
+    )
+
+
+def test_merge_moves_snapshot_totals_but_not_the_partners_rows(client, db, alice, bob, couple):
+    closed = _closed_month()
+    alice.created_at = bob.created_at = datetime(2020, 1, 1)
+    snacks = UserCategory(user_id=alice.id, name="Snacks")
+    partners_row = _shared(couple, bob, 60, closed)
+    db.add_all([
+        snacks,
+        partners_row,
+        _shared(couple, alice, 100, closed),
+        _shared(couple, alice, 30, date.today()),
+        Expense(user_id=alice.id, amount=40, category="Snacks", date=closed),
+        Expense(user_id=alice.id, amount=10, category="Snacks", date=date.today()),
+        Budget(user_id=alice.id, category="Snacks", monthly_limit=500),
+    ])
+    db.commit()
+    close_month(db, closed.year, closed.month)
+    db.commit()
+    assert _snapshot(db, alice.id, closed) == {"Snacks": 120}
+
+    response = client.post(
+        f"/api/expenses/categories/{snacks.id}/merge", json={"into": "Food"}, headers=auth_headers(alice)
+    )
+    assert response.status_code == 200, response.text
+    counts = response.json()
+    assert (counts["expenses"], counts["shared_expenses"], counts["budgets"]) == (2, 2, 1)
+
+    db.expire_all()
+    assert partners_row.category == "Snacks"
+    assert _snapshot(db, alice.id, closed) == {"Food": 90, "Snacks": 30}
+    assert _snapshot(db, bob.id, closed) == {"Food": 50, "Snacks": 30}
+    spend = {
+        (user_id, category): amount
+        for user_id, category, amount in db.query(CategorySpend.user_id, CategorySpend.category, CategorySpend.amount)
+    }
+    assert spend == {(alice.id, "Food"): 25, (alice.id, "Snacks"): 0, (bob.id, "Food"): 15, (bob.id, "Snacks"): 0}
+
+    # The moved snapshots match what closing the month again would produce
+    moved = {user.id: _snapshot(db, user.id, closed) for user in (alice, bob)}
+    for model in (MonthlySnapshotCategory, MonthlySnapshot):
+        db.query(model).delete()
+    close_month(db, closed.year, closed.month)
+    db.commit()
+    assert {user.id: _snapshot(db, user.id, closed) for user in (alice, bob)} == moved
+
+
+def test_rename_relabels_rows_and_rejects_duplicates(client, db, alice):
+    snacks = UserCategory(user_id=alice.id, name="Snacks")
+    db.add_all([
+        snacks,
+        UserCategory(user_id=alice.id, name="Treats"),
+        Expense(user_id=alice.id, amount=10, category="Snacks", date=date.today()),
+        Budget(user_id=alice.id, category="Snacks", monthly_limit=500),
+    ])
+    db.commit()
+    url = f"/api/expenses/categories/{snacks.id}"
+
+    assert client.put(url, json={"name": "treats"}, headers=auth_headers(alice)).status_code == 400
+    response = client.put(url, json={"name": "Nibbles"}, headers=auth_headers(alice))
+    assert response.status_code == 200, response.text
+    assert response.json()["category"]["name"] == "Nibbles"
+
+    assert db.query(Expense.category).filter(Expense.user_id == alice.id).all() == [("Nibbles",)]
+    assert db.query(Budget.category).filter(Budget.user_id == alice.id).all() == [("Nibbles",)]
+
+
+def test_delete_moves_references_into_other(client, db, alice):
+    snacks = UserCategory(user_id=alice.id, name="Snacks")
+    db.add_all([
+        snacks,
+        Expense(user_id=alice.id, amount=10, category="Snacks", date=date.today()),
+        Budget(user_id=alice.id, category="Snacks", monthly_limit=500),
+    ])
+    db.commit()
+
+    response = client.delete(f"/api/expenses/categories/{snacks.id}", headers=auth_headers(alice))
+    assert response.status_code == 204, response.text
+
+    db.expire_all()
+    assert db.query(Expense.category).filter(Expense.user_id == alice.id).all() == [("Other",)]
+    assert db.query(Budget.category).filter(Budget.user_id == alice.id).all() == [("Other",)]
+    assert db.query(UserCategory).filter(UserCategory.user_id == alice.id).count() == 0
+
+
+def test_catalogue_is_cached_until_the_users_categories_change(client, db, alice):
+    def catalogue():
+        response = client.get("/api/expenses/categories", headers=auth_headers(alice))
+        assert response.status_code == 200, response.text
+        return response
+
+    catalogue()
+    assert query_count(catalogue()) == 1  # the current user only
+    expense = {"amount": 5, "category": "Food", "date": str(date.today())}
+    assert client.post("/api/expenses/", json=expense, headers=auth_headers(alice)).status_code == 201
+    assert query_count(catalogue()) == 1
+
+    created = client.post("/api/expenses/categories", json={"name": "Pets"}, headers=auth_headers(alice))
+    assert created.status_code == 201, created.text
+    assert "Pets" in [c["name"] for c in catalogue().json()]
+    duplicate = client.post("/api/expenses/categories", json={"name": "pets"}, headers=auth_headers(alice))
+    assert duplicate.status_code == 400
+
+    # Written by another process, which cannot clear this process's cache
+    db.add(UserCategory(user_id=alice.id, name="Plants"))
+    db.commit()
+    assert "Plants" in [c["name"] for c in catalogue().json()]
@@ -0,0 +1,59 @@
+"""Live change events: delivery on commit and stream authentication."""
+
+from datetime import date
+
+import pytest
+
+from app.core.database import engine
+from app.core.events import broker, publish
+from app.core.security import create_access_token
+from tests.conftest import auth_headers
+
+
+@pytest.fixture
+def delivered(monkeypatch):
+    """Events the broker dispatches in this process, as (type, users) pairs."""
+    seen = []
+    monkeypatch.setattr(broker, "_listeners", [lambda message: seen.append((message["type"], message["users"]))])
+    return seen
+
+
+@pytest.mark.skipif(engine.dialect.name == "postgresql", reason="delivered by the LISTEN thread")
+def test_events_are_delivered_only_on_commit(db, alice, delivered):
+    publish(db, [alice.id], "notification")
+    db.rollback()
+    assert delivered == []
+
+    publish(db, [alice.id, alice.id], "notification")
+    assert delivered == []
+    db.commit()
+    assert delivered == [("notification", [alice.id])]
+
+
+@pytest.mark.skipif(engine.dialect.name == "postgresql", reason="delivered by the LISTEN thread")
+def test_shared_expense_notifies_both_partners(client, alice, bob, couple, delivered):
+    response = client.post(
+        "/api/couple/expenses",
+        json={"amount": 300, "category": "Rent", "date": str(date.today())},
+        headers=auth_headers(alice),
+    )
+    assert response.status_code == 201, response.text
+
+    partners = sorted((alice.id, bob.id))
+    assert ("shared_expense", partners) in delivered
+    assert ("balance", partners) in delivered
+
+
+def test_stream_rejects_unknown_tokens(client, db, alice):
+    missing_user = create_access_token({"sub": str(alice.id + 1)})
+
+    assert client.get("/api/events/stream", params={"token": missing_user}).status_code == 401
+    assert client.get("/api/events/stream", params={"token": "garbage"}).status_code == 401
+
+
+def test_stream_rejects_inactive_users(client, db, alice):
+    alice.is_active = False
+    db.commit()
+    token = create_access_token({"sub": str(alice.id)})
+
+    assert client.get("/api/events/stream", params={"token": token}).status_code == 401
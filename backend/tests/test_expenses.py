@@ -0,0 +1,114 @@
+"""Expense search, filtered totals, the unified timeline and bulk edits."""
+
+from datetime import date, datetime, timedelta
+
+from app.models.budget import CategorySpend
+from app.models.couple import SharedExpense
+from app.models.expense import Expense
+from app.models.sync import SyncTombstone
+from tests.conftest import auth_headers
+
+
+def _expenses(db, user, *rows) -> list[Expense]:
+    """Add the user's (amount, category, description) expenses, dated today."""
+    expenses = [
+        Expense(user_id=user.id, amount=amount, category=category, description=description, date=date.today())
+        for amount, category, description in rows
+    ]
+    db.add_all(expenses)
+    db.commit()
+    return expenses
+
+
+def _list(client, user, **params):
+    response = client.get("/api/expenses/", params=params, headers=auth_headers(user))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_search_matches_description_prefixes(client, db, alice):
+    _expenses(db, alice, (40, "Food", "Dinner at Toit"), (60, "Food", "dinner party"), (25, "Shopping", "Groceries"))
+
+    assert sorted(e["description"] for e in _list(client, alice, search="din")) == ["Dinner at Toit", "dinner party"]
+    assert [e["description"] for e in _list(client, alice, search="shop")] == ["Groceries"]  # category matches
+    assert _list(client, alice, search="%") == []
+
+
+def test_totals_cover_every_match_not_just_the_page(client, db, alice):
+    _expenses(db, alice, (40, "Food", None), (60, "Food", None), (25.5, "Shopping", None))
+
+    page = _list(client, alice, with_totals="true", limit=1)
+    assert len(page["items"]) == 1
+    assert page["totals"] == {
+        "count": 3,
+        "total": 125.5,
+        "categories": [
+            {"category": "Food", "count": 2, "total": 100},
+            {"category": "Shopping", "count": 1, "total": 25.5},
+        ],
+    }
+    assert _list(client, alice, with_totals="true", category="Travel")["totals"]["count"] == 0
+
+
+def test_timeline_pages_through_personal_and_shared_expenses(client, db, alice, bob, couple):
+    [personal] = _expenses(db, alice, (10, "Food", "Coffee"))
+    shared = SharedExpense(
+        couple_id=couple.id, paid_by_user_id=bob.id, amount=300, category="Rent",
+        split_type="equal", split_ratio="50:50", date=date.today() - timedelta(days=1),
+    )
+    db.add(shared)
+    db.commit()
+    headers = auth_headers(alice)
+
+    first = client.get("/api/timeline", params={"limit": 1}, headers=headers).json()
+    assert [(i["kind"], i["id"], i["user_share"]) for i in first["items"]] == [("personal", personal.id, 10)]
+    second = client.get("/api/timeline", params={"limit": 1, "cursor": first["next_cursor"]}, headers=headers).json()
+    assert [(i["kind"], i["id"], i["user_share"]) for i in second["items"]] == [("shared", shared.id, 150)]
+    assert second["next_cursor"] is None
+
+    bad = client.get("/api/timeline", params={"cursor": "yesterday"}, headers=headers)
+    assert bad.status_code == 400
+
+
+def test_bulk_update_stamps_rows_and_moves_budget_spend(client, db, alice):
+    food = _expenses(db, alice, (30, "Food", None), (20, "Food", None))
+    [travel] = _expenses(db, alice, (5, "Travel", None))
+    for expense in (*food, travel):
+        expense.updated_at = datetime(2020, 1, 1)
+    db.commit()
+    version = alice.data_version
+
+    response = client.post(
+        "/api/expenses/bulk-update",
+        json={"filter": {"category": "Food"}, "changes": {"category": "Health", "description": "Clinic"}},
+        headers=auth_headers(alice),
+    )
+    assert response.json() == {"affected": 2}
+
+    db.expire_all()
+    for expense in food:
+        assert (expense.category, expense.description) == ("Health", "Clinic")
+        assert expense.updated_at > datetime(2020, 1, 1)
+        assert expense.change_seq > 0
+    assert travel.updated_at == datetime(2020, 1, 1)
+    assert alice.data_version > version
+    spend = dict(db.query(CategorySpend.category, CategorySpend.amount).filter(CategorySpend.user_id == alice.id))
+    assert spend == {"Food": 0, "Health": 50}
+
+
+def test_bulk_delete_writes_tombstones_for_the_callers_rows_only(client, db, alice, bob):
+    mine = _expenses(db, alice, (30, "Food", None), (20, "Food", None))
+    theirs = Expense(user_id=bob.id, amount=99, category="Food", date=date.today())
+    db.add(theirs)
+    db.commit()
+    ids = [e.id for e in mine] + [theirs.id]
+
+    response = client.post("/api/expenses/bulk-delete", json={"ids": ids}, headers=auth_headers(alice))
+    assert response.json() == {"affected": 2}
+
+    assert db.query(Expense.id).filter(Expense.id.in_(ids)).all() == [(theirs.id,)]
+    tombstones = db.query(SyncTombstone.entity, SyncTombstone.entity_id, SyncTombstone.user_id).all()
+    assert sorted(tombstones) == sorted(("expense", e.id, alice.id) for e in mine)
+
+    for body in ({}, {"ids": [theirs.id], "filter": {"category": "Food"}}, {"filter": {}}):
+        assert client.post("/api/expenses/bulk-delete", json=body, headers=auth_headers(alice)).status_code == 400
@@ -0,0 +1,71 @@
+"""Conditional GET, compression and per-request SQL metrics."""
+
+import logging
+from datetime import date
+
+from app.core import metrics
+from app.models.expense import Expense
+from tests.conftest import auth_headers, query_count
+
+
+def _series(name: str, route: str) -> tuple[float, int]:
+    """(sum, count) of a request histogram for GET ``route``."""
+    labels = f'{{method="GET",route="{route}"}}'
+    values = {}
+    for line in metrics.render_metrics().splitlines():
+        for part in ("sum", "count"):
+            if line.startswith(f"{name}_{part}{labels} "):
+                values[part] = float(line.rsplit(" ", 1)[1])
+    return values.get("sum", 0.0), int(values.get("count", 0))
+
+
+def test_matching_etag_is_answered_with_304(client, alice):
+    headers = auth_headers(alice)
+    first = client.get("/api/budgets/", headers=headers)
+    etag = first.headers["etag"]
+
+    cached = client.get("/api/budgets/", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert query_count(cached) == 1  # the current user only
+
+    client.post("/api/expenses/", json={"amount": 10, "category": "Food", "date": str(date.today())}, headers=headers)
+    changed = client.get("/api/budgets/", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_large_responses_are_compressed(client, db, alice):
+    db.add_all(
+        Expense(user_id=alice.id, amount=10 + i, category="Food", description=f"Lunch {i}", date=date.today())
+        for i in range(40)
+    )
+    db.commit()
+
+    response = client.get("/api/expenses/", headers={**auth_headers(alice), "Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 40
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+def test_statements_are_counted_per_route(client, db, alice):
+    expense = Expense(user_id=alice.id, amount=10, category="Food", date=date.today())
+    db.add(expense)
+    db.commit()
+    route = "/api/expenses/{expense_id}"
+    before_sum, before_count = _series("splitmint_request_queries", route)
+
+    response = client.get(f"/api/expenses/{expense.id}", headers=auth_headers(alice))
+
+    after_sum, after_count = _series("splitmint_request_queries", route)
+    assert after_count == before_count + 1
+    assert after_sum - before_sum == query_count(response) > 0
+
+
+def test_slow_queries_are_logged_with_their_route(client, alice, monkeypatch, caplog):
+    monkeypatch.setattr(metrics.settings, "SLOW_QUERY_MS", 0)
+    with caplog.at_level(logging.WARNING, logger=metrics.__name__):
+        client.get("/api/auth/me", headers=auth_headers(alice))
+    assert any("Slow query" in r.getMessage() and "/api/auth/me" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,45 @@
+"""Yearly partitions of expenses (PostgreSQL after migration 013 only)."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.models.expense import Expense
+from app.services.partitions import (
+    attached_partitions, create_year_partition, detach_year_partition, is_partitioned, partition_name,
+)
+
+YEAR = 2099  # far past any partition the migration or the job creates
+
+
+@pytest.fixture
+def partitioned(db):
+    if not is_partitioned(db, "expenses"):
+        pytest.skip("needs a PostgreSQL database migrated with Alembic")
+    yield db
+    db.rollback()
+    name = partition_name("expenses", YEAR)
+    detach_year_partition(db, "expenses", YEAR)
+    db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    db.commit()
+
+
+def test_new_year_partition_takes_over_rows_from_default(partitioned, alice):
+    db = partitioned
+    expense = Expense(user_id=alice.id, amount=12, category="Food", date=date(YEAR, 6, 1))
+    db.add(expense)
+    db.commit()
+    expense_id, name = expense.id, partition_name("expenses", YEAR)
+
+    assert create_year_partition(db, "expenses", YEAR) is True
+    db.commit()
+    assert name in attached_partitions(db, "expenses")
+    assert db.execute(text(f"SELECT id FROM {name}")).scalars().all() == [expense_id]
+    in_default = text("SELECT count(*) FROM expenses_default WHERE date >= :start")
+    assert db.execute(in_default, {"start": date(YEAR, 1, 1)}).scalar() == 0
+    assert create_year_partition(db, "expenses", YEAR) is False
+
+    assert detach_year_partition(db, "expenses", YEAR) is True
+    db.commit()
+    assert db.query(Expense).filter(Expense.id == expense_id).count() == 0
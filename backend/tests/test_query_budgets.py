@@ -0,0 +1,139 @@
+"""SQL statement budgets for read and write endpoints.
+
+Every endpoint is called against a small and a larger seeded dataset. The
+statement count must not change with the number of rows (no N+1), and must
+stay within the budget below. When a change legitimately adds a query,
+raise the budget in the same commit.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.budget import Budget
+from app.models.couple import SharedExpense
+from app.models.expense import Expense, UserCategory
+from app.services.budget_alerts import add_month_spend, invalidate_budget_limits
+from tests.conftest import query_count
+
+# path -> maximum SQL statements per request (including authentication)
+QUERY_BUDGETS = {
+    "/api/auth/me": 1,
+    "/api/expenses/": 2,
+    "/api/expenses/categories": 1,
+    "/api/expenses/export": 2,
+    "/api/expenses/{expense_id}": 2,
+    "/api/expenses/recurring/list": 2,
+    "/api/budgets/": 3,
+    "/api/dashboard/individual": 15,
+    "/api/dashboard/couple": 6,
+    "/api/dashboard/notifications": 2,
+    "/api/dashboard/notifications/unread-count": 2,
+    "/api/reports": 5,
+    "/api/reports/history": 4,
+    "/api/couple/status": 3,
+    "/api/couple/pending-invites": 3,
+    "/api/couple/expenses": 4,
+    "/api/couple/expenses/export": 4,
+    "/api/couple/balance": 5,
+    "/api/couple/settlements": 4,
+    "/api/couple/joint-account": 12,
+    "/api/couple/joint-account/contributions": 5,
+    "/api/couple/joint-account/transactions": 4,
+    "/api/couple/goals": 3,
+    "/api/couple/goals/{goal_id}/contributions": 5,
+    "/api/salary/check": 2,
+    "/api/salary/current": 2,
+    "/api/sync": 9,
+    "/api/timeline": 3,
+}
+
+
+def _measure(client, world, path: str) -> int:
+    url = path.format(expense_id=world.expense_id, goal_id=world.goal.id)
+    # Warm-up: per-process caches such as the category catalogue fill on first view
+    client.get(url, headers=world.headers)
+    response = client.get(url, headers=world.headers)
+    assert response.status_code == 200, response.text
+    return query_count(response)
+
+
+@pytest.mark.parametrize("path", sorted(QUERY_BUDGETS))
+def test_statement_count_does_not_grow_with_rows(client, world, path):
+    world.grow(2)
+    small = _measure(client, world, path)
+    world.grow(20)
+    large = _measure(client, world, path)
+
+    assert large == small, f"{path}: {small} statements for 2 rows, {large} for 22 (N+1?)"
+    assert large <= QUERY_BUDGETS[path], f"{path}: {large} statements, budget is {QUERY_BUDGETS[path]}"
+
+
+# write -> maximum SQL statements per request (including authentication)
+WRITE_QUERY_BUDGETS = {
+    "POST /api/expenses/": 7,
+    "POST /api/expenses/bulk-update": 10,
+    "POST /api/expenses/bulk-delete": 10,
+    "PUT /api/expenses/categories/{category_id}": 46,
+    "POST /api/expenses/categories/{category_id}/merge": 38,
+    "DELETE /api/expenses/categories/{category_id}": 38,
+}
+
+# write -> request body, given the category and its expense ids
+_WRITE_BODIES = {
+    "POST /api/expenses/": lambda cat, ids: {"amount": 10, "category": cat.name, "date": str(date.today())},
+    "POST /api/expenses/bulk-update": lambda cat, ids: {"ids": ids, "changes": {"category": "Food"}},
+    "POST /api/expenses/bulk-delete": lambda cat, ids: {"filter": {"category": cat.name}},
+    "PUT /api/expenses/categories/{category_id}": lambda cat, ids: {"name": f"{cat.name} renamed"},
+    "POST /api/expenses/categories/{category_id}/merge": lambda cat, ids: {"into": "Food"},
+    "DELETE /api/expenses/categories/{category_id}": lambda cat, ids: None,
+}
+
+
+def _category_with_rows(world, n: int):
+    """A custom category of Alice's with ``n`` personal and ``n`` shared expenses and a budget."""
+    db = world.db
+    world._serial += 1
+    cat = UserCategory(user_id=world.alice.id, name=f"Batch {world._serial}")
+    db.add_all([cat, Budget(user_id=world.alice.id, category=cat.name, monthly_limit=1_000_000)])
+    for i in range(n):
+        # Always one row this month and one in a closed month
+        on_date = (world.today, world.today - timedelta(days=62))[i] if i < 2 else world._date()
+        db.add_all([
+            Expense(user_id=world.alice.id, amount=world._amount(), category=cat.name, date=on_date),
+            SharedExpense(
+                couple_id=world.couple.id, paid_by_user_id=world.alice.id, amount=world._amount(),
+                category=cat.name, split_type="equal", split_ratio="50:50", date=on_date,
+            ),
+        ])
+    db.flush()
+    # Steady state: this month's spend rollups exist (seeding them is a one-off cost)
+    for user in (world.alice, world.bob):
+        for category in (cat.name, "Food", "Other"):
+            add_month_spend(db, user.id, category, world.today, 0.0)
+        invalidate_budget_limits(user.id)  # as the budgets API does
+    db.commit()
+    ids = [expense_id for (expense_id,) in db.query(Expense.id).filter(Expense.category == cat.name)]
+    return cat, ids
+
+
+def _measure_write(client, world, write: str, n: int) -> int:
+    method, path = write.split(" ")
+    cat, ids = _category_with_rows(world, n)
+    response = client.request(
+        method, path.format(category_id=cat.id), json=_WRITE_BODIES[write](cat, ids), headers=world.headers
+    )
+    assert response.status_code in (200, 201, 204), response.text
+    return query_count(response)
+
+
+@pytest.mark.parametrize("write", sorted(WRITE_QUERY_BUDGETS))
+def test_write_statement_count_does_not_grow_with_rows(client, world, write):
+    world.grow(2)
+    for category in ("Food", "Other"):  # merge targets
+        world.db.add(Budget(user_id=world.alice.id, category=category, monthly_limit=1_000_000))
+    small = _measure_write(client, world, write, 2)
+    large = _measure_write(client, world, write, 22)
+
+    assert large == small, f"{write}: {small} statements for 2 rows, {large} for 22 (N+1?)"
+    assert large <= WRITE_QUERY_BUDGETS[write], f"{write}: {large} statements, budget is {WRITE_QUERY_BUDGETS[write]}"
@@ -0,0 +1,82 @@
+"""Read-only endpoints on the replica, and the writes they make on the primary."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import SessionLocal, engine, replica_engine
+from app.models.expense import Expense
+from app.models.user import User
+from tests.conftest import auth_headers
+
+
+@pytest.fixture
+def statements():
+    """SQL run on each engine during the test."""
+    assert replica_engine is not engine
+    seen = {"primary": [], "replica": []}
+    listeners = [
+        (engine, lambda conn, cursor, sql, *args: seen["primary"].append(sql)),
+        (replica_engine, lambda conn, cursor, sql, *args: seen["replica"].append(sql)),
+    ]
+    for target, listener in listeners:
+        event.listen(target, "before_cursor_execute", listener)
+    yield seen
+    for target, listener in listeners:
+        event.remove(target, "before_cursor_execute", listener)
+
+
+def test_reads_use_the_replica_and_writes_the_primary(client, alice, statements):
+    headers = auth_headers(alice)
+    created = client.post(
+        "/api/expenses/", json={"amount": 9, "category": "Food", "date": str(date.today())}, headers=headers
+    )
+    assert created.status_code == 201, created.text
+    assert any(sql.startswith("INSERT INTO expenses") for sql in statements["primary"])
+    assert not statements["replica"]
+
+    statements["primary"].clear()
+    listed = client.get("/api/expenses/", headers=headers)
+    assert listed.status_code == 200, listed.text
+    assert [e["amount"] for e in listed.json()] == [9]
+    assert any("FROM expenses" in sql for sql in statements["replica"])
+    # Only the user is loaded from the primary, so data_version is current
+    assert [sql for sql in statements["primary"] if "FROM expenses" in sql] == []
+    assert not any("FROM users" in sql for sql in statements["replica"])
+
+
+def test_pending_changes_pin_a_read_session_to_the_primary(alice, statements):
+    db = SessionLocal(info={"replica": True})
+    try:
+        db.query(Expense).all()
+        assert statements["replica"] and not statements["primary"]
+
+        db.get(User, alice.id).name = "Alicia"
+        db.query(Expense).all()  # would miss the pending change on the replica
+        db.flush()
+        db.rollback()
+        replica_reads = len(statements["replica"])
+        db.query(Expense).all()
+    finally:
+        db.close()
+
+    assert any(sql.startswith("UPDATE users") for sql in statements["primary"])
+    assert not any(sql.startswith("UPDATE") for sql in statements["replica"])
+    assert len(statements["replica"]) == replica_reads  # pinned after the rollback too
+    assert sum("FROM expenses" in sql for sql in statements["primary"]) == 2
+
+
+def test_dashboard_only_reads(client, db, alice, statements):
+    alice.monthly_budget = 1000
+    db.add(Expense(user_id=alice.id, amount=900, category="Food", date=date.today()))
+    db.commit()
+    statements["primary"].clear()
+
+    response = client.get("/api/dashboard/individual", headers=auth_headers(alice))
+
+    assert response.status_code == 200, response.text
+    # Nudges are sent by app.jobs.send_nudges, not when the dashboard is viewed
+    assert all(sql.lstrip().startswith("SELECT") for sql in statements["primary"] + statements["replica"])
+    assert not any("FROM notifications" in sql for sql in statements["primary"])
+    assert any("FROM expenses" in sql for sql in statements["replica"])
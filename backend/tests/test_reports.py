@@ -0,0 +1,109 @@
+"""Reports: grouped monthly totals, month-close snapshots and long-range history."""
+
+from datetime import date, datetime, timedelta
+
+from app.models.budget import Budget
+from app.models.couple import SharedExpense
+from app.models.expense import Expense
+from app.models.report import MonthlySnapshotCategory
+from app.services.snapshots import close_month, month_key
+from tests.conftest import auth_headers
+
+
+def _months_ago(n: int, day: int = 10) -> date:
+    index = date.today().year * 12 + date.today().month - 1 - n
+    return date(index // 12, index % 12 + 1, day)
+
+
+def _month(report: dict, on: date) -> dict:
+    breakdown = {m["month"]: m for m in report["monthly_breakdown"]}[month_key(on.year, on.month)]
+    return {c["category"]: c["total"] for c in breakdown["categories"]}
+
+
+def _report(client, user, months: int = 3) -> dict:
+    response = client.get("/api/reports", params={"months": months}, headers=auth_headers(user))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_report_includes_partner_share_and_budget_variance(client, db, alice, bob, couple):
+    today = date.today()
+    db.add_all([
+        Expense(user_id=alice.id, amount=100, category="Food", date=today),
+        SharedExpense(
+            couple_id=couple.id, paid_by_user_id=bob.id, amount=300, category="Rent",
+            split_type="percentage", split_ratio="60:40", date=today,
+        ),
+        Budget(user_id=alice.id, category="Food", monthly_limit=400),
+    ])
+    db.commit()
+
+    report = _report(client, alice, months=1)
+    assert _month(report, today) == {"Food": 100, "Rent": 180}
+    assert report["monthly_breakdown"][0]["total"] == 280
+    [variance] = report["budget_variance"]
+    assert (variance["actual"], variance["variance"], variance["percent_used"]) == (100, 300, 25)
+
+
+def test_closed_months_are_served_from_snapshots(client, db, alice):
+    closed = _months_ago(2)
+    alice.created_at = datetime(2020, 1, 1)
+    db.add(Expense(user_id=alice.id, amount=50, category="Food", date=closed))
+    db.commit()
+    assert close_month(db, closed.year, closed.month) == 1
+    db.commit()
+
+    # Served from the snapshot, not re-summed
+    db.query(MonthlySnapshotCategory).filter(MonthlySnapshotCategory.user_id == alice.id).update(
+        {"personal": 70}, synchronize_session=False
+    )
+    db.commit()
+    assert _month(_report(client, alice), closed) == {"Food": 70}
+
+    # A back-dated write drops the snapshot, and the month is summed live again
+    response = client.post(
+        "/api/expenses/", json={"amount": 5, "category": "Food", "date": str(closed)}, headers=auth_headers(alice)
+    )
+    assert response.status_code == 201, response.text
+    assert _month(_report(client, alice), closed) == {"Food": 55}
+
+
+def test_history_folds_minor_categories_into_other(client, db, alice):
+    today = date.today()
+    db.add_all([
+        Expense(user_id=alice.id, amount=amount, category=category, date=today)
+        for category, amount in (("Rent", 900), ("Food", 60), ("Travel", 40))
+    ])
+    db.commit()
+
+    response = client.get(
+        "/api/reports/history", params={"years": 1, "granularity": "quarter", "top": 1}, headers=auth_headers(alice)
+    )
+    assert response.status_code == 200, response.text
+    history = response.json()
+    assert history["categories"] == ["Rent", "Other"]
+    current = history["points"][-1]
+    assert current["period"] == f"{today.year}-Q{(today.month + 2) // 3}"
+    assert current["total"] == 1000
+    assert {c["category"]: c["total"] for c in current["categories"]} == {"Rent": 900, "Other": 100}
+
+    bad = client.get("/api/reports/history", params={"granularity": "fortnight"}, headers=auth_headers(alice))
+    assert bad.status_code == 422
+
+
+def test_weekly_history_covers_the_last_52_weeks_at_most(client, db, alice):
+    today = date.today()
+    db.add_all([
+        Expense(user_id=alice.id, amount=10, category="Food", date=today),
+        Expense(user_id=alice.id, amount=99, category="Food", date=today - timedelta(weeks=60)),
+    ])
+    db.commit()
+
+    response = client.get(
+        "/api/reports/history", params={"years": 10, "granularity": "week"}, headers=auth_headers(alice)
+    )
+    assert response.status_code == 200, response.text
+    points = response.json()["points"]
+    assert len(points) == 52
+    assert date.fromisoformat(points[-1]["start"]) == today - timedelta(days=today.weekday())
+    assert sum(point["total"] for point in points) == 10
@@ -0,0 +1,53 @@
+"""Stored split shares and exact money amounts."""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import func
+
+from app.models.couple import SharedExpense
+from app.models.expense import Expense
+from app.models.types import to_money
+from app.services.splits import split_shares
+
+
+def test_shares_add_up_to_the_amount():
+    assert split_shares(100.01, "equal", "50:50") == (Decimal("50.01"), Decimal("50.00"))
+    assert split_shares(99.99, "percentage", "70:30") == (Decimal("69.99"), Decimal("30.00"))
+    assert split_shares(500, "custom", "120.5:379.5") == (Decimal("120.50"), Decimal("379.50"))
+    assert split_shares(80, "percentage", "bad") == (Decimal("40.00"), Decimal("40.00"))
+
+
+def test_to_money_rounds_half_up():
+    assert to_money(0.125) == Decimal("0.13")
+    assert to_money(2.675) == Decimal("2.68")  # 2.67499... as a binary float
+    assert to_money("-1.005") == Decimal("-1.01")
+
+
+def test_shares_are_stored_and_restored_on_update(db, alice, couple):
+    shared = SharedExpense(
+        couple_id=couple.id, paid_by_user_id=alice.id, amount=250, category="Food",
+        split_type="percentage", split_ratio="60:40", date=date.today(),
+    )
+    db.add(shared)
+    db.commit()
+    assert (shared.user_1_share, shared.user_2_share) == (150.0, 100.0)
+
+    shared.split_ratio = "20:80"
+    db.commit()
+    db.expire_all()
+    assert (shared.user_1_share, shared.user_2_share) == (50.0, 200.0)
+
+
+def test_amounts_are_stored_in_whole_paise(db, alice):
+    db.add_all([
+        Expense(user_id=alice.id, amount=0.1, category="Food", date=date.today()),
+        Expense(user_id=alice.id, amount=0.2, category="Food", date=date.today()),
+        Expense(user_id=alice.id, amount=10.005, category="Food", date=date.today()),
+    ])
+    db.commit()
+
+    amounts = sorted(amount for (amount,) in db.query(Expense.amount))
+    assert amounts == [0.1, 0.2, 10.01]
+    total = db.query(func.sum(Expense.amount)).scalar()
+    assert to_money(total) == Decimal("10.31")
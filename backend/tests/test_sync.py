@@ -0,0 +1,84 @@
+"""Delta sync: change tokens, set-based writes and tombstones."""
+
+from datetime import date
+
+import pytest
+
+from app.core.database import SessionLocal, engine
+from app.models.couple import SharedExpense
+from app.models.expense import Expense
+from tests.conftest import auth_headers
+
+
+def _sync(client, user, token=None):
+    response = client.get("/api/sync", params={"since": token} if token else {}, headers=auth_headers(user))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_changes_and_deletes_since_token(client, db, alice):
+    token = _sync(client, alice)["token"]
+    expense = Expense(user_id=alice.id, amount=120, category="Food", date=date.today())
+    db.add(expense)
+    db.commit()
+
+    changes = _sync(client, alice, token)
+    assert changes["full"] is False
+    assert [e["id"] for e in changes["expenses"]] == [expense.id]
+    assert _sync(client, alice, changes["token"])["expenses"] == []
+
+    client.delete(f"/api/expenses/{expense.id}", headers=auth_headers(alice))
+    changes = _sync(client, alice, changes["token"])
+    assert changes["deleted"] == [{"entity": "expense", "id": expense.id}]
+
+
+def test_bulk_writes_are_synced(client, db, alice):
+    expense = Expense(user_id=alice.id, amount=80, category="Food", date=date.today())
+    db.add(expense)
+    db.commit()
+    token = _sync(client, alice)["token"]
+
+    client.post("/api/expenses/bulk-update", json={"ids": [expense.id], "changes": {"description": "Lunch"}},
+                headers=auth_headers(alice))
+    changes = _sync(client, alice, token)
+    assert [e["description"] for e in changes["expenses"]] == ["Lunch"]
+
+    client.post("/api/expenses/bulk-delete", json={"ids": [expense.id]}, headers=auth_headers(alice))
+    changes = _sync(client, alice, changes["token"])
+    assert changes["deleted"] == [{"entity": "expense", "id": expense.id}]
+
+
+def test_shared_rows_resent_for_a_new_couple(client, db, alice, bob, couple):
+    db.add(SharedExpense(
+        couple_id=couple.id, paid_by_user_id=bob.id, amount=300, category="Rent",
+        split_type="equal", split_ratio="50:50", date=date.today(),
+    ))
+    db.commit()
+    token = _sync(client, alice)["token"]
+    assert _sync(client, alice, token)["shared_expenses"] == []
+
+    user_seq, _, couple_seq = token.split(".")
+    other_couple = f"{user_seq}.{couple.id + 1}.{couple_seq}"
+    assert len(_sync(client, alice, other_couple)["shared_expenses"]) == 1
+
+
+def test_malformed_tokens_are_rejected(client, alice):
+    for token in ("yesterday", "1700000000000000", "1.2.-3"):
+        response = client.get("/api/sync", params={"since": token}, headers=auth_headers(alice))
+        assert response.status_code == 400, token
+
+
+@pytest.mark.skipif(engine.dialect.name != "postgresql", reason="SQLite serializes writers")
+def test_write_committing_after_sync_is_not_missed(client, alice):
+    token = _sync(client, alice)["token"]
+    writer = SessionLocal()
+    try:
+        writer.add(Expense(user_id=alice.id, amount=5, category="Food", date=date.today()))
+        writer.flush()
+        during = _sync(client, alice, token)
+        writer.commit()
+    finally:
+        writer.close()
+
+    assert during["expenses"] == []
+    assert [e["amount"] for e in _sync(client, alice, during["token"])["expenses"]] == [5]
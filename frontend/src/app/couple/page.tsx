@@ -177,6 +177,13 @@ export default function CouplePage() {
 
   useEffect(() => { loadData(); api.getCategories().then(setCategories).catch(() => {}); }, []); // eslint-disable-line react-hooks/exhaustive-deps
 
+  // Refresh when the partner changes shared expenses, settlements or the joint account
+  useEffect(() => {
+    const reload = () => loadData();
+    window.addEventListener('splitmint:balance', reload);
+    return () => window.removeEventListener('splitmint:balance', reload);
+  }, []); // eslint-disable-line react-hooks/exhaustive-deps
+
   // Close sort/category dropdowns on outside click
   useEffect(() => {
     const handleClick = (e: MouseEvent) => {
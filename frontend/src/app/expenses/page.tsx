@@ -109,7 +109,7 @@ export default function ExpensesPage() {
   };
 
   const handleDeleteCategory = async (id: number, name: string) => {
-    if (!confirm(`Delete custom category "${name}"? Existing expenses with this category will keep their label.`)) return;
+    if (!confirm(`Delete custom category "${name}"? Its expenses and budget will move to "Other".`)) return;
     try {
       await api.deleteCategory(id);
       toast.success('Category deleted');
@@ -47,10 +47,22 @@ export default function AppLayout({ children }: { children: React.ReactNode }) {
   }, [user, loading, router]);
 
   useEffect(() => {
-    if (user) {
+    if (!user) return;
+    const refreshUnread = () => {
       api.getUnreadCount().then((r) => setUnreadCount(r.unread_count)).catch(() => {});
-    }
-  }, [user, pathname]);
+    };
+    refreshUnread();
+    // Push updates replace polling; re-broadcast them so pages can refresh their own data
+    const source = api.subscribeEvents();
+    if (!source) return;
+    source.addEventListener('notification', refreshUnread);
+    ['balance', 'shared_expense'].forEach((type) => {
+      source.addEventListener(type, (e) => {
+        window.dispatchEvent(new CustomEvent(`splitmint:${type}`, { detail: (e as MessageEvent).data }));
+      });
+    });
+    return () => source.close();
+  }, [user]);
 
   if (loading || !user) {
     return (
@@ -72,8 +72,13 @@ class ApiClient {
     });
   }
 
+  /** Deactivates the account at once; data is deleted in the background. */
   async deleteAccount() {
-    return this.request<null>('/auth/me', { method: 'DELETE' });
+    return this.request<import('@/types').AccountDeletion>('/auth/me', { method: 'DELETE' });
+  }
+
+  async getAccountDeletion(jobId: string) {
+    return this.request<import('@/types').AccountDeletion>(`/auth/deletions/${jobId}`);
   }
 
   // ─── Expenses ────────────────────────────────────────────────────────────
@@ -93,6 +98,20 @@ class ApiClient {
     return this.request<null>(`/expenses/categories/${id}`, { method: 'DELETE' });
   }
 
+  async updateCategory(id: number, data: import('@/types').CategoryUpdate) {
+    return this.request<import('@/types').CategoryMoveResult>(`/expenses/categories/${id}`, {
+      method: 'PUT',
+      body: JSON.stringify(data),
+    });
+  }
+
+  async mergeCategory(id: number, into: string) {
+    return this.request<import('@/types').CategoryMoveResult>(`/expenses/categories/${id}/merge`, {
+      method: 'POST',
+      body: JSON.stringify({ into }),
+    });
+  }
+
   async createExpense(data: import('@/types').ExpenseCreate) {
     return this.request<import('@/types').Expense>('/expenses/', {
       method: 'POST',
@@ -123,6 +142,40 @@ class ApiClient {
     return this.request<import('@/types').Expense[]>(`/expenses/${query ? `?${query}` : ''}`);
   }
 
+  async getExpensesWithTotals(params?: Parameters<ApiClient['getExpenses']>[0]) {
+    const searchParams = new URLSearchParams({ with_totals: 'true' });
+    if (params) {
+      Object.entries(params).forEach(([key, value]) => {
+        if (value !== undefined && value !== null && value !== '') {
+          searchParams.append(key, String(value));
+        }
+      });
+    }
+    return this.request<import('@/types').ExpenseListWithTotals>(`/expenses/?${searchParams.toString()}`);
+  }
+
+  async getTimeline(params?: {
+    category?: string;
+    start_date?: string;
+    end_date?: string;
+    search?: string;
+    min_amount?: number;
+    max_amount?: number;
+    cursor?: string;
+    limit?: number;
+  }) {
+    const searchParams = new URLSearchParams();
+    if (params) {
+      Object.entries(params).forEach(([key, value]) => {
+        if (value !== undefined && value !== null && value !== '') {
+          searchParams.append(key, String(value));
+        }
+      });
+    }
+    const query = searchParams.toString();
+    return this.request<import('@/types').TimelinePage>(`/timeline${query ? `?${query}` : ''}`);
+  }
+
   async updateExpense(id: number, data: import('@/types').ExpenseUpdate) {
     return this.request<import('@/types').Expense>(`/expenses/${id}`, {
       method: 'PUT',
@@ -134,6 +187,20 @@ class ApiClient {
     return this.request<null>(`/expenses/${id}`, { method: 'DELETE' });
   }
 
+  async bulkUpdateExpenses(data: import('@/types').ExpenseBulkUpdate) {
+    return this.request<import('@/types').BulkResult>('/expenses/bulk-update', {
+      method: 'POST',
+      body: JSON.stringify(data),
+    });
+  }
+
+  async bulkDeleteExpenses(data: import('@/types').ExpenseBulkSelection) {
+    return this.request<import('@/types').BulkResult>('/expenses/bulk-delete', {
+      method: 'POST',
+      body: JSON.stringify(data),
+    });
+  }
+
   async exportExpenses(params?: { start_date?: string; end_date?: string }) {
     const token = this.getToken();
     if (!token) throw new Error('Not authenticated');
@@ -233,6 +300,16 @@ class ApiClient {
     return this.request<import('@/types').SharedExpense[]>(`/couple/expenses${query ? `?${query}` : ''}`);
   }
 
+  async getSharedExpensesWithTotals(params?: Record<string, string | number | undefined>) {
+    const searchParams = new URLSearchParams({ with_totals: 'true' });
+    if (params) {
+      Object.entries(params).forEach(([key, value]) => {
+        if (value !== undefined && value !== '') searchParams.append(key, String(value));
+      });
+    }
+    return this.request<import('@/types').SharedExpenseListWithTotals>(`/couple/expenses?${searchParams.toString()}`);
+  }
+
   async exportSharedExpenses(params?: { start_date?: string; end_date?: string }) {
     const token = this.getToken();
     if (!token) throw new Error('Not authenticated');
@@ -430,6 +507,12 @@ class ApiClient {
     return this.request<import('@/types').ReportsData>(`/reports?months=${months}`);
   }
 
+  async getReportHistory(years: number = 5, granularity: import('@/types').ReportGranularity = 'month', top: number = 5) {
+    return this.request<import('@/types').ReportHistory>(
+      `/reports/history?years=${years}&granularity=${granularity}&top=${top}`
+    );
+  }
+
   // ─── Salary ──────────────────────────────────────────────────────────────
 
   async checkSalary() {
@@ -446,6 +529,21 @@ class ApiClient {
   async getCurrentSalary() {
     return this.request<import('@/types').SalaryCreditResponse | null>('/salary/current');
   }
+
+  // ─── Sync ────────────────────────────────────────────────────────────────
+
+  async sync(since?: string) {
+    const query = since ? `?since=${encodeURIComponent(since)}` : '';
+    return this.request<import('@/types').SyncResponse>(`/sync${query}`);
+  }
+
+  // ─── Live Events ─────────────────────────────────────────────────────────
+
+  subscribeEvents(): EventSource | null {
+    const token = this.getToken();
+    if (!token || typeof EventSource === 'undefined') return null;
+    return new EventSource(`${this.baseUrl}/events/stream?token=${encodeURIComponent(token)}`);
+  }
 }
 
 export const api = new ApiClient();
@@ -31,6 +31,14 @@ export interface Token {
   token_type: string;
 }
 
+export interface AccountDeletion {
+  id: string;
+  status: 'pending' | 'running' | 'done' | 'failed';
+  rows_deleted: number;
+  created_at: string;
+  finished_at: string | null;
+}
+
 // ─── Expense ─────────────────────────────────────────────────────────────────
 
 export interface Expense {
@@ -62,6 +70,52 @@ export interface ExpenseUpdate {
   description?: string;
 }
 
+export interface CategoryTotal {
+  category: string;
+  count: number;
+  total: number;
+}
+
+export interface ExpenseTotals {
+  count: number;
+  total: number;
+  categories: CategoryTotal[];
+}
+
+export interface ExpenseListWithTotals {
+  items: Expense[];
+  totals: ExpenseTotals;
+}
+
+export interface ExpenseFilter {
+  category?: string;
+  expense_type?: string;
+  start_date?: string;
+  end_date?: string;
+  search?: string;
+  min_amount?: number;
+  max_amount?: number;
+}
+
+/** Exactly one of ids / filter selects the expenses. */
+export interface ExpenseBulkSelection {
+  ids?: number[];
+  filter?: ExpenseFilter;
+}
+
+export interface ExpenseBulkUpdate extends ExpenseBulkSelection {
+  changes: {
+    category?: string;
+    expense_type?: string;
+    date?: string;
+    description?: string;
+  };
+}
+
+export interface BulkResult {
+  affected: number;
+}
+
 // ─── Category ────────────────────────────────────────────────────────────────
 
 export interface Category {
@@ -78,6 +132,20 @@ export interface CategoryCreate {
   color: string;
 }
 
+export interface CategoryUpdate {
+  name?: string;
+  icon?: string;
+  color?: string;
+}
+
+export interface CategoryMoveResult {
+  category: Category;
+  expenses: number;
+  shared_expenses: number;
+  recurring_expenses: number;
+  budgets: number;
+}
+
 // ─── Recurring Expense ───────────────────────────────────────────────────────
 
 export interface RecurringExpense {
@@ -146,6 +214,29 @@ export interface SharedExpense {
   created_at: string;
 }
 
+export interface SharedExpenseListWithTotals {
+  items: SharedExpense[];
+  totals: ExpenseTotals;
+}
+
+export interface TimelineItem {
+  kind: 'personal' | 'shared';
+  id: number;
+  date: string;
+  category: string;
+  description: string | null;
+  amount: number;
+  user_share: number;
+  paid_by_user_id: number;
+  paid_from_joint: boolean;
+  created_at: string;
+}
+
+export interface TimelinePage {
+  items: TimelineItem[];
+  next_cursor: string | null;
+}
+
 export interface SharedExpenseCreate {
   amount: number;
   category: string;
@@ -421,6 +512,21 @@ export interface ReportsData {
   budget_variance: BudgetVarianceItem[];
 }
 
+export type ReportGranularity = 'week' | 'month' | 'quarter' | 'year';
+
+export interface HistoryPoint {
+  period: string;
+  start: string;
+  total: number;
+  categories: ReportCategoryAmount[];
+}
+
+export interface ReportHistory {
+  granularity: ReportGranularity;
+  categories: string[];
+  points: HistoryPoint[];
+}
+
 // ─── Salary ──────────────────────────────────────────────────────────────────
 
 export interface SalaryCheckResponse {
@@ -444,3 +550,23 @@ export interface SalaryCreditResponse {
   year: number;
   created_at: string;
 }
+
+// ─── Sync ────────────────────────────────────────────────────────────────────
+
+export interface SyncDeletion {
+  entity: 'expense' | 'shared_expense' | 'settlement' | 'budget' | 'category' | 'recurring_expense';
+  id: number;
+}
+
+export interface SyncResponse {
+  token: string;
+  full: boolean;
+  expenses: Expense[];
+  recurring_expenses: RecurringExpense[];
+  categories: Category[];
+  budgets: Budget[];
+  shared_expenses: SharedExpense[];
+  settlements: Settlement[];
+  deleted: SyncDeletion[];
+  couple_id: number | null;
+}